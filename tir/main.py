@@ -2,6 +2,7 @@ from tir.technologies.webapp_internal import WebappInternal
 from tir.technologies.apw_internal import ApwInternal
 from tir.technologies.core.config import ConfigLoader
 from tir.technologies.core.base_database import BaseDatabase
+from tir.technologies.core.test_context import tracked
 """
 This file must contain the definition of all User Classes.
 
@@ -45,6 +46,7 @@ class Webapp():
         """
         self.__webapp.AddParameter(parameter, branch, portuguese_value, english_value, spanish_value)
 
+    @tracked
     def AssertFalse(self, expected=False, scritp_message=''):
         """
         Defines that the test case expects a False response to pass
@@ -116,6 +118,7 @@ class Webapp():
         """
         self.__webapp.ChangeUser(user, password, initial_program, date, group, branch)
 
+    @tracked
     def CheckResult(self, field, user_value, grid=False, line=1, grid_number=1, name_attr=False, input_field=True, direction=None):
         """
         Checks if a field has the value the user expects.
@@ -326,13 +329,16 @@ class Webapp():
         """
         return self.__webapp.GetValue(field, grid, line, grid_number)
 
-    def LoadGrid(self):
+    def LoadGrid(self, batch=False):
         """
         This method is responsible for running all actions of the input and check queues
         of a grid. After running, the queues would be empty.
 
         Must be called after SetValue and CheckResult calls that has the grid parameter set to True.
 
+        :param batch: Fills the consecutive text cells of the same row together, checking them once at the end. - **Default:** False
+        :type batch: bool
+
         Usage:
 
         >>> # After SetValue:
@@ -342,8 +348,13 @@ class Webapp():
         >>> # After CheckResult:
         >>> oHelper.CheckResult("A1_COD", "000001", grid=True, line=1)
         >>> oHelper.LoadGrid()
+        >>> #--------------------------------------
+        >>> # Filling the cells of each row together:
+        >>> oHelper.SetValue("C6_PRODUTO", "000001", grid=True)
+        >>> oHelper.SetValue("C6_QTDVEN", "10", grid=True)
+        >>> oHelper.LoadGrid(batch=True)
         """
-        self.__webapp.LoadGrid()
+        self.__webapp.LoadGrid(batch)
 
     def LogOff(self):
         """
@@ -547,6 +558,23 @@ class Webapp():
         """
         self.__webapp.SearchBrowse(term, key, identifier, index, column)
 
+    def RoundTripBudget(self, budget=None):
+        """
+        Counts the browser round trips of the methods called inside a with block and fails the test
+        if they exceed the budget. Useful to benchmark and to keep the user methods fast.
+
+        :param budget: The maximum amount of round trips. - **Default:** None (only counts)
+        :type budget: int
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> with oHelper.RoundTripBudget(30) as round_trips:
+        >>>     oHelper.SetValue("A1_COD", "000001")
+        >>> print(round_trips.used)
+        """
+        return self.__webapp.round_trip_budget(budget)
+
     def SetBranch(self, branch):
         """
         Chooses the branch on the branch selection screen.
@@ -831,6 +859,7 @@ class Webapp():
         """
         self.__webapp.Start()
 
+    @tracked
     def TearDown(self):
         """
         Closes the webdriver and ends the test case.
@@ -1261,6 +1290,61 @@ class Webapp():
         
         return self.__webapp.get_grid_content(grid_number, grid_element)
 
+    def GetGridData(self, grid_number=1, grid_element=None, fields=None, records=False):
+        """
+        Gets the headers and all rendered rows of a grid as a pandas DataFrame or a list of dicts.
+
+        If *fields* is informed, the columns whose header is the SX3 title of one of the fields
+        are cast by the SX3 type (N to float, D to date).
+
+        :param grid_number: The number of the grid on the screen. - **Default:** 1
+        :type grid_number: int
+        :param grid_element: Grid class name in HTML ex: ".tgrid". - **Default:** None
+        :type grid_element: str
+        :param fields: SX3 fields of the columns that must be cast. - **Default:** None
+        :type fields: List of str
+        :param records: Returns a list of dicts (header: value) instead of a DataFrame. - **Default:** False
+        :type records: bool
+
+        :return: The grid data.
+        :rtype: pandas.DataFrame or List of Dict
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> data = oHelper.GetGridData(1, fields=["C6_PRODUTO", "C6_QTDVEN"])
+        >>> # Getting a list of dicts:
+        >>> rows = oHelper.GetGridData(1, records=True)
+        """
+
+        return self.__webapp.get_grid_data(grid_number, grid_element, fields, records)
+
+    def IterGrid(self, grid_number=1, columns=None, grid_element=None, window=1000):
+        """
+        Reads every row of a grid, scrolling it page by page. The rows are returned as dicts (header: value)
+        by a generator, one page at a time, so large browses can be validated without loading all of them.
+
+        :param grid_number: The number of the grid on the screen. - **Default:** 1
+        :type grid_number: int
+        :param columns: Headers (or SX3 fields) of the columns to be returned. - **Default:** None (all columns)
+        :type columns: List of str
+        :param grid_element: Grid class name in HTML ex: ".tgrid". - **Default:** None
+        :type grid_element: str
+        :param window: Amount of rows remembered to skip the repeated ones. - **Default:** 1000
+        :type window: int
+
+        :return: Generator of the rows.
+        :rtype: Generator of Dict
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> for row in oHelper.IterGrid(1, columns=["Filial", "A1_COD"]):
+        >>>     self.assertTrue(row["Filial"])
+        """
+
+        return self.__webapp.iter_grid(grid_number, columns, grid_element, window)
+
     def LengthGridLines(self, grid):
         """
         Returns the length of the grid.
@@ -2,8 +2,6 @@ import time
 import selenium
 import re
 import inspect
-import requests
-from bs4 import BeautifulSoup
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import TimeoutException
@@ -18,6 +16,7 @@ from selenium.webdriver.common.keys  import  Keys
 # Importations from base class
 from tir.technologies.core.base import Base
 from tir.technologies.core.config import ConfigLoader
+from tir.technologies.core.http_client import http_client
 from tir.technologies.core import enumerations as enum
 from tir.technologies.core.third_party.xpath_soup import xpath_soup
 
@@ -63,7 +62,7 @@ class ApwInternal(Base):
             for a in menu:
                 if a.tag_name == 'a' and a.text.startswith(Link):
                     linkcheck = self.driver.find_element_by_partial_link_text('%s' % Link).get_attribute('href')
-                    r = requests.get(linkcheck)
+                    r = http_client(self.config).get(linkcheck)
                     if r.status_code != 200:
                         self.log_error(str("O arquivo não foi gerado para download"))
 
@@ -151,7 +150,7 @@ class ApwInternal(Base):
                         element = self.driver.find_element_by_xpath("//*[@value='%s']" % button)
                     except:
                         content = self.driver.page_source
-                        soup = BeautifulSoup(content, "html.parser")
+                        soup = self.parse_html(content)
                         lista = soup.find_all('button')
                         for line in lista:
                             if line.text.strip().replace(" ", "").startswith(button.replace(" ", "")):
@@ -162,7 +161,7 @@ class ApwInternal(Base):
 
                 self.wait_elements_load(button, 'label')
                 content = self.driver.page_source
-                soup = BeautifulSoup(content, "html.parser")
+                soup = self.parse_html(content)
                 lista = soup.find_all('div')
                 for line in lista:
                     if line.text.strip().replace(" ", "").startswith(button.strip().replace(" ", "")):
@@ -234,7 +233,7 @@ class ApwInternal(Base):
 
         else:
             content = self.driver.page_source
-            soup = BeautifulSoup(content, "html.parser")
+            soup = self.parse_html(content)
             lista2 = soup.find_all("tr")
 
             for linha2 in lista2:
@@ -315,7 +314,7 @@ class ApwInternal(Base):
             self.wait_elements_load("buscar", 'button')
 
             content = self.driver.page_source
-            soup = BeautifulSoup(content, "html.parser")
+            soup = self.parse_html(content)
             listselect = soup.find_all('select')
             listfield = soup.find_all('input')
             btnsearch = soup.find_all('button')
@@ -430,10 +429,10 @@ class ApwInternal(Base):
                 element_first_children = next((x for x in element_div.contents if x.name in ["input", "select", "textarea"]), None)
                 main_element = element_first_children
             try:
-                input_field = lambda: self.driver.find_element_by_xpath(xpath_soup(main_element))
+                input_field = lambda: self.driver.find_element(*self.soup_locator(main_element))
             except:
                 time.sleep(1)
-                input_field = lambda: self.driver.find_element_by_xpath(xpath_soup(main_element))
+                input_field = lambda: self.driver.find_element(*self.soup_locator(main_element))
 
             valtype = "C"
 
@@ -522,7 +521,7 @@ class ApwInternal(Base):
 		Waits until a element to be present
 		'''
         content = self.driver.page_source
-        soup = BeautifulSoup(content, "html.parser")
+        soup = self.parse_html(content)
         lAchouTodos = False
 
         if type == 'button':
@@ -606,7 +605,7 @@ class ApwInternal(Base):
             self.driver.switch_to.default_content()
 
             content = self.driver.page_source
-            soup = BeautifulSoup(content, "html.parser")
+            soup = self.parse_html(content)
             lista = soup.find_all('iframe')
 
             for frame2 in lista:
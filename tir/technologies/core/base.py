@@ -1,15 +1,17 @@
 import re
 import time
 import unittest
-import inspect
 import socket
 import sys
 import os
 import random
 import string
+from contextlib import contextmanager
+from types import SimpleNamespace
 from selenium import webdriver
 from selenium.webdriver.common.keys import Keys
 from bs4 import BeautifulSoup
+from bs4 import FeatureNotFound
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
@@ -19,6 +21,8 @@ from tir.technologies.core.log import Log
 from tir.technologies.core.config import ConfigLoader
 from tir.technologies.core.language import LanguagePack
 from tir.technologies.core.third_party.xpath_soup import xpath_soup
+from tir.technologies.core import browser_scripts
+from tir.technologies.core import test_context
 from selenium.webdriver.firefox.options import Options as FirefoxOpt
 from selenium.webdriver.chrome.options import Options as ChromeOpt
 from selenium.common.exceptions import StaleElementReferenceException
@@ -56,6 +60,8 @@ class Base(unittest.TestCase):
 
         base_container: A variable to contain the layer element to be used on all methods.
 
+        current_dom: The last DOM snapshot parsed by get_current_DOM, reused while the page doesn't change.
+
         errors: A list that contains every error that should be sent to log at the end of the execution.
 
         language: Contains the terms defined in the language defined in config or found in the page.
@@ -70,6 +76,8 @@ class Base(unittest.TestCase):
         """
         #Global Variables:
 
+        test_context.install()
+
         self.config_path = config_path
 
         if self.config_path == "":
@@ -96,6 +104,12 @@ class Base(unittest.TestCase):
         self.errors = []
         self.config.log_file = False
         self.tmenu_out_iframe = False
+        self.current_dom = None
+        self.current_dom_generation = None
+        self.current_dom_in_frame = False
+        self.current_dom_out_iframe = False
+        self.container_dom = {}
+        self.round_trips = 0
 
         if autostart:
             self.Start()
@@ -118,7 +132,7 @@ class Base(unittest.TestCase):
         """
         expected_assert = expected
         msg = "Passed"
-        stack_item = next(iter(list(map(lambda x: x.function, filter(lambda x: re.search('test_', x.function), inspect.stack())))), None)
+        stack_item = test_context.testcase('test_')
         test_number = f"{stack_item.split('_')[-1]} -" if stack_item else ""
         log_message = f"{test_number}"
         self.log.set_seconds()
@@ -179,7 +193,8 @@ class Base(unittest.TestCase):
                     element.click()
                 elif click_type == enum.ClickType.ACTIONCHAINS:
                     ActionChains(self.driver).move_to_element(element).click().perform()
-            
+
+            self.clear_dom_cache()
             return True
 
         except StaleElementReferenceException:
@@ -247,6 +262,7 @@ class Base(unittest.TestCase):
                 self.driver.execute_script("arguments[0].click()", element)
                 self.driver.execute_script("arguments[0].click()", element)
 
+            self.clear_dom_cache()
             return True        
 
         except Exception as e:
@@ -258,6 +274,7 @@ class Base(unittest.TestCase):
                 actions.double_click()
                 actions.perform()
 
+                self.clear_dom_cache()
                 return True
             except Exception as x:
                 logger().exception(f"Error double_click method Exception: {str(x)}")
@@ -291,6 +308,10 @@ class Base(unittest.TestCase):
         if self.config.debug_log:
             logger().info(f"term={term}, scrap_type={scrap_type}, position={position}, optional_term={optional_term}")
 
+        count = self.query_elements(term, scrap_type, optional_term, main_container) if self.config.browser_query else None
+        if count is not None:
+            return count > 0 if position == 0 else count >= position
+
         if scrap_type == enum.ScrapType.SCRIPT:
             return bool(self.driver.execute_script(term))
         elif (scrap_type != enum.ScrapType.MIXED and scrap_type != enum.ScrapType.TEXT):
@@ -311,7 +332,7 @@ class Base(unittest.TestCase):
                     return False
 
                 try:
-                    container_element = self.driver.find_element_by_xpath(xpath_soup(container))
+                    container_element = self.driver.find_element(*self.soup_locator(container))
                 except:
                     return False
             else:
@@ -330,6 +351,147 @@ class Base(unittest.TestCase):
         else:
             return len(element_list) >= position
 
+    def query_elements(self, term, scrap_type=enum.ScrapType.TEXT, optional_term=None, main_container=None, labels=False, elements=False):
+        """
+        [Internal]
+
+        Runs a web_scrap search entirely inside the browser with a single script call.
+
+        The top container is chosen with the same z-index ordering used by zindex_sort and
+        only the count of the elements found (or the Selenium elements) is returned.
+
+        Supports only ScrapType.TEXT, ScrapType.MIXED and ScrapType.CSS_SELECTOR.
+
+        :param term: The first search term. A text or a selector
+        :type term: str
+        :param scrap_type: The type of webscraping. - **Default:** enum.ScrapType.TEXT
+        :type scrap_type: enum.ScrapType.
+        :param optional_term: The second search term. A selector used in MIXED webscraping. - **Default:** None
+        :type optional_term: str
+        :param main_container: The selector of a container element that has all other elements. - **Default:** None
+        :type main_container: str
+        :param labels: If TEXT searches should look for labels starting with the term. - **Default:** False
+        :type labels: bool
+        :param elements: If the Selenium elements should be returned instead of the count. - **Default:** False
+        :type elements: bool
+
+        :return: The count of the elements found, the list of Selenium elements or None if the search couldn't run in the browser.
+        :rtype: int or List of Selenium objects
+
+        Usage:
+
+        >>> #Count of buttons in the top dialog
+        >>> count = self.query_elements(term="button", scrap_type=enum.ScrapType.CSS_SELECTOR, main_container=".tmodaldialog")
+        >>> #----------------#
+        >>> #Elements with class "my_class" and text "my_text"
+        >>> elements = self.query_elements(term="my_text", scrap_type=enum.ScrapType.MIXED, optional_term=".my_class", elements=True)
+        """
+        if scrap_type not in (enum.ScrapType.TEXT, enum.ScrapType.MIXED, enum.ScrapType.CSS_SELECTOR):
+            return None
+
+        container_selector = main_container if main_container is not None else self.base_container
+        arguments = (term, scrap_type.name, optional_term, container_selector, labels, elements)
+
+        try:
+            if self.tmenu_out_iframe:
+                self.driver.switch_to.default_content()
+
+            result = self.driver.execute_script(browser_scripts.QUERY_ELEMENTS, *arguments)
+
+            if result and result.get("session"):
+                self.driver.switch_to.frame(self.driver.find_element_by_css_selector("iframe[class=session]"))
+                result = self.driver.execute_script(browser_scripts.QUERY_ELEMENTS, *arguments)
+        except WebDriverException as e:
+            logger().debug(f"Warning query_elements exception: {str(e)}")
+            return None
+
+        if not result or result.get("session"):
+            return None
+
+        return result["elements"] if elements else result["count"]
+
+    def wait_element_event(self, term, scrap_type=enum.ScrapType.TEXT, presence=True, position=0, optional_term=None, main_container=None, timeout=None, labels=False, between_chunks=None, chunk=2, max_failures=3):
+        """
+        [Internal]
+
+        Waits until the elements of a search reach the expected presence, without polling.
+
+        The search of query_elements is executed inside an asynchronous script that checks it again
+        only when the document mutates. The wait is split in chunks of a few seconds and between_chunks
+        is called before each chunk, e.g. to search for errors on the screen.
+
+        Supports only ScrapType.TEXT, ScrapType.MIXED and ScrapType.CSS_SELECTOR.
+
+        :param term: The first search term. A text or a selector
+        :type term: str
+        :param scrap_type: The type of webscraping. - **Default:** enum.ScrapType.TEXT
+        :type scrap_type: enum.ScrapType.
+        :param presence: If the element should exist or not in the screen. - **Default:** True
+        :type presence: bool
+        :param position: If the element should exist at a specific position. e.g. The fourth button. - **Default:** 0
+        :type position: int
+        :param optional_term: The second search term. A selector used in MIXED webscraping. - **Default:** None
+        :type optional_term: str
+        :param main_container: The selector of a container element that has all other elements. - **Default:** None
+        :type main_container: str
+        :param timeout: The maximum amount of time of wait. - **Default:** None (TimeOut of config)
+        :type timeout: float
+        :param labels: If TEXT searches should look for labels starting with the term. - **Default:** False
+        :type labels: bool
+        :param between_chunks: Function called before each chunk of the wait. - **Default:** None
+        :type between_chunks: function
+        :param chunk: The maximum amount of time of each asynchronous script. - **Default:** 2
+        :type chunk: float
+        :param max_failures: Consecutive script failures (e.g. the script can't be injected in the page) before giving up. - **Default:** 3
+        :type max_failures: int
+
+        :return: True if the expected presence was reached, False if the timeout was met and None if the search type isn't supported or the script failed max_failures times in a row, so the caller falls back to polling.
+        :rtype: bool
+
+        Usage:
+
+        >>> #Waits for the button to be shown
+        >>> success = self.wait_element_event(term="button", scrap_type=enum.ScrapType.CSS_SELECTOR, timeout=10)
+        """
+        if scrap_type not in (enum.ScrapType.TEXT, enum.ScrapType.MIXED, enum.ScrapType.CSS_SELECTOR):
+            return None
+
+        container_selector = main_container if main_container is not None else self.base_container
+        endtime = time.time() + (timeout if timeout is not None else self.config.time_out)
+        failures = 0
+
+        while True:
+            if between_chunks:
+                between_chunks()
+
+            remaining = endtime - time.time()
+            if remaining <= 0:
+                return False
+
+            arguments = (term, scrap_type.name, optional_term, container_selector, labels, presence, position, int(min(remaining, chunk) * 1000))
+
+            try:
+                if self.tmenu_out_iframe:
+                    self.driver.switch_to.default_content()
+
+                result = self.driver.execute_async_script(browser_scripts.WAIT_ELEMENTS, *arguments)
+
+                if result and result.get("session"):
+                    self.driver.switch_to.frame(self.driver.find_element_by_css_selector("iframe[class=session]"))
+                    result = self.driver.execute_async_script(browser_scripts.WAIT_ELEMENTS, *arguments)
+            except WebDriverException as e:
+                logger().debug(f"Warning wait_element_event exception: {str(e)}")
+                failures += 1
+                if failures >= max_failures:
+                    return None
+                time.sleep(0.1)
+                continue
+
+            failures = 0
+
+            if result and result.get("done"):
+                return True
+
     def filter_displayed_elements(self, elements, reverse=False):
         """
         [Internal]
@@ -352,23 +514,72 @@ class Base(unittest.TestCase):
         >>> #Calling the method
         >>> self.filter_displayed_elements(elements, True)
         """
-        #0 - elements filtered
-        elements = list(filter(lambda x: self.soup_to_selenium(x) is not None ,elements ))
-        if not elements:
+        #0 - Get the displayed state of every element with a single call
+        states = self.elements_state(elements)
+        #1 - Return None if no element exists on the screen
+        if not any(states):
             return
-        #1 - Create an enumerated list from the original elements
-        indexed_elements = list(enumerate(elements))
-        #2 - Convert every element from the original list to selenium objects
-        selenium_elements = list(map(lambda x : self.soup_to_selenium(x), elements))
-        #3 - Create an enumerated list from the selenium objects
-        indexed_selenium_elements = list(enumerate(selenium_elements))
-        #4 - Filter elements based on "is_displayed()" and gets the filtered elements' enumeration
-        filtered_selenium_indexes = list(map(lambda x: x[0], filter(lambda x: x[1].is_displayed(), indexed_selenium_elements)))
-        #5 - Use List Comprehension to build a filtered list from the elements based on enumeration
-        filtered_elements = [x[1] for x in indexed_elements if x[0] in filtered_selenium_indexes]
-        #6 - Sort the result and return it
+        #2 - Filter only the displayed elements
+        filtered_elements = [element for element, state in zip(elements, states) if state and state["displayed"]]
+        #3 - Sort the result and return it
         return self.zindex_sort(filtered_elements, reverse)
 
+    def elements_state(self, elements, positions=False):
+        """
+        [Internal]
+
+        Returns the displayed state and the current class of a BeautifulSoup element list with a single script call.
+
+        The state follows the same rules of Selenium's is_displayed.
+
+        :param elements: BeautifulSoup element list
+        :type elements: List of BeautifulSoup objects
+        :param positions: If the position (getPosition()) of the elements should be returned as well. - **Default:** False
+        :type positions: bool
+
+        :return: One dict with the keys displayed, className (and position) per element. None for elements that don't exist on the screen.
+        :rtype: List of dict
+
+        Usage:
+
+        >>> #Calling the method
+        >>> states = self.elements_state(elements)
+        """
+        if not elements:
+            return []
+
+        handles = list(map(lambda x: self.soup_handle(x) if x is not None else [None, "/.."], elements))
+
+        try:
+            states = self.driver.execute_script(browser_scripts.ELEMENTS_STATE, handles, positions)
+            if states is None:
+                self.driver.execute_script(browser_scripts.INSTALL_IS_DISPLAYED)
+                states = self.driver.execute_script(browser_scripts.ELEMENTS_STATE, handles, positions)
+        except WebDriverException as e:
+            logger().debug(f"Warning elements_state exception: {str(e)}")
+            states = None
+
+        return states if states is not None else [None] * len(elements)
+
+    def elements_displayed(self, elements):
+        """
+        [Internal]
+
+        Returns a boolean list telling which elements of a BeautifulSoup element list are displayed, with a single script call.
+
+        :param elements: BeautifulSoup element list
+        :type elements: List of BeautifulSoup objects
+
+        :return: True for the displayed elements, False for the others.
+        :rtype: List of bool
+
+        Usage:
+
+        >>> #Calling the method
+        >>> displayed = self.elements_displayed(elements)
+        """
+        return list(map(lambda x: bool(x and x["displayed"]), self.elements_state(elements)))
+
     def find_first_div_parent(self, element):
         """
         [Internal]
@@ -436,6 +647,9 @@ class Base(unittest.TestCase):
 
         Returns current HTML DOM parsed as a BeautifulSoup object
 
+        If DomCache is enabled in config, the last parsed DOM is returned while the
+        generation counter of the page (see get_dom_generation) and tmenu_out_iframe don't change.
+
         :returns: BeautifulSoup parsed DOM
         :rtype: BeautifulSoup object
 
@@ -450,37 +664,280 @@ class Base(unittest.TestCase):
 
         try:
 
-            soup = BeautifulSoup(self.driver.page_source,"html.parser")
-
             if self.tmenu_out_iframe:
                 self.driver.switch_to.default_content()
-                soup = BeautifulSoup(self.driver.page_source,"html.parser")
 
-            elif soup and soup.select('.session'):
+            generation = self.get_dom_generation() if self.config.dom_cache else None
+
+            if generation and generation == self.current_dom_generation and self.current_dom is not None and \
+                    self.current_dom_out_iframe == self.tmenu_out_iframe:
+                if self.current_dom_in_frame:
+                    self.driver.switch_to.frame(self.driver.find_element_by_css_selector("iframe[class=session]"))
+                return self.current_dom
 
-                script = """
-                var getIframe = () => {
+            if self.config.element_handles:
+                soup = self.parse_html(self.driver.execute_script(browser_scripts.TAGGED_PAGE_SOURCE))
+            else:
+                soup = self.parse_html(self.driver.page_source)
+            in_frame = False
+
+            if not self.tmenu_out_iframe and soup and soup.select('.session'):
+
+                script = browser_scripts.HANDLES_FUNCTION + """
+                var getIframe = (tag) => {
                     if(document.querySelector(".session")){
                         var iframeObject = document.querySelector(".session")
                         var contet = iframeObject.contentDocument;
+                        if(tag){
+                            tirTagHandles(contet)
+                        }
                         var serializer = new XMLSerializer();
                         return serializer.serializeToString(contet);
                     }
                     return ""
                 }
 
-                return getIframe()
+                return getIframe(arguments[0])
                 """
-                soup = BeautifulSoup(self.driver.execute_script(script),'html.parser')
+                soup = self.parse_html(self.driver.execute_script(script, self.config.element_handles))
                 self.driver.switch_to.frame(self.driver.find_element_by_css_selector("iframe[class=session]"))
+                in_frame = True
+
+            self.current_dom = soup
+            self.current_dom_generation = generation
+            self.current_dom_in_frame = in_frame
+            self.current_dom_out_iframe = self.tmenu_out_iframe
 
             return soup
-            
+
         except WebDriverException as e:
+            self.clear_dom_cache()
             self.driver.switch_to.default_content()
-            soup = BeautifulSoup(self.driver.page_source,"html.parser")
+            soup = self.parse_html(self.driver.page_source)
             return soup
 
+    def parse_html(self, html):
+        """
+        [Internal]
+
+        Parses an HTML string as a BeautifulSoup object using the parser defined by DomParser in config.
+
+        Accepts any tree builder supported by BeautifulSoup ("html.parser", "lxml", "html5lib").
+        If the chosen parser is not installed, falls back to "html.parser".
+
+        :param html: The HTML content to be parsed.
+        :type html: str
+
+        :returns: BeautifulSoup parsed DOM
+        :rtype: BeautifulSoup object
+
+        Usage:
+
+        >>> #Calling the method
+        >>> soup = self.parse_html(self.driver.page_source)
+        """
+        try:
+            return BeautifulSoup(html, self.config.dom_parser)
+        except FeatureNotFound:
+            logger().warning(f"Warning DomParser '{self.config.dom_parser}' is not installed. Using 'html.parser'.")
+            self.config.dom_parser = "html.parser"
+            return BeautifulSoup(html, self.config.dom_parser)
+
+    def get_container_DOM(self, selector):
+        """
+        [Internal]
+
+        Returns only the top container matched by the selector, parsed as a BeautifulSoup object.
+
+        The container is chosen inside the browser with the same z-index ordering used by zindex_sort
+        and only its outerHTML is transferred and parsed. The returned object keeps the absolute xpath
+        of the container, so xpath_soup and soup_to_selenium keep working with its children.
+
+        :param selector: The CSS selector of the containers.
+        :type selector: str
+
+        :returns: The top container or None if no container was found.
+        :rtype: BeautifulSoup object
+
+        Usage:
+
+        >>> #Calling the method
+        >>> container = self.get_container_DOM(".tmodaldialog,.ui-dialog")
+        """
+        if self.config.new_log:
+            self.execution_flow()
+
+        try:
+            if self.tmenu_out_iframe:
+                self.driver.switch_to.default_content()
+
+            cached = self.container_dom.get(selector) if self.config.dom_cache else None
+            known_generation = cached[0] if cached else None
+
+            arguments = (selector, known_generation, self.config.element_handles)
+
+            result = self.driver.execute_script(browser_scripts.CONTAINER_DOM, *arguments)
+
+            if result and result.get("session"):
+                self.driver.switch_to.frame(self.driver.find_element_by_css_selector("iframe[class=session]"))
+                result = self.driver.execute_script(browser_scripts.CONTAINER_DOM, *arguments)
+
+        except WebDriverException as e:
+            logger().debug(f"Warning get_container_DOM exception: {str(e)}")
+            self.container_dom.pop(selector, None)
+            return None
+
+        if not result or result.get("session"):
+            return None
+
+        if result["html"] is None and cached:
+            return cached[1]
+
+        container = None
+        if result["html"]:
+            container = self.parse_html(result["html"]).find(attrs={"data-tir-xpath": True})
+
+        self.container_dom[selector] = (result["generation"], container)
+
+        return container
+
+    def container_DOM_enabled(self, selector):
+        """
+        [Internal]
+
+        Returns True if the container of the selector must be fetched with get_container_DOM.
+
+        Selectors that include the body always use the full page.
+
+        :param selector: The CSS selector of the containers.
+        :type selector: str
+
+        :rtype: bool
+
+        Usage:
+
+        >>> #Calling the method
+        >>> if self.container_DOM_enabled(".tmodaldialog"):
+        >>>     container = self.get_container_DOM(".tmodaldialog")
+        """
+        return self.config.container_dom and "body" not in selector
+
+    def count_round_trips(self):
+        """
+        [Internal]
+
+        Counts every command sent to the WebDriver (including the ones sent by the elements) in self.round_trips.
+
+        Usage:
+
+        >>> #Calling the method
+        >>> self.count_round_trips()
+        """
+        execute = self.driver.execute
+
+        def counted_execute(driver_command, params=None):
+            self.round_trips += 1
+            return execute(driver_command, params)
+
+        self.driver.execute = counted_execute
+
+    @contextmanager
+    def round_trip_budget(self, budget=None):
+        """
+        [Internal]
+
+        Context manager that counts the WebDriver round trips of a block and fails if the budget is exceeded.
+
+        :param budget: The maximum amount of round trips. - **Default:** None (only counts)
+        :type budget: int
+
+        :return: An object whose attribute used holds the round trips of the block when it ends.
+        :rtype: SimpleNamespace
+
+        Usage:
+
+        >>> #Calling the method
+        >>> with self.round_trip_budget(20) as round_trips:
+        >>>     self.SetValue("A1_COD", "000001")
+        >>> print(round_trips.used)
+        """
+        usage = SimpleNamespace(used=0, budget=budget)
+        start = self.round_trips
+
+        try:
+            yield usage
+        finally:
+            usage.used = self.round_trips - start
+
+        logger().debug(f"Round trips: {usage.used}" + (f" of {budget}" if budget is not None else ""))
+
+        if budget is not None:
+            self.assertLessEqual(usage.used, budget, f"Round trip budget exceeded: {usage.used} of {budget}")
+
+    def get_dom_generation(self):
+        """
+        [Internal]
+
+        Returns the generation key of the current document.
+
+        The first call injects a MutationObserver in the page (and in the .session iframe, if present)
+        that increments a counter on every DOM mutation, so the key only changes when the page changes.
+
+        :returns: The generation key or None if it couldn't be read.
+        :rtype: str
+
+        Usage:
+
+        >>> #Calling the method
+        >>> generation = self.get_dom_generation()
+        """
+        try:
+            return self.driver.execute_script(browser_scripts.DOM_GENERATION)
+        except WebDriverException as e:
+            logger().debug(f"Warning get_dom_generation exception: {str(e)}")
+            return None
+
+    def dom_structure_stamp(self, generation):
+        """
+        [Internal]
+
+        Returns the part of a DOM generation key that only changes when elements are added to or removed from the page.
+
+        :param generation: The key returned by get_dom_generation.
+        :type generation: str
+
+        :return: The structure stamp or None if there is no generation.
+        :rtype: str
+
+        Usage:
+
+        >>> #Calling the method
+        >>> stamp = self.dom_structure_stamp(self.current_dom_generation)
+        """
+        if not generation:
+            return None
+
+        return "|".join(map(lambda x: "{0}:{2}".format(*x.split(":")), generation.split("|")))
+
+    def clear_dom_cache(self):
+        """
+        [Internal]
+
+        Discards the DOM snapshot kept by get_current_DOM.
+
+        Must be called after actions that change the page, like clicks and keystrokes.
+
+        Usage:
+
+        >>> #Calling the method
+        >>> self.clear_dom_cache()
+        """
+        self.current_dom = None
+        self.current_dom_generation = None
+        self.current_dom_in_frame = False
+        self.current_dom_out_iframe = False
+        self.container_dom = {}
+
     def get_element_text(self, element):
         """
         [Internal]
@@ -531,6 +988,7 @@ class Base(unittest.TestCase):
             logger().exception("********Element Stale get_element_value*********")
             pass
 
+    @test_context.tracked
     def log_error(self, message, new_log_line=True):
         """
         [Internal]
@@ -547,7 +1005,7 @@ class Base(unittest.TestCase):
         >>> #Calling the method:
         >>> self.log_error("Element was not found")
         """
-        stack_item = next(iter(list(map(lambda x: x.function, filter(lambda x: re.search('test_', x.function), inspect.stack())))), None)
+        stack_item = test_context.testcase('test_')
         test_number = f"{stack_item.split('_')[-1]} -" if stack_item else ""
         log_message = f"{test_number} {message}"
         self.log.set_seconds()
@@ -699,7 +1157,7 @@ class Base(unittest.TestCase):
         >>> #Calling the method:
         >>> self.select_combo(element, "Chosen option")
         """
-        combo = Select(self.driver.find_element_by_xpath(xpath_soup(element)))
+        combo = Select(self.driver.find_element(*self.soup_locator(element)))
 
         if index:
             index_number = self.return_combo_index(combo, option)
@@ -748,6 +1206,8 @@ class Base(unittest.TestCase):
             actions.send_keys(arg)
             actions.perform()
 
+        self.clear_dom_cache()
+
     def search_stack(self, function):
         """
         Returns True if passed function is present in the call stack.
@@ -763,7 +1223,7 @@ class Base(unittest.TestCase):
         >>> # Calling the method:
         >>> is_present = self.search_stack("MATA020")
         """
-        return len(list(filter(lambda x: x.function == function, inspect.stack()))) > 0
+        return test_context.in_call(function)
 
     def set_element_focus(self, element):
         """
@@ -807,7 +1267,73 @@ class Base(unittest.TestCase):
         """
         if soup_object is None:
             raise AttributeError
-        return next(iter(self.driver.find_elements_by_xpath(xpath_soup(soup_object))), None)
+        return next(iter(self.driver.find_elements(*self.soup_locator(soup_object))), None)
+
+    def soups_to_selenium(self, soup_objects):
+        """
+        [Internal]
+
+        Converts a list of BeautifulSoup objects to Selenium objects with a single script call.
+
+        :param soup_objects: The BeautifulSoup objects to be converted.
+        :type soup_objects: List of BeautifulSoup objects
+
+        :return: The objects converted to Selenium objects. None for the ones that don't exist anymore.
+        :rtype: List of Selenium objects
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> selenium_objs = self.soups_to_selenium(bs_objs)
+        """
+        if not soup_objects:
+            return []
+
+        return self.driver.execute_script(browser_scripts.RESOLVE_HANDLES, list(map(self.soup_handle, soup_objects)))
+
+    def soup_locator(self, soup_object):
+        """
+        [Internal]
+
+        Returns the Selenium locator of a BeautifulSoup object.
+
+        Elements tagged by the ElementHandles config are located by their data-tir-id attribute,
+        which doesn't change when the siblings of the element are added or removed. The others by xpath.
+
+        :param soup_object: The BeautifulSoup object.
+        :type soup_object: BeautifulSoup object
+
+        :return: The locator as a (By, value) tuple.
+        :rtype: tuple
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> selenium_obj = self.driver.find_element(*self.soup_locator(bs_obj))
+        """
+        handle = soup_object.attrs.get("data-tir-id") if soup_object.name else None
+        if handle:
+            return (By.CSS_SELECTOR, f"[data-tir-id='{handle}']")
+        return (By.XPATH, xpath_soup(soup_object))
+
+    def soup_handle(self, soup_object):
+        """
+        [Internal]
+
+        Returns the [handle, xpath] pair used by the scripts that resolve BeautifulSoup objects in the browser.
+
+        :param soup_object: The BeautifulSoup object.
+        :type soup_object: BeautifulSoup object
+
+        :rtype: list
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> handle = self.soup_handle(bs_obj)
+        """
+        handle = soup_object.attrs.get("data-tir-id") if soup_object.name else None
+        return [handle, None] if handle else [None, xpath_soup(soup_object)]
 
     def web_scrap(self, term, scrap_type=enum.ScrapType.TEXT, optional_term=None, label=False, main_container=None):
         """
@@ -846,19 +1372,20 @@ class Base(unittest.TestCase):
             endtime = time.time() + 60
             container =  None
             while(time.time() < endtime and container is None):
-                soup = self.get_current_DOM()
-
-                if self.config.log_file:
-                    with open(f"{term + str(scrap_type) + str(optional_term) + str(label) + str(main_container) + str(random.randint(1, 101)) }.txt", "w") as text_file:
-                        text_file.write(f" HTML CONTENT: {str(soup)}")
-
                 container_selector = self.base_container
                 if (main_container is not None):
                     container_selector = main_container
 
-                containers = self.zindex_sort(soup.select(container_selector), reverse=True)
+                if self.container_DOM_enabled(container_selector):
+                    soup = container = self.get_container_DOM(container_selector)
+                else:
+                    soup = self.get_current_DOM()
+                    containers = self.zindex_sort(soup.select(container_selector), reverse=True)
+                    container = next(iter(containers), None)
 
-                container = next(iter(containers), None)
+                if self.config.log_file:
+                    with open(f"{term + str(scrap_type) + str(optional_term) + str(label) + str(main_container) + str(random.randint(1, 101)) }.txt", "w") as text_file:
+                        text_file.write(f" HTML CONTENT: {str(soup)}")
 
             if container is None:
                 raise Exception("Couldn't find container")
@@ -909,6 +1436,7 @@ class Base(unittest.TestCase):
 
 # User Methods
 
+    @test_context.tracked
     def AssertFalse(self, expected, message):
         """
         Defines that the test case expects a False response to pass
@@ -1024,8 +1552,11 @@ class Base(unittest.TestCase):
 
         self.wait = WebDriverWait(self.driver, self.config.time_out)
 
+        self.count_round_trips()
+
         self.driver.execute_script("app.resourceManager.storeValue('x:\\\\automation.ini.general.tir', 1)")
 
+    @test_context.tracked
     def TearDown(self):
         """
         Closes the webdriver and ends the test case.
@@ -0,0 +1,671 @@
+"""
+JavaScript snippets executed inside the browser by the core classes.
+
+The snippets are kept as plain strings so they can be composed with each other
+before being sent through *execute_script*.
+"""
+import pkgutil
+
+# Installs (once per window) a MutationObserver that counts every change made to the document,
+# and separately the changes to its structure (elements added or removed).
+# The returned key (token:count:structure) only changes when the document mutates or the window is reloaded.
+DOM_GENERATION_FUNCTION = """
+var tirDomGeneration = (win) => {
+    if(!win.tirDomGeneration){
+        var generation = {token: Math.random().toString(36).substring(2), count: 0, structure: 0}
+        generation.observer = new win.MutationObserver((records) => {
+            generation.count++
+            if(records.some((record) => record.type === "childList")){
+                generation.structure++
+            }
+        })
+        generation.observer.observe(win.document, {attributes: true, childList: true, characterData: true, subtree: true})
+        win.tirDomGeneration = generation
+    }
+    var generation = win.tirDomGeneration
+    return generation.token + ":" + generation.count + ":" + generation.structure
+}
+"""
+
+DOM_GENERATION = DOM_GENERATION_FUNCTION + """
+var getGeneration = () => {
+    var generation = tirDomGeneration(window)
+    var session = document.querySelector(".session")
+    if(session){
+        try{
+            generation += "|" + tirDomGeneration(session.contentWindow)
+        }catch(e){
+            return null
+        }
+    }
+    return generation
+}
+
+return getGeneration()
+"""
+
+# Same ordering used by Base.zindex_sort: the z-index written in the style attribute,
+# keeping the first element in document order when there is a tie.
+TOP_CONTAINER_FUNCTION = """
+var tirZIndex = (element) => {
+    var style = element.getAttribute("style") || ""
+    if(style.indexOf("z-index:") < 0){
+        return 0
+    }
+    return parseInt(style.split("z-index:")[1].split(";")[0].trim()) || 0
+}
+
+var tirTopContainer = (root, selector) => {
+    var container = null
+    var top = 0
+    root.querySelectorAll(selector).forEach((element) => {
+        var zindex = tirZIndex(element)
+        if(container === null || zindex > top){
+            container = element
+            top = zindex
+        }
+    })
+    return container
+}
+"""
+
+# Same absolute path format generated by xpath_soup.
+XPATH_FUNCTION = """
+var tirXPath = (element) => {
+    var components = []
+    for(var node = element; node && node.nodeType === 1; node = node.parentNode){
+        var name = node.localName
+        var siblings = node.parentNode ? Array.from(node.parentNode.children).filter((x) => x.localName === name) : [node]
+        components.unshift(siblings.length > 1 ? `${name}[${siblings.indexOf(node) + 1}]` : name)
+    }
+    return "/" + components.join("/")
+}
+"""
+
+# Tags every element under root without a handle with a compact data-tir-id attribute.
+# The records of the tagging are dropped so the DOM generation doesn't change.
+HANDLES_FUNCTION = """
+var tirTagHandles = (root) => {
+    var doc = root.ownerDocument || root
+    var win = doc.defaultView
+    var elements = Array.from(root.querySelectorAll("*:not([data-tir-id])"))
+    if(root.nodeType === 1 && !root.hasAttribute("data-tir-id")){
+        elements.unshift(root)
+    }
+    win.tirHandleCount = win.tirHandleCount || 0
+    elements.forEach((element) => {
+        element.setAttribute("data-tir-id", (++win.tirHandleCount).toString(36))
+    })
+    if(win.tirDomGeneration){
+        win.tirDomGeneration.observer.takeRecords()
+    }
+}
+
+var tirResolve = (handle) => {
+    if(handle[0]){
+        return document.querySelector(`[data-tir-id="${handle[0]}"]`)
+    }
+    return document.evaluate(handle[1], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+}
+"""
+
+# Returns the page source after tagging the elements with handles.
+TAGGED_PAGE_SOURCE = HANDLES_FUNCTION + """
+tirTagHandles(document)
+return document.documentElement.outerHTML
+"""
+
+# arguments[0]: list of [handle, xpath] pairs (the xpath is used when there is no handle).
+# Returns the elements found, null for the ones that don't exist anymore.
+RESOLVE_HANDLES = HANDLES_FUNCTION + """
+return arguments[0].map(tirResolve)
+"""
+
+# arguments[0]: container selector, arguments[1]: generation of the container already parsed,
+# arguments[2]: tag the elements of the container with handles.
+# Returns only the outerHTML of the top container, tagged with its absolute xpath.
+CONTAINER_DOM = DOM_GENERATION_FUNCTION + TOP_CONTAINER_FUNCTION + XPATH_FUNCTION + HANDLES_FUNCTION + """
+var getContainer = (selector, known, tag) => {
+    if(document.querySelector(".session")){
+        return {session: true}
+    }
+    var generation = tirDomGeneration(window)
+    if(generation === known){
+        return {generation: generation, html: null}
+    }
+    var container = tirTopContainer(document, selector)
+    if(!container){
+        return {generation: generation, html: ""}
+    }
+    if(tag){
+        tirTagHandles(container)
+    }
+    var xpath = tirXPath(container)
+    var html = container.outerHTML.replace(/^<([\\w-]+)/, `<$1 data-tir-xpath="${xpath}"`)
+    return {generation: generation, html: html}
+}
+
+return getContainer(arguments[0], arguments[1], arguments[2])
+"""
+
+# Approximation of the Selenium is_displayed atom: not hidden by display, opacity or visibility
+# and with a rendered box (or a rendered child).
+DISPLAYED_FUNCTION = """
+var tirIsDisplayed = (element) => {
+    if(!element || !element.isConnected){
+        return false
+    }
+    var win = element.ownerDocument.defaultView
+    for(var node = element; node && node.nodeType === 1; node = node.parentElement){
+        var style = win.getComputedStyle(node)
+        if(style.display === "none" || parseFloat(style.opacity) === 0){
+            return false
+        }
+    }
+    var visibility = win.getComputedStyle(element).visibility
+    if(visibility === "hidden" || visibility === "collapse"){
+        return false
+    }
+    var hasSize = (node) => {
+        var rect = node.getBoundingClientRect()
+        return rect.width > 0 && rect.height > 0
+    }
+    return hasSize(element) || Array.from(element.querySelectorAll("*")).some(hasSize)
+}
+"""
+
+# The is_displayed atom shipped with Selenium, installed once per window as window.tirIsDisplayed.
+try:
+    IS_DISPLAYED_ATOM = pkgutil.get_data("selenium.webdriver.remote", "isDisplayed.js").decode("utf8")
+except (OSError, ImportError):
+    IS_DISPLAYED_ATOM = None
+
+if IS_DISPLAYED_ATOM:
+    INSTALL_IS_DISPLAYED = "window.tirIsDisplayed = (element) => (" + IS_DISPLAYED_ATOM + ").apply(null, [element])"
+else:
+    INSTALL_IS_DISPLAYED = DISPLAYED_FUNCTION + "window.tirIsDisplayed = tirIsDisplayed"
+
+# arguments[0]: list of [handle, xpath] pairs, arguments[1]: include the positions.
+# Returns null while window.tirIsDisplayed is not installed, otherwise one entry per pair:
+# null if the element doesn't exist, else its displayed state, its current class and
+# optionally its position (getPosition() of the Protheus components).
+ELEMENTS_STATE = HANDLES_FUNCTION + """
+var elementsState = (handles, withPosition) => {
+    if(!window.tirIsDisplayed){
+        return null
+    }
+    return handles.map((handle) => {
+        var element = tirResolve(handle)
+        if(!element){
+            return null
+        }
+        var state = {displayed: !!window.tirIsDisplayed(element), className: element.getAttribute("class") || ""}
+        if(withPosition){
+            var rect = element.getBoundingClientRect()
+            state.position = typeof element.getPosition === "function" ? element.getPosition() : {x: rect.left, y: rect.top}
+        }
+        return state
+    })
+}
+
+return elementsState(arguments[0], arguments[1])
+"""
+
+# Mirrors web_scrap on the top container of the containers selector, returning the elements found.
+# Supports the TEXT, MIXED and CSS_SELECTOR scrap types.
+QUERY_FUNCTION = TOP_CONTAINER_FUNCTION + DISPLAYED_FUNCTION + """
+var tirQueryElements = (term, scrapType, optionalTerm, containerSelector, labels) => {
+    var container = tirTopContainer(document, containerSelector)
+    var elements = []
+    var lowerTerm = term.toLowerCase()
+    var containsTerm = (selector) => Array.from(container.querySelectorAll(selector)).filter((x) => x.textContent.toLowerCase().includes(lowerTerm))
+
+    if(!container){
+        elements = []
+    }else if(scrapType === "CSS_SELECTOR"){
+        elements = Array.from(container.querySelectorAll(term))
+    }else if(scrapType === "MIXED"){
+        elements = optionalTerm ? containsTerm(optionalTerm) : []
+    }else if(scrapType === "TEXT" && labels && !/^\\w+_/.test(term)){
+        var regex = new RegExp("^" + term.replace(/[.*+?^${}()|[\\]\\\\]/g, "\\\\$&"))
+        var walker = document.createTreeWalker(container, NodeFilter.SHOW_TEXT)
+        while(walker.nextNode()){
+            if(regex.test(walker.currentNode.nodeValue)){
+                var parent = walker.currentNode.parentElement
+                while(parent && parent.localName !== "div"){
+                    parent = parent.parentElement
+                }
+                if(parent){
+                    elements.push(parent)
+                }
+            }
+        }
+        if(elements.length > 1){
+            elements = elements.filter(window.tirIsDisplayed || tirIsDisplayed)
+        }
+    }else if(scrapType === "TEXT"){
+        if(labels){
+            elements = Array.from(container.querySelectorAll(`[name*='${term}']`))
+        }
+        if(!elements.length){
+            elements = containsTerm("div > *")
+        }
+    }
+
+    return elements
+}
+"""
+
+# arguments[0]: term, arguments[1]: scrap type, arguments[2]: optional term, arguments[3]: container selector,
+# arguments[4]: search labels on TEXT, arguments[5]: return the elements.
+# Returns the count of the elements found (or the elements).
+QUERY_ELEMENTS = QUERY_FUNCTION + """
+var queryElements = (term, scrapType, optionalTerm, containerSelector, labels, returnElements) => {
+    if(document.querySelector(".session")){
+        return {session: true}
+    }
+    var elements = tirQueryElements(term, scrapType, optionalTerm, containerSelector, labels)
+    return returnElements ? {count: elements.length, elements: elements} : {count: elements.length}
+}
+
+return queryElements(arguments[0], arguments[1], arguments[2], arguments[3], arguments[4], arguments[5])
+"""
+
+# Asynchronous script. arguments[0] to arguments[4]: same as QUERY_ELEMENTS, arguments[5]: presence,
+# arguments[6]: position, arguments[7]: timeout in milliseconds.
+# Resolves {done: true} as soon as the elements reach the expected presence, checking the query
+# again only when the document mutates, or {done: false} when the timeout is met.
+WAIT_ELEMENTS = QUERY_FUNCTION + """
+var callback = arguments[arguments.length - 1]
+
+var waitElements = (term, scrapType, optionalTerm, containerSelector, labels, presence, position, timeout) => {
+    if(document.querySelector(".session")){
+        return callback({session: true})
+    }
+
+    var check = () => {
+        var count = tirQueryElements(term, scrapType, optionalTerm, containerSelector, labels).length
+        return (position ? count >= position : count > 0) === presence
+    }
+
+    if(check()){
+        return callback({done: true})
+    }
+
+    var finished = false
+    var scheduled = false
+    var observer = null
+    var timer = null
+
+    var finish = (done) => {
+        if(!finished){
+            finished = true
+            observer.disconnect()
+            clearTimeout(timer)
+            callback({done: done})
+        }
+    }
+
+    observer = new MutationObserver(() => {
+        if(!scheduled){
+            scheduled = true
+            setTimeout(() => {
+                scheduled = false
+                if(check()){
+                    finish(true)
+                }
+            }, 20)
+        }
+    })
+    observer.observe(document, {attributes: true, childList: true, characterData: true, subtree: true})
+    timer = setTimeout(() => finish(check()), timeout)
+}
+
+waitElements(arguments[0], arguments[1], arguments[2], arguments[3], arguments[4], arguments[5], arguments[6], arguments[7])
+"""
+
+# Returns true if the screen is blocked: the top displayed container is blocked while there is an
+# .ajax-blocker or it has the "blocked" class.
+BLOCKER_FUNCTION = TOP_CONTAINER_FUNCTION + DISPLAYED_FUNCTION + """
+var tirBlocked = (selector) => {
+    var isDisplayed = window.tirIsDisplayed || tirIsDisplayed
+    var containers = Array.from(document.querySelectorAll(selector))
+        .map((element, index) => ({element: element, index: index, zindex: tirZIndex(element)}))
+        .sort((a, b) => (b.zindex - a.zindex) || (a.index - b.index))
+    var top = containers.find((x) => isDisplayed(x.element))
+    return !!top && (!!document.querySelector(".ajax-blocker") || top.element.classList.contains("blocked"))
+}
+"""
+
+# Asynchronous script. arguments[0]: blocker containers selector, arguments[1]: timeout in milliseconds.
+# Resolves {blocked} as soon as the screen is not blocked or when the timeout is met. The page is observed
+# only during the wait, and the blocked state is checked again at most once per 20 milliseconds of mutations.
+WAIT_UNBLOCKED = BLOCKER_FUNCTION + """
+var callback = arguments[arguments.length - 1]
+
+var waitUnblocked = (selector, timeout) => {
+    if(document.querySelector(".session")){
+        return callback({session: true})
+    }
+
+    if(!tirBlocked(selector)){
+        return callback({blocked: false})
+    }
+
+    var observer = null
+    var timer = null
+    var scheduled = false
+    var finished = false
+
+    var finish = (blocked) => {
+        if(!finished){
+            finished = true
+            observer.disconnect()
+            clearTimeout(timer)
+            callback({blocked: blocked})
+        }
+    }
+
+    observer = new MutationObserver(() => {
+        if(!scheduled){
+            scheduled = true
+            setTimeout(() => {
+                scheduled = false
+                if(!finished && !tirBlocked(selector)){
+                    finish(false)
+                }
+            }, 20)
+        }
+    })
+    observer.observe(document, {attributes: true, attributeFilter: ["class", "style", "hidden"], childList: true, subtree: true})
+    timer = setTimeout(() => finish(tirBlocked(selector)), timeout)
+}
+
+waitUnblocked(arguments[0], arguments[1])
+"""
+
+# The content compared by send_action: the closest ancestor of the element matching the scope selector,
+# or the whole document (the session iframe document when there is one).
+CONTENT_HASH_FUNCTION = """
+var tirContentRoot = (element, scope) => {
+    if(element && scope){
+        var closest = element.closest(scope)
+        if(closest){
+            return closest
+        }
+    }
+    var session = document.querySelector(".session")
+    return session ? session.contentDocument.documentElement : document.documentElement
+}
+
+var tirContentHash = (root) => {
+    var text = root.outerHTML
+    var hash = 0x811c9dc5
+    for(var i = 0; i < text.length; i++){
+        hash ^= text.charCodeAt(i)
+        hash = Math.imul(hash, 16777619)
+    }
+    return text.length + ":" + (hash >>> 0).toString(36)
+}
+"""
+
+# arguments[0]: element (or null), arguments[1]: scope selector (or null).
+CONTENT_HASH = CONTENT_HASH_FUNCTION + """
+return tirContentHash(tirContentRoot(arguments[0], arguments[1]))
+"""
+
+# Asynchronous script. arguments[0]: hash before the action, arguments[1]: element (or null),
+# arguments[2]: scope selector (or null), arguments[3]: timeout in milliseconds.
+# Resolves {changed: true} as soon as the content differs from the hash, checking it again
+# only when the document mutates, or {changed: false} when the timeout is met.
+WAIT_CONTENT_CHANGE = CONTENT_HASH_FUNCTION + """
+var callback = arguments[arguments.length - 1]
+
+var waitContentChange = (known, element, scope, timeout) => {
+    var root = tirContentRoot(element, scope)
+    var check = () => !root.isConnected || tirContentHash(root) !== known
+
+    if(check()){
+        return callback({changed: true})
+    }
+
+    var finished = false
+    var scheduled = false
+    var observer = null
+    var timer = null
+
+    var finish = (changed) => {
+        if(!finished){
+            finished = true
+            observer.disconnect()
+            clearTimeout(timer)
+            callback({changed: changed})
+        }
+    }
+
+    observer = new MutationObserver(() => {
+        if(!scheduled){
+            scheduled = true
+            setTimeout(() => {
+                scheduled = false
+                if(check()){
+                    finish(true)
+                }
+            }, 20)
+        }
+    })
+    observer.observe(root.ownerDocument, {attributes: true, childList: true, characterData: true, subtree: true})
+    timer = setTimeout(() => finish(check()), timeout)
+}
+
+waitContentChange(arguments[0], arguments[1], arguments[2], arguments[3])
+"""
+
+# arguments[0]: containers selector, arguments[1]: selector of the current container,
+# arguments[2]: list of the sections to collect (null for all), arguments[3]: selector of the "fields" section (or null).
+# Collects in a single call the state of the screen: the containers with their z-index and, for the
+# current (top) container, its size, labels, inputs, comboboxes, grids, buttons and the elements of the fields selector.
+# The xpath is only computed for the elements without a data-tir-id handle.
+SCREEN_STATE = TOP_CONTAINER_FUNCTION + XPATH_FUNCTION + DISPLAYED_FUNCTION + """
+var screenState = (containersSelector, containerSelector, sections, fieldsSelector) => {
+    if(document.querySelector(".session")){
+        return {session: true}
+    }
+
+    var isDisplayed = window.tirIsDisplayed || tirIsDisplayed
+
+    var describe = (element) => {
+        var rect = element.getBoundingClientRect()
+        var className = element.getAttribute("class") || ""
+        var handle = element.getAttribute("data-tir-id")
+        return {
+            id: element.id,
+            handle: handle,
+            xpath: handle ? null : tirXPath(element),
+            className: className,
+            text: element.textContent.trim(),
+            displayed: !!isDisplayed(element),
+            readonly: className.includes("readonly") && !className.includes("readonly focus"),
+            position: typeof element.getPosition === "function" ? element.getPosition() : null,
+            rect: {x: rect.left, y: rect.top, width: rect.width, height: rect.height}
+        }
+    }
+
+    var wanted = (section) => !sections || sections.includes(section)
+
+    var containers = !wanted("containers") ? [] : Array.from(document.querySelectorAll(containersSelector)).map((element) => {
+        var state = describe(element)
+        state.zindex = tirZIndex(element)
+        delete state.text
+        return state
+    })
+
+    var container = tirTopContainer(document, containerSelector)
+    if(!container){
+        return {containers: containers, container: null}
+    }
+
+    var select = (section, selector, extra) => !wanted(section) || !selector ? [] : Array.from(container.querySelectorAll(selector)).map((element) => {
+        var state = describe(element)
+        return extra ? Object.assign(state, extra(element)) : state
+    })
+
+    var field = (element) => {
+        var input = element.matches("input, select, textarea") ? element : element.querySelector("input, select, textarea")
+        return {
+            name: input ? input.getAttribute("name") : element.getAttribute("name"),
+            value: input ? input.value : null
+        }
+    }
+
+    var containerState = describe(container)
+    delete containerState.text
+    containerState.size = {height: container.offsetHeight, width: container.offsetWidth}
+
+    return {
+        containers: containers,
+        container: containerState,
+        labels: select("labels", "label"),
+        inputs: select("inputs", ".tget, .tmultiget", field),
+        comboboxes: select("comboboxes", ".tcombobox", (element) => {
+            var combo = element.querySelector("select")
+            var option = combo && combo.selectedIndex >= 0 ? combo.options[combo.selectedIndex] : null
+            return {value: option ? option.text : null, options: combo ? Array.from(combo.options).map((x) => x.text) : []}
+        }),
+        grids: select("grids", ".tgetdados, .tgrid, .tcbrowse", (element) => ({
+            headers: Array.from(element.querySelectorAll("thead th")).map((x) => x.textContent.trim())
+        })),
+        buttons: select("buttons", "button", (element) => ({disabled: element.disabled})),
+        fields: select("fields", fieldsSelector)
+    }
+}
+
+return screenState(arguments[0], arguments[1], arguments[2] || null, arguments[3] || null)
+"""
+
+# arguments[0]: element id.
+ELEMENT_SIZE = """
+var element = document.getElementById(arguments[0])
+return {height: element.offsetHeight, width: element.offsetWidth}
+"""
+
+# arguments[0]: [handle, xpath] pair of the grid, arguments[1]: list of row indexes.
+# Returns null if the grid doesn't exist anymore, otherwise the text of the cells of each row
+# (null for the rows that don't exist).
+GRID_ROWS_TEXT = HANDLES_FUNCTION + """
+var gridRowsText = (handle, indexes) => {
+    var grid = tirResolve(handle)
+    if(!grid){
+        return null
+    }
+    var rows = grid.querySelectorAll("tbody tr")
+    return indexes.map((index) => {
+        var row = rows[index]
+        return row ? Array.from(row.querySelectorAll("td"), (cell) => cell.textContent.trim()) : null
+    })
+}
+
+return gridRowsText(arguments[0], arguments[1])
+"""
+
+# arguments[0]: [handle, xpath] pair of the grid.
+# Returns null if the grid doesn't exist anymore, otherwise the text of the header labels
+# and the text of the cells of every rendered row.
+GRID_DATA = HANDLES_FUNCTION + """
+var gridData = (handle) => {
+    var grid = tirResolve(handle)
+    if(!grid){
+        return null
+    }
+    var text = (element) => element.textContent.trim()
+    return {
+        headers: Array.from(grid.querySelectorAll("thead tr label"), text),
+        rows: Array.from(grid.querySelectorAll("tbody tr"), (row) => Array.from(row.querySelectorAll("td"), text))
+    }
+}
+
+return gridData(arguments[0])
+"""
+
+# arguments[0]: [handle, xpath] pair of the grid, arguments[1]: id of the column cells, arguments[2]: value.
+# Returns null if the grid doesn't exist anymore. Otherwise searches the displayed cells of the column
+# for the value, scrolling the cell found into view, and returns the grid element, the cell found
+# (and its next sibling) or null, the texts of the displayed cells and the content hash of the grid.
+GRID_SEEK = HANDLES_FUNCTION + DISPLAYED_FUNCTION + CONTENT_HASH_FUNCTION + """
+var gridSeek = (handle, column, value) => {
+    var grid = tirResolve(handle)
+    if(!grid){
+        return null
+    }
+    var isDisplayed = window.tirIsDisplayed || tirIsDisplayed
+    var cells = Array.from(grid.querySelectorAll(`td[id='${column}']`)).filter((cell) => isDisplayed(cell))
+    var cell = cells.find((cell) => cell.textContent.trim() === value) || null
+    if(cell){
+        cell.scrollIntoView({block: "nearest"})
+    }
+    return {
+        grid: grid,
+        cell: cell,
+        sibling: cell ? cell.nextElementSibling : null,
+        values: cells.map((cell) => cell.textContent.trim()),
+        hash: tirContentHash(grid)
+    }
+}
+
+return gridSeek(arguments[0], arguments[1], arguments[2])
+"""
+
+# arguments[0]: [handle, xpath] pair of the grid.
+# Returns null if the grid doesn't exist anymore, otherwise the grid element, the text of the header
+# labels, the id and cell texts of every rendered row and the content hash of the grid.
+GRID_PAGE = HANDLES_FUNCTION + CONTENT_HASH_FUNCTION + """
+var gridPage = (handle) => {
+    var grid = tirResolve(handle)
+    if(!grid){
+        return null
+    }
+    var text = (element) => element.textContent.trim()
+    return {
+        grid: grid,
+        headers: Array.from(grid.querySelectorAll("thead tr label"), text),
+        rows: Array.from(grid.querySelectorAll("tbody tr"), (row) => ({id: row.id, cells: Array.from(row.querySelectorAll("td"), text)})),
+        hash: tirContentHash(grid)
+    }
+}
+
+return gridPage(arguments[0])
+"""
+
+# Asynchronous script. arguments[0]: editor element (or null), arguments[1]: timeout in milliseconds.
+# Without an editor, resolves the input (or select) of the top grid cell editor as soon as it is displayed:
+# {editor, tag, valuetype, length}, or null when the timeout is met.
+# With an editor, resolves {closed: true} as soon as it is removed or hidden, or {closed: false} on timeout.
+WAIT_GRID_EDITOR = TOP_CONTAINER_FUNCTION + DISPLAYED_FUNCTION + """
+var callback = arguments[arguments.length - 1]
+
+var waitGridEditor = (editor, timeout) => {
+    var isDisplayed = window.tirIsDisplayed || tirIsDisplayed
+    var check = () => {
+        if(editor){
+            return !editor.isConnected || !isDisplayed(editor) ? {closed: true} : null
+        }
+        var container = tirTopContainer(document, ".tmodaldialog.twidget.borderless")
+        var child = container ? container.querySelector("input") || container.querySelector("select") : null
+        if(!child || !isDisplayed(child)){
+            return null
+        }
+        return {editor: child, tag: child.localName, valuetype: child.getAttribute("valuetype"), length: (child.value || "").length}
+    }
+    var endtime = Date.now() + timeout
+    var poll = () => {
+        var result = check()
+        if(result || Date.now() >= endtime){
+            return callback(result || (editor ? {closed: false} : null))
+        }
+        setTimeout(poll, 25)
+    }
+    poll()
+}
+
+waitGridEditor(arguments[0], arguments[1])
+"""
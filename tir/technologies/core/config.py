@@ -26,6 +26,7 @@ class ConfigLoader:
         self.country = str(data["Country"]) if "Country" in data else "BRA"
         self.execution_id = str(data["ExecId"]) if "ExecId" in data else today.strftime('%Y%m%d')
         self.num_exec = str(data["NumExec"]) if "NumExec" in data else ""
+        self.num_exec_timeout = float(data["NumExecTimeout"]) if "NumExecTimeout" in data else 30
         self.issue = str(data["MotExec"]) if "MotExec" in data else ""
         self.url = str(data["Url"]) if "Url" in data else ""
         self.browser = str(data["Browser"]) if "Browser" in data else ""
@@ -68,8 +69,20 @@ class ConfigLoader:
         self.new_log = ("NewLog" in data  and bool(data["NewLog"]))
         self.logurl1 = str(data["LogUrl1"]) if "LogUrl1" in data else ""
         self.logurl2 = str(data["LogUrl2"]) if "LogUrl2" in data else ""
+        self.log_flush_timeout = float(data["LogFlushTimeout"]) if "LogFlushTimeout" in data else 120
+        self.http_connect_timeout = float(data["HttpConnectTimeout"]) if "HttpConnectTimeout" in data else 10
+        self.http_read_timeout = float(data["HttpReadTimeout"]) if "HttpReadTimeout" in data else 60
+        self.http_gzip = ("HttpGzip" in data and bool(data["HttpGzip"]))
         self.parameter_url = bool(data["ParameterUrl"]) if "ParameterUrl" in data else False
         self.release = str(data["Release"]) if "Release" in data else ""
         self.log_http = str(data["LogHttp"]) if "LogHttp" in data else ""
         self.baseline_spool = str(data["BaseLine_Spool"]) if "BaseLine_Spool" in data else ""
         self.check_value = (bool(data["CheckValue"]) if "CheckValue" in data else None)
+        self.dom_cache = (bool(data["DomCache"]) if "DomCache" in data else True)
+        self.dom_parser = str(data["DomParser"]) if "DomParser" in data else "html.parser"
+        self.container_dom = ("ContainerDOM" in data and bool(data["ContainerDOM"]))
+        self.browser_query = ("BrowserQuery" in data and bool(data["BrowserQuery"]))
+        self.element_handles = ("ElementHandles" in data and bool(data["ElementHandles"]))
+        self.event_wait = ("EventWait" in data and bool(data["EventWait"]))
+        self.layout_cache = (bool(data["LayoutCache"]) if "LayoutCache" in data else True)
+        self.bulk_grid_check = (bool(data["BulkGridCheck"]) if "BulkGridCheck" in data else True)
@@ -0,0 +1,68 @@
+class HeaderIndex():
+    """
+    Lookup tables of the header labels of a grid, built once per header structure.
+
+    The exact lookups follow the dictionaries returned by WebappInternal.get_headers_from_grids
+    (lower case, stripped texts, the last column wins when two labels have the same text), and
+    the contains lookups follow the search of the column in ScrollGrid and ClickBox (the first column wins).
+
+    :param texts: The texts of the header labels, in the order of the columns.
+    :type texts: List of str
+
+    Usage:
+
+    >>> index = HeaderIndex(["Código", "Descrição", "Quantidade"])
+    >>> index.index("código")
+    0
+    >>> index.prefix("desc")
+    1
+    >>> index.contains("Quant")
+    2
+    """
+    def __init__(self, texts):
+        self.texts = list(texts)
+        self.names = list(map(lambda x: x.strip().lower(), self.texts))
+        self.columns = dict(zip(self.names, range(len(self.names))))
+        self.lookups = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def index(self, name):
+        """
+        Returns the column of the label with the text (case insensitive) or None.
+        """
+        return self.columns.get(name.strip().lower())
+
+    def prefix(self, name):
+        """
+        Returns the first column whose label starts with the text (case insensitive) or None.
+        """
+        return self.lookup("prefix", name.strip().lower(), lambda x, y: x.startswith(y), self.names)
+
+    def contains(self, text):
+        """
+        Returns the first column whose label contains the text (case sensitive, as ScrollGrid and ClickBox search it) or None.
+        """
+        return self.lookup("contains", text, lambda x, y: y in x, self.texts)
+
+    def field(self, field, field_to_label):
+        """
+        Returns the column of the SX3 title of the field or None.
+
+        :param field: The SX3 field, ex: "A1_COD".
+        :type field: str
+        :param field_to_label: The field to title dictionary of get_x3_dictionaries.
+        :type field_to_label: dict
+        """
+        title = field_to_label.get(field)
+        return self.index(str(title)) if title is not None else None
+
+    def lookup(self, kind, value, match, texts):
+        """
+        Returns the first column matching the value, remembering the result.
+        """
+        key = (kind, value)
+        if key not in self.lookups:
+            self.lookups[key] = next(iter(filter(lambda x: match(x[1], value), enumerate(texts))), (None,))[0]
+        return self.lookups[key]
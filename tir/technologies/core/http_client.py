@@ -0,0 +1,174 @@
+import gzip
+import json
+import time
+import atexit
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from tir.technologies.core.config import ConfigLoader
+from tir.technologies.core.logging_config import logger
+
+clients = {}
+client_lock = threading.Lock()
+
+def http_client(config=None):
+    """
+    Returns the HTTP client of the process for the settings (HttpConnectTimeout, HttpReadTimeout and
+    HttpGzip) of the configuration, creating it on the first call. The callers with the same settings
+    share the client and its connections.
+
+    :param config: The configuration of the caller. - **Default:** None (the config.json of the working directory)
+    :type config: ConfigLoader
+
+    :return: The client.
+    :rtype: HttpClient
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> response = http_client(self.config).post(url, json_data=data)
+    """
+    if config is None:
+        config = ConfigLoader()
+
+    key = (config.http_connect_timeout, config.http_read_timeout, config.http_gzip)
+    client = clients.get(key)
+
+    if client is None:
+        with client_lock:
+            client = clients.get(key)
+            if client is None:
+                client = clients[key] = HttpClient(config)
+                atexit.register(client.close)
+
+    return client
+
+class HttpClient():
+    """
+    HTTP client of the requests made by TIR (execution log, num_exec and the links checked by APW).
+
+    The requests share a requests.Session, so the connections (and their TLS handshakes) are reused
+    through a keep-alive pool instead of being opened for every request. The timeouts come from
+    HttpConnectTimeout and HttpReadTimeout of config.json and, with HttpGzip, the request bodies are
+    compressed. The client counts the requests, errors, bytes sent and received and the time spent.
+
+    :param config: The configuration.
+    :type config: ConfigLoader
+    :param pool_size: The connections kept open by host. - **Default:** 10
+    :type pool_size: int
+
+    Usage:
+
+    >>> # Getting the client of the process:
+    >>> client = http_client(self.config)
+    >>> response = client.post(url, data=json_data, headers={'content-type': 'application/json'})
+    >>> client.stats()
+    """
+    def __init__(self, config, pool_size=10):
+        self.timeout = (config.http_connect_timeout, config.http_read_timeout)
+        self.gzip = config.http_gzip
+        self.session = requests.Session()
+
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.lock = threading.Lock()
+        self.counters = {"requests": 0, "errors": 0, "bytes_sent": 0, "bytes_received": 0, "seconds": 0.0, "max_seconds": 0.0}
+
+    def get(self, url, **kwargs):
+        """
+        Sends a GET request. See request.
+        """
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        """
+        Sends a POST request. See request.
+        """
+        return self.request("POST", url, **kwargs)
+
+    def request(self, method, url, data=None, json_data=None, headers=None, timeout=None, compress=None):
+        """
+        Sends a request through the pool of connections.
+
+        :param method: The HTTP method.
+        :type method: str
+        :param url: The url.
+        :type url: str
+        :param data: The body. - **Default:** None
+        :type data: str or bytes
+        :param json_data: Object sent as the json body. - **Default:** None
+        :type json_data: dict
+        :param headers: The headers. - **Default:** None
+        :type headers: dict
+        :param timeout: The timeout in seconds, or a tuple with the connect and read timeouts. - **Default:** None (HttpConnectTimeout and HttpReadTimeout)
+        :type timeout: float or Tuple
+        :param compress: Compresses the body with gzip. - **Default:** None (HttpGzip)
+        :type compress: bool
+
+        :return: The response.
+        :rtype: requests.Response
+        """
+        headers = dict(headers) if headers else {}
+
+        if json_data is not None:
+            data = json.dumps(json_data)
+            headers.setdefault("content-type", "application/json")
+
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
+        if data and (self.gzip if compress is None else compress):
+            data = gzip.compress(data)
+            headers["Content-Encoding"] = "gzip"
+
+        sent = len(data) if data else 0
+        start = time.perf_counter()
+
+        try:
+            response = self.session.request(method, url.strip(), data=data, headers=headers, timeout=timeout if timeout is not None else self.timeout)
+        except requests.RequestException:
+            self.count(sent, 0, time.perf_counter() - start, True)
+            raise
+
+        self.count(sent, len(response.content), time.perf_counter() - start, False)
+
+        return response
+
+    def count(self, sent, received, seconds, error):
+        """
+        Adds a request to the counters.
+        """
+        with self.lock:
+            self.counters["requests"] += 1
+            self.counters["errors"] += int(error)
+            self.counters["bytes_sent"] += sent
+            self.counters["bytes_received"] += received
+            self.counters["seconds"] += seconds
+            self.counters["max_seconds"] = max(self.counters["max_seconds"], seconds)
+
+    def stats(self):
+        """
+        Returns a copy of the counters, with the average time of the requests.
+
+        :rtype: dict
+        """
+        with self.lock:
+            stats = dict(self.counters)
+
+        stats["average_seconds"] = stats["seconds"] / stats["requests"] if stats["requests"] else 0.0
+
+        return stats
+
+    def close(self):
+        """
+        Closes the connections of the pool, logging the counters.
+        """
+        stats = self.stats()
+
+        if stats["requests"]:
+            logger().debug(f"HTTP requests: {stats['requests']} Errors: {stats['errors']} Sent: {stats['bytes_sent']} bytes "
+                           f"Received: {stats['bytes_received']} bytes Average: {stats['average_seconds']:.3f}s Max: {stats['max_seconds']:.3f}s")
+
+        self.session.close()
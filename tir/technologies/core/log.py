@@ -6,14 +6,14 @@ import numpy as nump
 import pandas as panda
 import uuid
 import csv
-import inspect
 import re
 import platform
-import requests
 import json
 from datetime import datetime
 from tir.technologies.core.config import ConfigLoader
 from tir.technologies.core.logging_config import logger
+from tir.technologies.core import test_context
+from tir.technologies.core.log_outbox import LogOutbox
 
 class Log:
     """
@@ -68,6 +68,7 @@ class Log:
         self.hash_exec = ""
         self.test_case = self.list_of_testcases()
         self.finish_testcase = []
+        self.outbox = None
 
     def generate_header(self):
         """
@@ -162,22 +163,14 @@ class Log:
         """
         Returns a list of test cases from suite 
         """
-        runner = next(iter(list(filter(lambda x: "runner.py" in x.filename, inspect.stack()))), None)
-
-        if runner:
-            try:
-                return list(filter(lambda x: x is not None, list(runner.frame.f_locals['test']._tests)))
-            except KeyError:
-                return []
-        else:
-            return []
+        return test_context.testcases()
 
     def get_testcase_stack(self):
         """
         Returns a string with the current testcase name
         [Internal]
         """
-        return next(iter(list(map(lambda x: x.function, filter(lambda x: re.search('setUpClass', x.function) or re.search('test_', x.function), inspect.stack())))), None)
+        return test_context.testcase()
 
     def checks_empty_line(self):
         """
@@ -238,18 +231,7 @@ class Log:
         """
         Returns a Testsuite name
         """
-        testsuite_stack = next(iter(list(filter(lambda x: file_name in x.filename.lower(), inspect.stack()))), None)
-
-        if testsuite_stack:
-
-            if '/' in testsuite_stack.filename:
-                split_character = '/'
-            else:
-                split_character = '\\'
-
-            return testsuite_stack.filename.split(split_character)[-1].split(".")[0]
-        else:
-            return ""
+        return test_context.file_name(file_name)
 
     def generate_dict(self, result, message):
         """
@@ -298,57 +280,41 @@ class Log:
 
     def generate_json(self, dictionary):
         """
-        """
-        server_address1 = self.config.logurl1
-        server_address2 = self.config.logurl2
-
-        success = False
-
-        data = dictionary
+        Writes the log of the test case in the outbox, which sends it to LogUrl1 or LogUrl2 in background.
 
-        json_data = json.dumps(data)
-
-        endtime = time.time() + 120
-
-        while (time.time() < endtime and not success):
+        Usage:
 
-            success = self.send_request(server_address1, json_data)
+        >>> # Calling the method:
+        >>> self.log.generate_json(self.generate_dict(result, message))
+        """
+        json_data = json.dumps(dictionary)
 
-            if not success:
-                success = self.send_request(server_address2, json_data)
+        self.get_outbox().put(json_data)
 
-            time.sleep(10)
+    def get_outbox(self):
+        """
+        Returns the outbox of the execution logs, creating it on the first call.
+        """
+        if self.outbox is None:
+            folder = Path(self.folder, "new_log", "outbox") if self.folder else Path("Log", "outbox")
+            self.outbox = LogOutbox(folder, [self.config.logurl1, self.config.logurl2], self.save_json_file, self.save_response_log, config=self.config)
 
-        if not success:
-            self.save_json_file(json_data)
+        return self.outbox
 
-    def send_request(self, server_address, json_data):
+    def flush_json(self, timeout=None):
         """
-        Send a post request to server
-        """
-        success = False
-        response = None
-        headers = {'content-type': 'application/json'}
+        Waits for the logs of the outbox to be sent, saving the ones still waiting after the timeout with save_json_file.
 
-        try:
-            response = requests.post(server_address.strip(), data=json_data, headers=headers)
-        except:
-            pass
+        :param timeout: The deadline in seconds. - **Default:** None (LogFlushTimeout of config.json)
+        :type timeout: float
 
-        if response is not None:
-            if response.status_code == 200:
-                logger().debug("Log de execucao enviado com sucesso!")
-                success = True
-            elif response.status_code == 201 or response.status_code == 204:
-                logger().debug("Log de execucao enviado com sucesso!")
-                success = True
-            else:
-                self.save_response_log(response, server_address, json_data)
-                return False
-        else:
-            return False
+        Usage:
 
-        return success
+        >>> # Calling the method:
+        >>> self.log.flush_json()
+        """
+        if self.outbox is not None:
+            self.outbox.flush(self.config.log_flush_timeout if timeout is None else timeout)
 
     def save_response_log(self, response, server_address, json_data):
         """
@@ -509,4 +475,4 @@ class Log:
         >>> # Calling the method:
         >>> is_present = self.search_stack("MATA020")
         """
-        return len(list(filter(lambda x: x.function == function, inspect.stack()))) > 0
+        return test_context.in_call(function)
@@ -0,0 +1,359 @@
+import os
+import time
+import uuid
+import atexit
+import platform
+import threading
+import requests
+import psutil
+from tir.technologies.core.logging_config import logger
+from tir.technologies.core.http_client import http_client
+
+class LogOutbox():
+    """
+    Durable queue of the execution logs sent to the log server (LogUrl1 and LogUrl2).
+
+    Every log is written as a file in the outbox folder and a background thread sends the files
+    in the order they were written. A failed send is retried with an exponential backoff, trying
+    the urls in turn (starting by the last one that accepted a log), and the files waiting are sent
+    in batches over the same keep-alive connection of the HTTP client. A file is claimed by renaming
+    it with the host and process that is sending it, so processes sharing the folder don't send it
+    twice, and files claimed by a process that doesn't exist anymore are sent again.
+
+    A log the server answers with a client error (4xx), or with another error max_attempts times, is
+    rejected: the sender keeps draining the other files instead of waiting for it. The logs that can't
+    be delivered (no url configured, rejected, older than max_age or still waiting when flush reaches
+    its deadline) are handed to the dead_letter function, Log.save_json_file.
+
+    :param folder: The outbox folder.
+    :type folder: str
+    :param urls: The urls of the log server, in order of preference.
+    :type urls: List of str
+    :param dead_letter: Function called with the json of a log that can't be delivered.
+    :type dead_letter: function
+    :param rejected: Function called with the response, the url and the json when the server answers with an error. - **Default:** None
+    :type rejected: function
+    :param max_attempts: Error answers of the server before the log is rejected. - **Default:** 5
+    :type max_attempts: int
+    :param config: The configuration of the HTTP client. - **Default:** None (the config.json of the working directory)
+    :type config: ConfigLoader
+
+    Usage:
+
+    >>> # Instanced inside log.py:
+    >>> outbox = LogOutbox(folder, [url1, url2], self.save_json_file, self.save_response_log, config=self.config)
+    >>> outbox.put(json_data)
+    >>> outbox.flush(120)
+    """
+
+    success_codes = (200, 201, 204)
+    extension = ".json"
+    inflight = ".inflight"
+
+    def __init__(self, folder, urls, dead_letter, rejected=None, batch_size=20, max_backoff=60, max_age=86400, max_attempts=5, config=None):
+        self.folder = str(folder)
+        self.urls = list(filter(None, map(lambda x: x.strip(), urls)))
+        self.dead_letter = dead_letter
+        self.rejected = rejected
+        self.batch_size = batch_size
+        self.max_backoff = max_backoff
+        self.max_age = max_age
+        self.max_attempts = max_attempts
+        self.config = config
+        self.attempts = {}
+        self.owner = f"{platform.node()}_{os.getpid()}"
+        self.owned = set()
+        self.preferred = 0
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.retry = threading.Event()
+        self.stopping = threading.Event()
+        self.thread = None
+        self.sending = None
+        self.registered = False
+
+    def put(self, json_data):
+        """
+        Writes the log in the outbox and wakes the sender.
+
+        :param json_data: The json of the log.
+        :type json_data: str
+        """
+        if not self.urls:
+            self.dead_letter(json_data)
+            return
+
+        os.makedirs(self.folder, exist_ok=True)
+
+        name = f"{time.time_ns():020d}_{uuid.uuid4().hex}{self.extension}"
+        temp_path = os.path.join(self.folder, f".{name}.tmp")
+
+        with open(temp_path, mode="w", encoding="utf-8") as entry:
+            entry.write(json_data)
+            entry.flush()
+            os.fsync(entry.fileno())
+
+        os.replace(temp_path, os.path.join(self.folder, name))
+
+        with self.lock:
+            self.owned.add(name)
+
+        self.start()
+        self.wake.set()
+
+    def start(self):
+        """
+        Starts the sender thread if it isn't running.
+        """
+        with self.lock:
+            if self.thread is not None and self.thread.is_alive() and not self.stopping.is_set():
+                return
+
+            self.recover()
+            self.stopping.clear()
+            self.thread = threading.Thread(target=self.run, name="tir-log-outbox", daemon=True)
+            self.thread.start()
+
+            if not self.registered:
+                atexit.register(self.flush, 0)
+                self.registered = True
+
+    def run(self):
+        """
+        Sender loop: sends the waiting logs, batch after batch, and sleeps until a new log is written or the backoff is over.
+        """
+        backoff = 1
+
+        while not self.stopping.is_set():
+            self.wake.clear()
+
+            if self.drain():
+                backoff = 1
+                if not self.pending():
+                    self.wake.wait(5)
+            else:
+                logger().debug(f"Log server unavailable, retrying in {backoff} seconds")
+                self.retry.wait(backoff)
+                self.retry.clear()
+                backoff = min(backoff * 2, self.max_backoff)
+
+    def drain(self):
+        """
+        Sends up to batch_size waiting logs. Returns False if the log server couldn't receive a log.
+
+        The drain stops at the first log no url answered (the servers are unavailable), while a log
+        answered with an error goes back to the outbox (or to the dead letter, once rejected) and the
+        drain goes on with the next ones.
+        """
+        failed = False
+
+        for name in self.pending()[:self.batch_size]:
+            with self.lock:
+                if self.stopping.is_set():
+                    break
+
+                path = self.claim(name)
+                if path is None:
+                    continue
+
+                self.sending = name
+
+            try:
+                with open(path, encoding="utf-8") as entry:
+                    json_data = entry.read()
+
+                if time.time() - self.created(name) > self.max_age:
+                    self.dead_letter(json_data)
+                    self.done(name, path)
+                    continue
+
+                status = self.deliver(json_data)
+
+                if status in self.success_codes:
+                    self.done(name, path)
+                elif status is None:
+                    self.release(name)
+                    return False
+                elif 400 <= status < 500 or self.attempt(name) >= self.max_attempts:
+                    logger().debug(f"Log {name} rejected by the log server with status {status}")
+                    self.dead_letter(json_data)
+                    self.done(name, path)
+                else:
+                    self.release(name)
+                    failed = True
+            finally:
+                with self.lock:
+                    self.sending = None
+
+        return not failed
+
+    def deliver(self, json_data):
+        """
+        Posts the log to the urls, starting by the last one that accepted a log.
+
+        Returns the status code of the last answer, or None if no url answered. A client error (4xx)
+        is returned at once, as the other url would reject the same log.
+        """
+        headers = {'content-type': 'application/json'}
+        order = self.urls[self.preferred:] + self.urls[:self.preferred]
+        status = None
+
+        for url in order:
+            try:
+                response = http_client(self.config).post(url, data=json_data, headers=headers)
+            except requests.RequestException as e:
+                logger().debug(f"Log server {url} unavailable: {str(e)}")
+                continue
+
+            status = response.status_code
+
+            if status in self.success_codes:
+                logger().debug("Log de execucao enviado com sucesso!")
+                self.preferred = self.urls.index(url)
+                return status
+
+            if self.rejected:
+                self.rejected(response, url, json_data)
+
+            if 400 <= status < 500:
+                return status
+
+        return status
+
+    def attempt(self, name):
+        """
+        Counts an error answer to the log. Returns the error answers of the log in this process.
+        """
+        with self.lock:
+            self.attempts[name] = self.attempts.get(name, 0) + 1
+            return self.attempts[name]
+
+    def flush(self, timeout):
+        """
+        Waits up to timeout seconds for the logs written by this process to be sent,
+        then stops the sender and hands the logs still waiting to the dead letter function.
+
+        The log the sender is still posting is left to it: if the post fails, the log goes back
+        to the outbox and is sent by the next sender.
+
+        :param timeout: The deadline in seconds.
+        :type timeout: float
+        """
+        endtime = time.time() + timeout
+
+        self.wake.set()
+        self.retry.set()
+
+        while self.waiting() and time.time() < endtime:
+            time.sleep(0.1)
+
+        self.stopping.set()
+        self.wake.set()
+        self.retry.set()
+
+        if self.thread is not None:
+            self.thread.join(max(endtime - time.time(), 1))
+
+        with self.lock:
+            names = list(self.owned)
+
+        for name in sorted(names):
+            with self.lock:
+                if name == self.sending:
+                    continue
+                path = self.claim(name) or self.claimed(name)
+            if path is not None and os.path.exists(path):
+                with open(path, encoding="utf-8") as entry:
+                    self.dead_letter(entry.read())
+                self.done(name, path)
+
+        with self.lock:
+            self.owned.clear()
+
+    def waiting(self):
+        """
+        Returns the logs written by this process that weren't sent yet.
+        """
+        with self.lock:
+            for name in list(self.owned):
+                if not os.path.exists(os.path.join(self.folder, name)) and not os.path.exists(self.claimed(name)):
+                    self.owned.discard(name)
+            return list(self.owned)
+
+    def pending(self):
+        """
+        Returns the names of the logs waiting in the outbox, oldest first.
+        """
+        try:
+            return sorted(filter(lambda x: x.endswith(self.extension) and not x.startswith("."), os.listdir(self.folder)))
+        except OSError:
+            return []
+
+    def claimed(self, name):
+        """
+        Returns the path of the log claimed by this process.
+        """
+        return os.path.join(self.folder, f"{name}.{self.owner}{self.inflight}")
+
+    def claim(self, name):
+        """
+        Renames the log to the claimed name. Returns None if another process claimed it first.
+        """
+        path = self.claimed(name)
+        try:
+            os.rename(os.path.join(self.folder, name), path)
+            return path
+        except OSError:
+            return None
+
+    def release(self, name):
+        """
+        Gives the claimed log back to the outbox.
+        """
+        try:
+            os.rename(self.claimed(name), os.path.join(self.folder, name))
+        except OSError:
+            pass
+
+    def done(self, name, path):
+        """
+        Removes the sent (or dead lettered) log.
+        """
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+        with self.lock:
+            self.owned.discard(name)
+            self.attempts.pop(name, None)
+
+    def created(self, name):
+        """
+        Returns the time the log was written, from its name.
+        """
+        try:
+            return int(name.split("_")[0]) / 1e9
+        except ValueError:
+            return time.time()
+
+    def recover(self):
+        """
+        Gives back to the outbox the logs claimed by processes of this host that don't exist anymore.
+        """
+        host = platform.node()
+
+        try:
+            names = os.listdir(self.folder)
+        except OSError:
+            return
+
+        for name in filter(lambda x: x.endswith(self.inflight), names):
+            entry, _, owner = name[:-len(self.inflight)].partition(f"{self.extension}.")
+            owner_host, _, pid = owner.rpartition("_")
+
+            if owner_host == host and pid.isdigit() and owner != self.owner and not psutil.pid_exists(int(pid)):
+                try:
+                    os.rename(os.path.join(self.folder, name), os.path.join(self.folder, entry + self.extension))
+                except OSError:
+                    pass
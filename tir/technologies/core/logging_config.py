@@ -1,108 +1,150 @@
 import logging
+import logging.handlers
 from logging.config import dictConfig
 from tir.technologies.core.config import ConfigLoader
 from datetime import datetime
 from pathlib import Path
 import os
+import queue
 import socket
-import inspect
+from tir.technologies.core import test_context
+import atexit
+import threading
 
 
 config = ConfigLoader()
 
 filename = None
 folder = None
+listener = None
+configure_lock = threading.Lock()
 
 def logger(logger='root'):
     """
-    :return:
+    Returns the logger, configuring the logging once per process (see configure).
+
+    :return: The logger.
+    """
+    if listener is None:
+        configure()
+
+    return logging.getLogger(logger)
+
+def configure():
+    """
+    Configures the logging once per process.
+
+    The handlers of the configuration (console and, with SmartTest or DebugLog, the debug file) are
+    moved to a QueueListener thread and the root logger only puts the records in a queue, so the
+    test thread never waits for the console or the disk. The listener is stopped at exit (see shutdown).
     """
 
     global filename
     global folder
+    global listener
 
-    today = datetime.today()
+    with configure_lock:
+        if listener is not None:
+            return
 
-    if not filename:
-        filename = f"TIR_{get_file_name('testsuite')}_{today.strftime('%Y%m%d%H%M%S%f')[:-3]}.log"
+        today = datetime.today()
 
-        folder = create_folder()
+        if not filename:
+            filename = f"TIR_{get_file_name('testsuite')}_{today.strftime('%Y%m%d%H%M%S%f')[:-3]}.log"
 
-    if config.smart_test or config.debug_log:
-        logging_config = {
-            'version': 1,
-            'loggers': {
-                'root': {  # root logger
-                    'level': 'DEBUG',
-                    'handlers': ['debug_console_handler', 'debug_file_handler']
-                },
-            },
-            'handlers': {
-                'debug_console_handler': {
-                    'level': 'DEBUG',
-                    'formatter': 'info',
-                    'class': 'logging.StreamHandler',
-                    'stream': 'ext://sys.stdout',
+            folder = create_folder()
+
+        if config.smart_test or config.debug_log:
+            logging_config = {
+                'version': 1,
+                'loggers': {
+                    'root': {  # root logger
+                        'level': 'DEBUG',
+                        'handlers': ['debug_console_handler', 'debug_file_handler']
+                    },
                 },
-                'debug_file_handler': {
-                    'level': 'DEBUG',
-                    'formatter': 'info',
-                    'filename': Path(folder, filename),
-                    'class': 'logging.FileHandler',
-                    'mode': 'a'
+                'handlers': {
+                    'debug_console_handler': {
+                        'level': 'DEBUG',
+                        'formatter': 'info',
+                        'class': 'logging.StreamHandler',
+                        'stream': 'ext://sys.stdout',
+                    },
+                    'debug_file_handler': {
+                        'level': 'DEBUG',
+                        'formatter': 'info',
+                        'filename': Path(folder, filename),
+                        'class': 'logging.FileHandler',
+                        'mode': 'a'
+                    },
                 },
-            },
-            'formatters': {
-                'info': {
-                    'format': '%(asctime)s-%(levelname)s-%(name)s-%(process)d::%(module)s::%(funcName)s|%(lineno)s:: %(message)s'
+                'formatters': {
+                    'info': {
+                        'format': '%(asctime)s-%(levelname)s-%(name)s-%(process)d::%(module)s::%(funcName)s|%(lineno)s:: %(message)s'
+                    },
                 },
-            },
-        }
+            }
 
-    else:
+        else:
 
-        logging_config = {
-            'version': 1,
-            'loggers': {
-                'root': {  # root logger
-                    'level': 'INFO',
-                    'handlers': ['debug_console_handler']
+            logging_config = {
+                'version': 1,
+                'loggers': {
+                    'root': {  # root logger
+                        'level': 'INFO',
+                        'handlers': ['debug_console_handler']
+                    },
                 },
-            },
-            'handlers': {
-                'debug_console_handler': {
-                    'level': 'INFO',
-                    'formatter': 'info',
-                    'class': 'logging.StreamHandler',
-                    'stream': 'ext://sys.stdout',
+                'handlers': {
+                    'debug_console_handler': {
+                        'level': 'INFO',
+                        'formatter': 'info',
+                        'class': 'logging.StreamHandler',
+                        'stream': 'ext://sys.stdout',
+                    },
                 },
-            },
-            'formatters': {
-                'info': {
-                    'format': '%(asctime)s-%(levelname)s:: %(message)s'
+                'formatters': {
+                    'info': {
+                        'format': '%(asctime)s-%(levelname)s:: %(message)s'
+                    },
                 },
-            },
-        }
+            }
 
-    dictConfig(logging_config)
-    return logging.getLogger(logger)
+        dictConfig(logging_config)
 
-def get_file_name(file_name):
+        root = logging.getLogger('root')
+        handlers = list(root.handlers)
+        records = queue.Queue(-1)
+
+        for handler in handlers:
+            root.removeHandler(handler)
+        root.addHandler(logging.handlers.QueueHandler(records))
+
+        listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(shutdown)
+
+def shutdown():
     """
-    Returns a Testsuite name
+    Stops the QueueListener thread, writing the records still in the queue, and gives the handlers
+    back to the root logger, so the records logged after it are written synchronously.
     """
-    testsuite_stack = next(iter(list(filter(lambda x: file_name in x.filename.lower(), inspect.stack()))), None)
+    with configure_lock:
+        root = logging.getLogger('root')
+        queue_handlers = list(filter(lambda x: isinstance(x, logging.handlers.QueueHandler), root.handlers))
 
-    if testsuite_stack:
+        if listener is not None and queue_handlers:
+            for handler in queue_handlers:
+                root.removeHandler(handler)
+            listener.stop()
+            for handler in listener.handlers:
+                root.addHandler(handler)
 
-        if '/' in testsuite_stack.filename:
-            split_character = '/'
-        else:
-            split_character = '\\'
-
-        return testsuite_stack.filename.split(split_character)[-1].split(".")[0]
-    else:
-        return ""
+def get_file_name(file_name):
+    """
+    Returns a Testsuite name
+    """
+    return test_context.file_name(file_name)
 
 def create_folder():
     """
@@ -125,3 +167,62 @@ def create_folder():
         pass
 
     return path
+
+def benchmark(calls=2000):
+    """
+    Compares the cost of a logger().debug call configuring the logging on every call, as it was done
+    before, against the configure once, queue backed logger. Both write to the console (redirected
+    to os.devnull) and to a debug file in a temporary folder.
+
+    Must be called in a new process, since it configures the logging of the process.
+
+    Returns the (original, current) cost of each call in seconds.
+
+    Usage:
+
+    >>> original, current = benchmark(calls=100)
+    """
+    import time
+    import tempfile
+    import contextlib
+
+    global filename
+    global folder
+
+    folder = tempfile.mkdtemp()
+    filename = "benchmark.log"
+    config.debug_log = True
+
+    logging_config = {
+        'version': 1,
+        'loggers': {'root': {'level': 'DEBUG', 'handlers': ['debug_console_handler', 'debug_file_handler']}},
+        'handlers': {
+            'debug_console_handler': {'level': 'DEBUG', 'formatter': 'info', 'class': 'logging.StreamHandler', 'stream': 'ext://sys.stdout'},
+            'debug_file_handler': {'level': 'DEBUG', 'formatter': 'info', 'filename': Path(folder, "original.log"), 'class': 'logging.FileHandler', 'mode': 'a'},
+        },
+        'formatters': {'info': {'format': '%(asctime)s-%(levelname)s-%(name)s-%(process)d::%(module)s::%(funcName)s|%(lineno)s:: %(message)s'}},
+    }
+
+    def original_logger():
+        dictConfig(logging_config)
+        return logging.getLogger('root')
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        for call in range(calls):
+            original_logger().debug(f"Benchmark call {call}")
+        original = (time.perf_counter() - start) / calls
+
+        for handler in list(logging.getLogger('root').handlers):
+            handler.close()
+            logging.getLogger('root').removeHandler(handler)
+
+        logger()
+        start = time.perf_counter()
+        for call in range(calls):
+            logger().debug(f"Benchmark call {call}")
+        current = (time.perf_counter() - start) / calls
+
+        shutdown()
+
+    return original, current
@@ -1,54 +1,325 @@
 from tir.technologies.core.config import ConfigLoader
-import requests
+from tir.technologies.core.http_client import http_client
+from concurrent import futures
+from pathlib import Path
+import os
 import json
 import time
+import uuid
+import random
+import platform
+import threading
+import psutil
 from tir.technologies.core.logging_config import logger
 
 
 class NumExec(ConfigLoader):
+    """
+    Sends the start and end of the execution (UrlSetStartExec and UrlSetEndExec) to the registration server.
+
+    The notifications are sent by background threads, retrying with a jittered exponential backoff, so the
+    test never waits for the server. Each notification waits for the previous one of the instance, so the
+    server receives the start before the end, and a notification whose previous one wasn't received is
+    left for the replay. Every notification is saved in the num_exec folder of the log folder before it's
+    sent and removed when the server receives it, so the notifications that failed (or whose process ended
+    before they were sent) are sent again, in order, by the next notification (see replay).
+
+    Usage:
+
+    >>> # Instanced inside webapp_internal.py:
+    >>> self.num_exec = NumExec()
+    >>> start = self.num_exec.post_exec(self.config.url_set_start_exec)
+    >>> end = self.num_exec.post_exec(self.config.url_set_end_exec, end=True)
+    >>> NumExec.wait([start, end], 30)
+    """
+
+    success_response = [200, 201]
+
+    active = set()
+    active_lock = threading.Lock()
 
     def __init__(self):
         super().__init__()
+        self.folder = Path(self.log_folder if self.log_folder else "Log", "num_exec")
+        self.owner = f"{platform.node()}_{os.getpid()}"
+        self.previous = None
+        self.previous_lock = threading.Lock()
 
-    def post_exec(self, url):
+    def post_exec(self, url, timeout=120, end=False):
+        """
+        Sends the notification in background, after the previous notification of the instance.
 
-        success_response = [200, 201]
+        :param url: The url of the registration server.
+        :type url: str
+        :param timeout: Seconds retrying the notification before it's left for the replay. - **Default:** 120
+        :type timeout: float
+        :param end: True for the end of the execution (UrlSetEndExec). - **Default:** False
+        :type end: bool
 
-        status = None
+        :return: Future with True if the server received the notification.
+        :rtype: concurrent.futures.Future
 
-        endtime = time.time() + 120
+        Usage:
 
-        error = None
+        >>> # Calling the method:
+        >>> future = self.num_exec.post_exec(self.config.url_set_end_exec, end=True)
+        """
+        future = futures.Future()
+        future.set_running_or_notify_cancel()
 
-        id_error = time.strftime("%Y%m%d%H%M%S")
+        data = {'num_exec': self.num_exec, 'ip_exec': self.ipExec}
+        path = self.save_pending(url, data, end)
+
+        with self.previous_lock:
+            previous, self.previous = self.previous, future
+
+        threading.Thread(target=self.run_exec, args=(future, previous, path, url, data, end, time.time() + timeout), name="tir-num-exec", daemon=True).start()
+
+        return future
+
+    @staticmethod
+    def wait(pending, timeout):
+        """
+        Waits up to timeout seconds for the notifications.
+
+        :param pending: The futures returned by post_exec.
+        :type pending: List of concurrent.futures.Future
+        :param timeout: The deadline in seconds.
+        :type timeout: float
+
+        :return: False if the server didn't receive a notification. The notifications still being sent aren't considered.
+        :rtype: bool
+        """
+        done, not_done = futures.wait(pending, timeout=timeout)
+
+        if not_done:
+            logger().debug(f"{len(not_done)} num_exec notification(s) still being sent in background")
+
+        return all(map(lambda x: x.exception() is None and x.result(), done))
 
-        while(time.time() < endtime and status not in success_response):
+    def run_exec(self, future, previous, path, url, data, end, endtime):
+        """
+        [Internal]
+
+        Waits for the previous notification and sends this one, sets the result of the future and
+        replays the notifications that failed before. If the server didn't receive the previous
+        notification, this one is sent by the replay, after the previous one.
+        """
+        result = False
+
+        try:
+            if self.delivered(previous):
+                result = self.send_exec(path, url, data, end, endtime)
+            else:
+                logger().debug(f"num_exec notification {path.name} left for the replay of the previous one")
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with self.active_lock:
+                self.active.discard(path.name)
+
+        if result:
+            future.set_result(result)
+
+        received = self.replay()
+
+        if not future.done():
+            future.set_result(path.name in received)
+
+    @staticmethod
+    def delivered(previous):
+        """
+        [Internal]
+
+        Waits for the previous notification. Returns True if there isn't one or the server received it.
+        """
+        if previous is None:
+            return True
+
+        futures.wait([previous])
+
+        return previous.exception() is None and previous.result()
+
+    def send_exec(self, path, url, data, end, endtime):
+        """
+        [Internal]
+
+        Sends the notification until the server receives it or the endtime, waiting a random time
+        between zero and the exponential backoff (up to 12 seconds) between the attempts.
+        """
+        status = None
+        error = None
+        attempt = 0
+        id_error = time.strftime("%Y%m%d%H%M%S")
 
+        while status not in self.success_response:
             try:
-                status = self.send_request(url)
+                status = self.send_request(url, data)
             except Exception as e:
                 error = str(e)
 
-            time.sleep(12)
+            delay = random.uniform(0, min(12, 2 ** attempt))
+            attempt += 1
+
+            if status in self.success_response or time.time() + delay >= endtime:
+                break
+
+            time.sleep(delay)
 
         response = str(f"STATUS: {status} Url: {url} ID: {id_error} Error: {error}")
         logger().debug(response)
-        if status not in success_response:
-            with open(f"{self.log_folder}\{id_error}_json_data_response.txt", "w") as json_log:
+
+        if status in self.success_response:
+            self.remove_pending(path)
+            if end:
+                self.discard_starts(data.get("num_exec"), path.name)
+        else:
+            with open(Path(self.folder, f"{id_error}_json_data_response.txt"), "w") as json_log:
                 json_log.write(response)
 
-        return status in success_response
+        return status in self.success_response
+
+    def replay(self):
+        """
+        Sends again (once) the notifications saved in the num_exec folder that failed in this process
+        or whose process of this host ended. A notification is taken by renaming it with the
+        host and process id, so two processes don't send it at the same time.
+
+        The notifications are sent in the order they were saved, and the ones of a num_exec whose
+        earlier notification is still being sent (or failed again) are kept for the next replay.
 
-    def send_request(self, url):
+        :return: The names of the notifications received by the server.
+        :rtype: set
+        """
+        received = set()
+        blocked = set()
+
+        try:
+            names = sorted(filter(lambda x: x.endswith(".json"), os.listdir(self.folder)))
+        except OSError:
+            return received
+
+        for name in names:
+            stamp, _, rest = name[:-len(".json")].partition("_")
+            owner = rest.rpartition("_")[0]
+            owner_host, _, pid = owner.rpartition("_")
+
+            pending = self.read_pending(Path(self.folder, name))
+            if pending is None:
+                continue
+
+            num_exec = pending["data"].get("num_exec")
+
+            with self.active_lock:
+                if num_exec in blocked:
+                    continue
+                if owner_host != platform.node() or not pid.isdigit():
+                    continue
+                if name in self.active or (owner != self.owner and psutil.pid_exists(int(pid))):
+                    blocked.add(num_exec)
+                    continue
+
+                path = Path(self.folder, f"{stamp}_{self.owner}_{uuid.uuid4().hex}.json")
+                try:
+                    os.rename(Path(self.folder, name), path)
+                except OSError:
+                    blocked.add(num_exec)
+                    continue
+                self.active.add(path.name)
+
+            try:
+                logger().debug(f"Replaying num_exec notification {name}")
+                if self.send_exec(path, pending["url"], pending["data"], pending.get("end", False), time.time()):
+                    received.add(name)
+                else:
+                    blocked.add(num_exec)
+            except (OSError, ValueError, KeyError):
+                blocked.add(num_exec)
+            finally:
+                with self.active_lock:
+                    self.active.discard(path.name)
+
+        return received
+
+    def discard_starts(self, num_exec, end_name):
+        """
+        [Internal]
+
+        Removes the starts of the num_exec saved before its end (end_name) still waiting for the
+        replay, once the end was received, so a start is never sent after its end.
+        """
+        saved = lambda name: int(name.partition("_")[0]) if name.partition("_")[0].isdigit() else 0
+
+        try:
+            names = os.listdir(self.folder)
+        except OSError:
+            return
+
+        for name in filter(lambda x: x.endswith(".json"), names):
+            path = Path(self.folder, name)
+            pending = self.read_pending(path)
+
+            with self.active_lock:
+                if (pending is not None and not pending.get("end", False) and pending["data"].get("num_exec") == num_exec
+                        and saved(name) < saved(end_name) and name not in self.active):
+                    logger().debug(f"Discarding num_exec notification {name}, its end was received")
+                    self.remove_pending(path)
+
+    def read_pending(self, path):
+        """
+        [Internal]
+
+        Returns the notification saved in the file or None if it can't be read.
+        """
+        try:
+            with open(path, encoding="utf-8") as pending_file:
+                pending = json.load(pending_file)
+            return pending if isinstance(pending.get("data"), dict) and "url" in pending else None
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def save_pending(self, url, data, end=False):
+        """
+        [Internal]
+
+        Saves the notification in the num_exec folder before it's sent.
+        """
+        os.makedirs(self.folder, exist_ok=True)
+
+        path = Path(self.folder, f"{time.time_ns():020d}_{self.owner}_{uuid.uuid4().hex}.json")
+        temp_path = Path(self.folder, f".{path.name}.tmp")
+
+        with open(temp_path, "w", encoding="utf-8") as pending_file:
+            json.dump({"url": url, "data": data, "end": end}, pending_file)
+
+        with self.active_lock:
+            self.active.add(path.name)
+            os.replace(temp_path, path)
+
+        return path
+
+    def remove_pending(self, path):
+        """
+        [Internal]
+
+        Removes the notification received by the server.
+        """
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def send_request(self, url, data=None):
         """
 
         :return json status response:
         """
 
-        data = {'num_exec': self.num_exec, 'ip_exec': self.ipExec}
+        if data is None:
+            data = {'num_exec': self.num_exec, 'ip_exec': self.ipExec}
 
-        response = requests.post(url.strip(), json=data)
+        response = http_client(self).post(url, json_data=data)
 
         json_data = json.loads(response.text)
 
-        return json_data["status"]
\ No newline at end of file
+        return json_data["status"]
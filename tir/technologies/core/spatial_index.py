@@ -0,0 +1,182 @@
+from math import sqrt, floor
+
+class SpatialIndex():
+    """
+    Grid bucket index of element positions used to find the element nearest to a label.
+
+    The queries follow the rules of the field search of WebappInternal.search_element_position
+    (the tolerances of each direction and the order used to break ties: the lowest index wins),
+    but only visit the buckets around the label. Up to linear_limit positions are scanned one by one, and the
+    buckets are at least min_bucket_size pixels wide, so a few positions (or positions at the same place)
+    far from the label don't make the queries walk thousands of empty buckets.
+
+    :param positions: List of (index, position) tuples, where position is a dict with the keys x and y.
+    :type positions: List of tuple
+    :param bucket_size: The side of each bucket. - **Default:** None (computed from the area and the number of positions, at least min_bucket_size)
+    :type bucket_size: float
+
+    Usage:
+
+    >>> index = SpatialIndex([(0, {'x': 10, 'y': 10}), (1, {'x': 200, 'y': 12})])
+    >>> index.nearest({'x': 100, 'y': 10}, direction='right', width_safe=5, height_safe=5)
+    1
+    """
+
+    linear_limit = 16
+    min_bucket_size = 16
+
+    def __init__(self, positions, bucket_size=None):
+        self.buckets = {}
+        self.positions = [(index, position['x'], position['y']) for index, position in positions]
+        self.size = len(positions)
+
+        if not positions:
+            self.bucket_size = 1
+            self.limits = (0, 0, 0, 0)
+            return
+
+        xs = [position['x'] for _, position in positions]
+        ys = [position['y'] for _, position in positions]
+
+        if bucket_size is None:
+            area = max(max(xs) - min(xs), 1) * max(max(ys) - min(ys), 1)
+            bucket_size = max(sqrt(area / len(positions)), self.min_bucket_size)
+
+        self.bucket_size = bucket_size
+
+        for index, position in positions:
+            key = (self.bucket(position['x']), self.bucket(position['y']))
+            self.buckets.setdefault(key, []).append((index, position['x'], position['y']))
+
+        self.limits = (self.bucket(min(xs)), self.bucket(max(xs)), self.bucket(min(ys)), self.bucket(max(ys)))
+
+    def bucket(self, value):
+        """
+        Returns the bucket coordinate of a value.
+        """
+        return int(floor(value / self.bucket_size))
+
+    def nearest(self, origin, direction=None, width_safe=0, height_safe=0):
+        """
+        Returns the index of the position nearest to the origin in the direction or None if there isn't one.
+
+        :param origin: The position of the label, a dict with the keys x and y.
+        :type origin: dict
+        :param direction: None, 'right' or 'down'.
+        :type direction: str
+        :param width_safe: The horizontal tolerance.
+        :type width_safe: float
+        :param height_safe: The vertical tolerance.
+        :type height_safe: float
+
+        :rtype: int
+        """
+        if not self.size:
+            return None
+
+        if self.size <= self.linear_limit:
+            return self.nearest_linear(origin, direction, width_safe, height_safe)
+
+        if not direction:
+            return self.nearest_any(origin, width_safe, height_safe)
+        elif direction.lower() == 'right':
+            return self.nearest_axis(origin['x'], origin['y'], height_safe, horizontal=True)
+        elif direction.lower() == 'down':
+            return self.nearest_axis(origin['y'], origin['x'], width_safe, horizontal=False)
+
+    def nearest_linear(self, origin, direction, width_safe, height_safe):
+        """
+        Scans every position, with the filters and distances of the bucket queries.
+        """
+        best = None
+        for index, x, y in self.positions:
+            if not direction:
+                if y + width_safe >= origin['y'] and x + height_safe >= origin['x']:
+                    candidate = (sqrt(pow(x - origin['x'], 2) + pow(y - origin['y'], 2)), index)
+                else:
+                    continue
+            elif direction.lower() == 'right':
+                if x > origin['x'] and origin['y'] - height_safe <= y <= origin['y'] + height_safe:
+                    candidate = (x - origin['x'], index)
+                else:
+                    continue
+            elif direction.lower() == 'down':
+                if y > origin['y'] and origin['x'] - width_safe <= x <= origin['x'] + width_safe:
+                    candidate = (y - origin['y'], index)
+                else:
+                    continue
+            else:
+                return None
+
+            if best is None or candidate < best:
+                best = candidate
+
+        return best[1] if best else None
+
+    def nearest_axis(self, start, center, tolerance, horizontal):
+        """
+        Walks the buckets along one axis (right or down) inside the band of tolerance around center.
+        """
+        min_x, max_x, min_y, max_y = self.limits
+        first, last = (min_x, max_x) if horizontal else (min_y, max_y)
+        low, high = (min_y, max_y) if horizontal else (min_x, max_x)
+        band = range(max(self.bucket(center - tolerance), low), min(self.bucket(center + tolerance), high) + 1)
+
+        best = None
+        for step in range(max(self.bucket(start), first), last + 1):
+            for cross in band:
+                key = (step, cross) if horizontal else (cross, step)
+                for index, x, y in self.buckets.get(key, ()):
+                    along, across = (x, y) if horizontal else (y, x)
+                    if along > start and center - tolerance <= across <= center + tolerance:
+                        candidate = (along - start, index)
+                        if best is None or candidate < best:
+                            best = candidate
+
+            if best is not None and best[0] < (step + 1) * self.bucket_size - start:
+                break
+
+        return best[1] if best else None
+
+    def nearest_any(self, origin, width_safe, height_safe):
+        """
+        Walks rings of buckets around the origin, keeping only the positions below or at the right of the label.
+        """
+        min_x, max_x, min_y, max_y = self.limits
+        origin_x, origin_y = self.bucket(origin['x']), self.bucket(origin['y'])
+        first_x = max(self.bucket(origin['x'] - height_safe), min_x)
+        first_y = max(self.bucket(origin['y'] - width_safe), min_y)
+        radius_first = max(min_x - origin_x, origin_x - max_x, min_y - origin_y, origin_y - max_y, 0)
+        radius_limit = max(abs(origin_x - min_x), abs(origin_x - max_x), abs(origin_y - min_y), abs(origin_y - max_y))
+
+        best = None
+        for radius in range(radius_first, radius_limit + 1):
+            for bx, by in self.ring(origin_x, origin_y, radius, (first_x, max_x, first_y, max_y)):
+                for index, x, y in self.buckets.get((bx, by), ()):
+                    if y + width_safe >= origin['y'] and x + height_safe >= origin['x']:
+                        candidate = (sqrt(pow(x - origin['x'], 2) + pow(y - origin['y'], 2)), index)
+                        if best is None or candidate < best:
+                            best = candidate
+
+            if best is not None and best[0] <= radius * self.bucket_size:
+                break
+
+        return best[1] if best else None
+
+    def ring(self, center_x, center_y, radius, limits):
+        """
+        Returns the buckets at the given Chebyshev distance of the center bucket, inside the limits (first_x, last_x, first_y, last_y).
+        """
+        first_x, last_x, first_y, last_y = limits
+
+        if not radius:
+            return [(center_x, center_y)] if first_x <= center_x <= last_x and first_y <= center_y <= last_y else []
+
+        ring = []
+        for bx in (center_x - radius, center_x + radius):
+            if first_x <= bx <= last_x:
+                ring.extend((bx, by) for by in range(max(center_y - radius, first_y), min(center_y + radius, last_y) + 1))
+        for by in (center_y - radius, center_y + radius):
+            if first_y <= by <= last_y:
+                ring.extend((bx, by) for bx in range(max(center_x - radius + 1, first_x), min(center_x + radius - 1, last_x) + 1))
+        return ring
@@ -0,0 +1,208 @@
+import os
+import csv
+import sqlite3
+import hashlib
+import tempfile
+import threading
+from tir.technologies.core.logging_config import logger
+
+class Sx3Store():
+    """
+    Indexed store of the SX3 dictionary (sx3.csv) used by the grid methods.
+
+    The csv file is compiled once into a sqlite file in a cache folder shared by every process.
+    The compiled file is rebuilt only when the size, modification time and content hash of the
+    csv file change, and it is replaced atomically so concurrent processes never read a partial file.
+
+    :param csv_path: The path of the sx3.csv file.
+    :type csv_path: str
+    :param cache_folder: The folder of the compiled file. - **Default:** None (the "tir" folder in the temporary folder)
+    :type cache_folder: str
+
+    Usage:
+
+    >>> # Getting the store of a csv file:
+    >>> store = Sx3Store.get(path)
+    >>> types, sizes, titles = store.lookup(["A1_COD", "A1_NOME"], "pt-br")
+    """
+
+    columns = ['Campo', 'Tipo', 'Tamanho', 'Titulo', 'Titulo_Spa', 'Titulo_Eng']
+
+    titles_by_language = {
+        "es-es": "Titulo_Spa",
+        "en-us": "Titulo_Eng",
+    }
+
+    stores = {}
+    stores_lock = threading.Lock()
+
+    @classmethod
+    def get(cls, csv_path, cache_folder=None):
+        """
+        Returns the store of the csv file, shared by the whole process.
+        """
+        key = (os.path.abspath(csv_path), cache_folder)
+        with cls.stores_lock:
+            if key not in cls.stores:
+                cls.stores[key] = cls(csv_path, cache_folder)
+            return cls.stores[key]
+
+    def __init__(self, csv_path, cache_folder=None):
+        self.csv_path = os.path.abspath(csv_path)
+        self.cache_folder = cache_folder if cache_folder else os.path.join(tempfile.gettempdir(), "tir")
+        name = hashlib.sha1(self.csv_path.encode("utf-8")).hexdigest()[:16]
+        self.db_path = os.path.join(self.cache_folder, f"sx3_{name}.sqlite")
+        self.lock = threading.Lock()
+        self.connection = None
+        self.stamp = None
+
+    def lookup(self, fields, language):
+        """
+        Returns the same dictionaries of get_x3_dictionaries: field to type, field to size and field to title.
+
+        Only the fields whose prefix (the text before "_") is one of the prefixes of *fields* are returned.
+        If no field has a prefix, every field of type C, N or D is returned.
+
+        :param fields: List of fields.
+        :type fields: List of str
+        :param language: The language of the titles.
+        :type language: str
+
+        :return: The three dictionaries in a Tuple.
+        :rtype: Tuple of Dictionary
+        """
+        prefixes = sorted(set(map(lambda x: x.split("_")[0] + "_", filter(lambda x: "_" in x, fields))))
+        title = self.titles_by_language.get(language, "Titulo")
+
+        query = f"SELECT Campo, Tipo, Tamanho, {title} FROM sx3"
+        if prefixes:
+            query += f" WHERE Prefixo IN ({','.join('?' * len(prefixes))})"
+        else:
+            query += " WHERE Tipo IN ('C', 'N', 'D')"
+
+        with self.lock:
+            rows = self.open().execute(query, prefixes).fetchall()
+
+        types, sizes, titles = {}, {}, {}
+        for field, field_type, size, field_title in rows:
+            types[field] = field_type
+            sizes[field] = size
+            titles[field] = field_title
+
+        return (types, sizes, titles)
+
+    def open(self):
+        """
+        Returns the connection to the compiled file, compiling it again if the csv file changed.
+        """
+        stat = os.stat(self.csv_path)
+        stamp = (stat.st_size, stat.st_mtime_ns)
+
+        if self.connection is not None and self.stamp == stamp:
+            return self.connection
+
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+        connection = self.connect_compiled(stamp)
+        if connection is None:
+            self.compile()
+            connection = self.connect_compiled(stamp)
+
+        self.connection = connection
+        self.stamp = stamp
+        return connection
+
+    def connect_compiled(self, stamp):
+        """
+        Connects to the compiled file if it was compiled from the current csv file.
+
+        When only the modification time changed (the content hash is the same), the new stamp is
+        stored, so the next processes don't hash the csv file again.
+        """
+        if not os.path.isfile(self.db_path):
+            return None
+
+        try:
+            connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            meta = dict(connection.execute("SELECT key, value FROM meta").fetchall())
+        except sqlite3.Error:
+            return None
+
+        if (meta.get("size"), meta.get("mtime")) == tuple(map(str, stamp)):
+            return connection
+
+        if meta.get("sha256") == self.csv_hash():
+            try:
+                connection.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)", [("size", str(stamp[0])), ("mtime", str(stamp[1]))])
+                connection.commit()
+            except sqlite3.Error as e:
+                logger().debug(f"Warning couldn't update the stamp of {self.db_path}: {str(e)}")
+            return connection
+
+        connection.close()
+        return None
+
+    def csv_hash(self):
+        """
+        Returns the sha256 of the csv file.
+        """
+        sha = hashlib.sha256()
+        with open(self.csv_path, "rb") as csv_file:
+            for block in iter(lambda: csv_file.read(1024 * 1024), b""):
+                sha.update(block)
+        return sha.hexdigest()
+
+    def compile(self):
+        """
+        Compiles the csv file into a temporary sqlite file and moves it over the compiled file.
+
+        Lines with more columns than expected are skipped, as pandas does with error_bad_lines=False.
+        """
+        logger().debug(f"Compiling {self.csv_path} into {self.db_path}")
+
+        os.makedirs(self.cache_folder, exist_ok=True)
+        stat = os.stat(self.csv_path)
+        sha = self.csv_hash()
+
+        handle, temp_path = tempfile.mkstemp(prefix="sx3_", suffix=".tmp", dir=self.cache_folder)
+        os.close(handle)
+
+        try:
+            connection = sqlite3.connect(temp_path)
+            connection.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+            connection.execute("CREATE TABLE sx3 (Campo TEXT PRIMARY KEY, Prefixo TEXT, Tipo TEXT, Tamanho, Titulo TEXT, Titulo_Spa TEXT, Titulo_Eng TEXT)")
+
+            with open(self.csv_path, newline="", encoding="latin-1") as csv_file:
+                connection.executemany("INSERT OR REPLACE INTO sx3 VALUES (?, ?, ?, ?, ?, ?, ?)", self.read_rows(csv_file))
+
+            connection.execute("CREATE INDEX sx3_prefix ON sx3 (Prefixo)")
+            connection.executemany("INSERT INTO meta VALUES (?, ?)", [("size", str(stat.st_size)), ("mtime", str(stat.st_mtime_ns)), ("sha256", sha)])
+            connection.commit()
+            connection.close()
+
+            os.replace(temp_path, self.db_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def read_rows(self, csv_file):
+        """
+        Yields the rows of the csv file as they are stored in the compiled file.
+        """
+        for row in csv.reader(csv_file, delimiter=";"):
+            if not row or len(row) > len(self.columns) + 1:
+                continue
+
+            row = (row + [None] * len(self.columns))[:len(self.columns)]
+            field, field_type, size = row[0].strip(), row[1], row[2]
+
+            if size is not None:
+                size = size.strip()
+                size = int(size) if size.isdigit() else (size or None)
+
+            titles = map(lambda x: x.strip() if x is not None else None, row[3:6])
+            prefix = field.split("_")[0] + "_" if "_" in field else None
+
+            yield (field, prefix, field_type, size, *titles)
@@ -0,0 +1,206 @@
+"""
+Tracks the test being executed (suite file, test method and TIR methods in progress) with context variables,
+so the log doesn't need to search the call stack.
+
+The variables are set by the hooks installed (see install) in the run and tearDownClass methods of the test
+class that creates the TIR object, and by the tracked decorator of the TIR methods searched in the call stack.
+Outside of these methods (ex: in setUpClass, which is running when the hooks are installed, or with other
+runners), the functions fall back to a walk of the frames with sys._getframe, which doesn't read the source
+lines as inspect.stack does.
+"""
+
+import re
+import sys
+import functools
+import unittest
+from contextvars import ContextVar
+
+hooked = ContextVar("tir_hooked", default=False)
+current_test = ContextVar("tir_current_test", default=None)
+current_file = ContextVar("tir_current_file", default=None)
+current_calls = ContextVar("tir_current_calls", default=())
+runner_suite = ContextVar("tir_runner_suite", default=None)
+
+tracked_methods = ("TearDown", "AssertFalse", "CheckResult", "log_error")
+class_methods = ("setUpClass", "tearDownClass")
+
+installed = set()
+
+def frames():
+    """
+    Yields the frames of the call stack, from the caller of this function to the outermost one.
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        yield frame
+        frame = frame.f_back
+
+def tracked(function):
+    """
+    Decorator of the TIR methods searched in the call stack (tracked_methods), which keeps
+    their names in current_calls while they are executed.
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        token = current_calls.set(current_calls.get() + (function.__name__,))
+        try:
+            return function(*args, **kwargs)
+        finally:
+            current_calls.reset(token)
+    return wrapper
+
+def in_call(function):
+    """
+    Returns True if the function is being executed (is present in the call stack).
+
+    :param function: Name of the function
+    :type function: str
+
+    :rtype: bool
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> is_present = in_call("TearDown")
+    """
+    if function in tracked_methods or (function in class_methods and hooked.get()):
+        return function in current_calls.get()
+
+    return any(map(lambda x: x.f_code.co_name == function, frames()))
+
+def testcase(pattern="setUpClass|test_"):
+    """
+    Returns the name of the test method (or setUpClass) being executed if it matches the pattern, otherwise None.
+
+    :param pattern: Regular expression of the name. - **Default:** "setUpClass|test_"
+    :type pattern: str
+
+    :rtype: str
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> ct_method = testcase()
+    """
+    if hooked.get():
+        name = current_test.get()
+        return name if name and re.search(pattern, name) else None
+
+    return next(iter(filter(lambda x: re.search(pattern, x), map(lambda x: x.f_code.co_name, frames()))), None)
+
+def file_name(name):
+    """
+    Returns the name (without the extension) of the test file whose path contains name, ex: "testsuite", or an empty string.
+
+    :param name: Part of the file name, in lower case.
+    :type name: str
+
+    :rtype: str
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> suite = file_name("testsuite")
+    """
+    path = current_file.get()
+
+    if not path or name not in path.lower():
+        path = next(iter(filter(lambda x: name in x.lower(), map(lambda x: x.f_code.co_filename, frames()))), None)
+
+    if path:
+        split_character = '/' if '/' in path else '\\'
+        return path.split(split_character)[-1].split(".")[0]
+
+    return ""
+
+def testcases():
+    """
+    Returns the test cases of the suite being executed by the unittest runner that weren't executed yet.
+
+    :rtype: List of unittest.TestCase
+    """
+    suite = runner_suite.get()
+
+    if suite is None:
+        runner = next(iter(filter(lambda x: "runner.py" in x.f_code.co_filename, frames())), None)
+        suite = runner.f_locals.get('test') if runner else None
+
+    try:
+        return list(filter(lambda x: x is not None, list(suite._tests))) if suite is not None else []
+    except AttributeError:
+        return []
+
+def class_file(test_class):
+    """
+    Returns the path of the module of a test class.
+    """
+    return getattr(sys.modules.get(getattr(test_class, "__module__", None)), "__file__", None)
+
+def run_with(function, test_name, test_class, call=None):
+    """
+    Returns a function that runs *function* with the context variables of a test.
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        tokens = [
+            (hooked, hooked.set(True)),
+            (current_test, current_test.set(test_name(*args))),
+            (current_file, current_file.set(class_file(test_class(*args)))),
+        ]
+        if call:
+            tokens.append((current_calls, current_calls.set(current_calls.get() + (call,))))
+        try:
+            return function(*args, **kwargs)
+        finally:
+            for variable, token in reversed(tokens):
+                variable.reset(token)
+    return wrapper
+
+def caller_test_class():
+    """
+    Returns the test class whose setUpClass, setUp or test method is in the call stack, or None.
+    """
+    for frame in frames():
+        name = frame.f_code.co_name
+
+        if name == "setUpClass":
+            test_class = frame.f_locals.get("cls")
+        elif name == "setUp" or name.startswith("test"):
+            test_class = type(frame.f_locals.get("self"))
+        else:
+            continue
+
+        if isinstance(test_class, type) and issubclass(test_class, unittest.TestCase):
+            return test_class
+
+    return None
+
+def install(test_class=None):
+    """
+    Installs the hooks in the run and tearDownClass methods of the test class, once per class. Only the
+    test class is changed, not unittest, so the other test classes of the process run as they are.
+
+    :param test_class: The test class. - **Default:** None (the test class creating the TIR object, searched in the call stack)
+    :type test_class: unittest.TestCase subclass
+
+    Usage:
+
+    >>> # Called inside base.py when the TIR object is created:
+    >>> test_context.install()
+    """
+    if test_class is None:
+        test_class = caller_test_class()
+
+    if test_class is None or test_class in installed:
+        return
+
+    installed.add(test_class)
+
+    test_class.run = run_with(test_class.run, lambda test, *args: test._testMethodName, lambda test, *args: type(test))
+
+    tear_down_class = test_class.tearDownClass.__func__
+    test_class.tearDownClass = classmethod(run_with(tear_down_class, lambda cls: None, lambda cls: cls, "tearDownClass"))
+
+    runner = next(iter(filter(lambda x: "runner.py" in x.f_code.co_filename and "test" in x.f_locals, frames())), None)
+    if runner is not None:
+        runner_suite.set(runner.f_locals["test"])
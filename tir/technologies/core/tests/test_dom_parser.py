@@ -0,0 +1,163 @@
+"""
+Runs the scraping helpers against every installed DomParser backend and checks that they find the
+same elements, with the same xpaths, as the default "html.parser".
+
+The fixtures are pages serialized by the browser (with the tbody inserted by it), as page_source returns them.
+
+Usage:
+
+>>> python -m unittest tir.technologies.core.tests.test_dom_parser
+
+The TIR classes are TestCase subclasses, so their modules are imported instead of the classes, which
+would be collected as tests by pytest.
+"""
+
+import os
+import unittest
+from bs4 import BeautifulSoup, FeatureNotFound
+from tir.technologies.core import enumerations as enum
+from tir.technologies.core import base
+from tir.technologies.core.config import ConfigLoader
+from tir.technologies.core.third_party.xpath_soup import xpath_soup
+from tir.technologies import webapp_internal
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+PARSERS = ("html.parser", "lxml", "html5lib")
+
+def installed_parsers():
+    """
+    Returns the parsers of PARSERS installed in the environment.
+    """
+    parsers = []
+    for parser in PARSERS:
+        try:
+            BeautifulSoup("", parser)
+            parsers.append(parser)
+        except FeatureNotFound:
+            pass
+    return parsers
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as fixture:
+        return fixture.read()
+
+class FakeSwitchTo():
+    def default_content(self):
+        pass
+
+    def frame(self, frame):
+        pass
+
+class FakeDriver():
+    """
+    The part of the webdriver used by get_current_DOM without DomCache and ElementHandles.
+    """
+    def __init__(self, page_source):
+        self.page_source = page_source
+        self.switch_to = FakeSwitchTo()
+
+def webapp(parser, page_source):
+    """
+    Returns a WebappInternal (without a browser) that reads the page_source with the parser.
+    """
+    helper = webapp_internal.WebappInternal.__new__(webapp_internal.WebappInternal)
+    helper.config = ConfigLoader("")
+    helper.config.dom_parser = parser
+    helper.config.dom_cache = False
+    helper.config.container_dom = False
+    helper.config.element_handles = False
+    helper.config.log_file = False
+    helper.config.time_out = 5
+    helper.driver = FakeDriver(page_source)
+    helper.base_container = ".tmodaldialog"
+    helper.tmenu_out_iframe = False
+    helper.header_indexes = {}
+    return helper
+
+class DomParserTest(unittest.TestCase):
+
+    fixture = "protheus_dialog.html"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.parsers = installed_parsers()
+        cls.page_source = read_fixture(cls.fixture)
+
+    def results(self, function):
+        """
+        Returns the result of function(helper, soup) for each installed parser.
+        """
+        results = {}
+        for parser in self.parsers:
+            helper = webapp(parser, self.page_source)
+            results[parser] = function(helper, helper.get_current_DOM())
+        return results
+
+    def assertParity(self, function, expected):
+        for parser, result in self.results(function).items():
+            with self.subTest(parser=parser):
+                self.assertEqual(result, expected)
+
+    def test_parse_html(self):
+        self.assertParity(lambda helper, soup: type(soup).__name__, "BeautifulSoup")
+
+    def test_unknown_parser_falls_back(self):
+        helper = webapp("not-a-parser", self.page_source)
+        soup = helper.get_current_DOM()
+        self.assertEqual(helper.config.dom_parser, "html.parser")
+        self.assertEqual(len(soup.select(".tmodaldialog")), 3)
+
+    def test_zindex_sort(self):
+        self.assertParity(lambda helper, soup: list(map(lambda x: x.attrs["id"], helper.zindex_sort(soup.select(".tmodaldialog"), True))),
+            ["COMP4500", "COMP4000", "COMP3000"])
+
+    def test_xpath_soup(self):
+        self.assertParity(lambda helper, soup: list(map(xpath_soup, soup.select("input, select, button, tbody td"))), [
+            "/html/body/div[2]/div/div[2]/input",
+            "/html/body/div[2]/div/div[4]/input",
+            "/html/body/div[2]/div/input",
+            "/html/body/div[2]/div/div[6]/select",
+            "/html/body/div[2]/div/div[7]/table/tbody/tr[1]/td[1]",
+            "/html/body/div[2]/div/div[7]/table/tbody/tr[1]/td[2]",
+            "/html/body/div[2]/div/div[7]/table/tbody/tr[1]/td[3]",
+            "/html/body/div[2]/div/div[7]/table/tbody/tr[1]/td[4]",
+            "/html/body/div[2]/div/div[7]/table/tbody/tr[2]/td[1]",
+            "/html/body/div[2]/div/div[7]/table/tbody/tr[2]/td[2]",
+            "/html/body/div[2]/div/div[7]/table/tbody/tr[2]/td[3]",
+            "/html/body/div[2]/div/div[7]/table/tbody/tr[2]/td[4]",
+            "/html/body/div[2]/div/div[8]/button",
+            "/html/body/div[2]/div/div[9]/button",
+        ])
+
+    def test_web_scrap_css_selector(self):
+        self.assertParity(lambda helper, soup: list(map(lambda x: (x.attrs["name"], x.attrs["value"]),
+            helper.web_scrap(term=".tget input", scrap_type=enum.ScrapType.CSS_SELECTOR, check_error=False))),
+            [("A1_COD", "000001"), ("A1_NOME", "CLIENTE & CIA")])
+
+    def test_web_scrap_text(self):
+        self.assertParity(lambda helper, soup: list(map(lambda x: x.attrs["id"],
+            helper.web_scrap(term="Cliente", check_error=False))), ["COMP4502"])
+
+    def test_web_scrap_mixed(self):
+        self.assertParity(lambda helper, soup: list(map(lambda x: x.text,
+            helper.web_scrap(term="salvar", scrap_type=enum.ScrapType.MIXED, optional_term="button", check_error=False))), ["Salvar"])
+
+    def test_filter_label_element(self):
+        self.assertParity(lambda helper, soup: list(map(lambda x: x.attrs["id"],
+            helper.filter_label_element("Nome", soup.select("#COMP4500")[0]))), ["COMP4504"])
+
+    def test_find_label_element(self):
+        self.assertParity(lambda helper, soup: list(map(lambda x: x.attrs["name"],
+            base.Base.find_label_element(helper, "Usuário", soup.select("#COMP4500")[0]))), ["cGetUser"])
+
+    def test_get_headers_from_grids(self):
+        self.assertParity(lambda helper, soup: helper.get_headers_from_grids(soup.select(".tgetdados")),
+            [{"produto": 0, "descrição": 1, "quantidade": 2, "vlr.unitario": 3}])
+
+    def test_grid_rows(self):
+        self.assertParity(lambda helper, soup: list(map(lambda x: list(map(lambda y: y.text, x.select("td"))), soup.select(".tgetdados tbody tr"))),
+            [["PA0001", "PRODUTO ACABADO", "10,00", "1.250,50"], ["MP0002", "MATERIA PRIMA", "2,00", "3,10"]])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+Sends logs through the LogOutbox to a stub log server on localhost and checks the failover between
+the urls, the backoff while the server is unavailable and the logs rejected by the server.
+
+Usage:
+
+>>> python -m unittest tir.technologies.core.tests.test_log_outbox
+"""
+
+import json
+import time
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from tir.technologies.core import log_outbox
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Answers the posts with the status returned by server.answer, closing the connection
+    without an answer when it's None (the server is unavailable).
+    """
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["content-length"])))
+        status = self.server.answer(body)
+        self.server.requests.append((time.time(), body, status))
+
+        if status is None:
+            self.close_connection = True
+            return
+
+        self.send_response(status)
+        self.send_header("content-length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+class StubServer(ThreadingHTTPServer):
+
+    daemon_threads = True
+
+    def __init__(self, answer):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.answer = answer
+        self.requests = []
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_port}/log/"
+
+    def received(self):
+        return list(map(lambda x: x[1]["test"], filter(lambda x: x[2] == 201, self.requests)))
+
+class LogOutboxTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.dead = []
+        self.rejected = []
+        self.servers = []
+
+    def tearDown(self):
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def server(self, answer):
+        server = StubServer(answer)
+        self.servers.append(server)
+        return server
+
+    def outbox(self, urls, **kwargs):
+        return log_outbox.LogOutbox(self.folder, urls, self.dead.append, lambda response, url, json_data: self.rejected.append(response.status_code), **kwargs)
+
+    def wait_sent(self, outbox, timeout=10):
+        endtime = time.time() + timeout
+        while outbox.waiting() and time.time() < endtime:
+            time.sleep(0.05)
+        return not outbox.waiting()
+
+    def test_failover(self):
+        down = self.server(lambda body: None)
+        up = self.server(lambda body: 201)
+        outbox = self.outbox([down.url, up.url])
+
+        for test in range(3):
+            outbox.put(json.dumps({"test": test}))
+
+        self.assertTrue(self.wait_sent(outbox))
+        outbox.flush(1)
+
+        self.assertEqual(up.received(), [0, 1, 2])
+        self.assertEqual(len(down.requests), 1)
+        self.assertEqual(outbox.preferred, 1)
+        self.assertEqual(self.dead, [])
+
+    def test_backoff(self):
+        server = self.server(lambda body: None if len(server.requests) < 2 else 201)
+        outbox = self.outbox([server.url])
+
+        outbox.put(json.dumps({"test": 0}))
+
+        self.assertTrue(self.wait_sent(outbox))
+        outbox.flush(1)
+
+        times = list(map(lambda x: x[0], server.requests))
+        self.assertEqual(server.received(), [0])
+        self.assertEqual(len(times), 3)
+        self.assertGreaterEqual(times[1] - times[0], 0.9)
+        self.assertGreaterEqual(times[2] - times[1], 1.9)
+
+    def test_rejected(self):
+        server = self.server(lambda body: {"bad": 400, "flaky": 500}.get(body["test"], 201))
+        outbox = self.outbox([server.url], max_attempts=2)
+
+        for test in ("bad", "flaky", 0, 1):
+            outbox.put(json.dumps({"test": test}))
+
+        self.assertTrue(self.wait_sent(outbox))
+        outbox.flush(1)
+
+        self.assertEqual(server.received(), [0, 1])
+        self.assertEqual(sorted(map(lambda x: json.loads(x)["test"], self.dead)), ["bad", "flaky"])
+        self.assertEqual(self.rejected, [400, 500, 500])
+        self.assertEqual(outbox.pending(), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Compares the SpatialIndex queries with the linear scan that search_element_position used before it
+(filter_by_direction, get_distance_by_direction and min), over random screens of fields and labels.
+
+Usage:
+
+>>> python -m unittest tir.technologies.core.tests.test_spatial_index
+"""
+
+import time
+import random
+import unittest
+from math import sqrt
+from tir.technologies.core.spatial_index import SpatialIndex
+
+def linear_scan(xy_label, width_safe, height_safe, position_list, direction):
+    """
+    The field search of search_element_position before the SpatialIndex.
+    """
+    if not direction:
+        position_list = list(filter(lambda xy_elem: (
+            xy_elem[1]['y'] + width_safe >= xy_label['y'] and xy_elem[1]['x'] + height_safe >= xy_label['x']), position_list))
+        get_distance = lambda label, element: sqrt(pow(element['x'] - label['x'], 2) + pow(element['y'] - label['y'], 2))
+    elif direction == 'right':
+        position_list = list(filter(lambda xy_elem: (xy_elem[1]['x'] > xy_label['x']) and (
+            xy_elem[1]['y'] >= xy_label['y'] - height_safe and xy_elem[1]['y'] <= xy_label['y'] + height_safe), position_list))
+        get_distance = lambda label, element: element['x'] - label['x']
+    elif direction == 'down':
+        position_list = list(filter(lambda xy_elem: (xy_elem[1]['y'] > xy_label['y']) and (
+            xy_elem[1]['x'] + width_safe >= xy_label['x'] and xy_elem[1]['x'] - width_safe <= xy_label['x']), position_list))
+        get_distance = lambda label, element: element['y'] - label['y']
+
+    distance = list(map(lambda x: (x[0], get_distance(xy_label, x[1])), position_list))
+
+    return min(distance, key=lambda x: x[1])[0] if distance else None
+
+class SpatialIndexTest(unittest.TestCase):
+
+    def screen(self, rand, size, spread):
+        """
+        Returns size random positions, in a few columns and rows like the fields of a dialog when spread is small.
+        """
+        return list(map(lambda index: (index, {'x': rand.randint(0, spread) * rand.choice((1, 5, 40)), 'y': rand.randint(0, spread) * rand.choice((1, 5, 20))}), range(size)))
+
+    def test_equivalence(self):
+        rand = random.Random(12)
+
+        for screen in range(300):
+            size = rand.choice((1, 2, 5, 16, 17, 40, 150, 600))
+            positions = self.screen(rand, size, rand.choice((3, 30, 1000)))
+            index = SpatialIndex(positions)
+
+            for query in range(10):
+                label = {'x': rand.randint(-200, 2000), 'y': rand.randint(-200, 1200)}
+                width_safe, height_safe = rand.choice(((0, 0), (5, 5), (20, 8), (150, 40)))
+
+                for direction in (None, 'right', 'down'):
+                    with self.subTest(screen=screen, query=query, direction=direction):
+                        self.assertEqual(index.nearest(label, direction, width_safe, height_safe),
+                            linear_scan(label, width_safe, height_safe, positions, direction))
+
+    def test_same_place_far_from_label(self):
+        for size in (1, 2, 200):
+            index = SpatialIndex(list(map(lambda x: (x, {'x': 900, 'y': 600}), range(size))))
+            start = time.perf_counter()
+
+            self.assertEqual(index.nearest({'x': 10, 'y': 10}), 0)
+            self.assertEqual(index.nearest({'x': 10, 'y': 598}, 'right', 0, 5), 0)
+            self.assertEqual(index.nearest({'x': 898, 'y': 10}, 'down', 5, 0), 0)
+            self.assertLess(time.perf_counter() - start, 0.05)
+
+if __name__ == "__main__":
+    unittest.main()
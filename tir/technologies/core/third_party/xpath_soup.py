@@ -12,6 +12,9 @@ def xpath_soup(element):
     :return: xpath as string
     :rtype: str
 
+    The sibling indexes of a parent are computed in a single pass and the generated
+    paths are memoized on the root of the soup, so they live as long as the snapshot.
+
     Usage:
 
     >>> import bs4
@@ -22,24 +25,132 @@ def xpath_soup(element):
     >>> soup = bs4.BeautifulSoup(html, 'html.parser')
     >>> xpath_soup(soup.html.body.p.i)
     '/html/body/p[1]/i'
+    >>> xpath_soup(soup.find_all('i')[1].string)
+    '/html/body/p[2]/i'
+
+    Identical siblings keep their own position:
+
+    >>> soup = bs4.BeautifulSoup('<ul><li>a</li><li>a</li></ul>', 'html.parser')
+    >>> xpath_soup(soup.find_all('li')[1])
+    '/ul/li[2]'
+
+    Elements parsed from a fragment of the page may carry the absolute xpath of the
+    fragment root in a *data-tir-xpath* attribute, which is used as the path prefix:
+
+    >>> fragment = bs4.BeautifulSoup('<div data-tir-xpath="/html/body/div[2]"><p>p</p></div>', 'html.parser')
+    >>> xpath_soup(fragment.div.p)
+    '/html/body/div[2]/p'
     """
-    components = []
     child = element if element.name else element.parent
-    for parent in child.parents:
-        """
-        @type parent: bs4.element.Tag
-        """
-        siblings = parent.find_all(child.name, recursive=False)
-        components.append(
-            child.name
-            if siblings == [child] else
-            '%s[%d]' % (child.name, 1 + siblings.index(child))
-            )
-        child = parent
-    components.reverse()
-    return '/%s' % '/'.join(components)
+
+    chain = []
+    root = child
+    while root.parent is not None:
+        chain.append(root)
+        root = root.parent
+
+    paths, components = _cache(root)
+
+    path = ''
+    for node in reversed(chain):
+        node_path = paths.get(id(node))
+        if node_path is None:
+            if node.attrs.get('data-tir-xpath'):
+                node_path = node.attrs['data-tir-xpath']
+            else:
+                if id(node) not in components:
+                    _index_children(node.parent, components)
+                node_path = '%s/%s' % (path, components[id(node)])
+            paths[id(node)] = node_path
+        path = node_path
+
+    return path or '/'
+
+
+def _cache(root):
+    """
+    Returns the (paths, components) memo stored on the root of the soup.
+
+    The instance dict is used directly because attribute lookups on bs4 tags
+    fall back to a tree search.
+    """
+    cache = root.__dict__.get('_xpath_soup_cache')
+    if cache is None:
+        cache = root.__dict__['_xpath_soup_cache'] = ({}, {})
+    return cache
+
+
+def _index_children(parent, components):
+    """
+    Stores the xpath component of every tag child of parent in a single pass.
+    """
+    children = [x for x in parent.children if x.name]
+
+    totals = {}
+    for x in children:
+        totals[x.name] = totals.get(x.name, 0) + 1
+
+    positions = {}
+    for x in children:
+        if totals[x.name] == 1:
+            components[id(x)] = x.name
+        else:
+            positions[x.name] = positions.get(x.name, 0) + 1
+            components[id(x)] = '%s[%d]' % (x.name, positions[x.name])
+
+
+def benchmark(rows=1000, columns=20, parser='html.parser'):
+    """
+    Compares the xpath generation of every cell of a large grid page against the
+    original per-level sibling scan. Returns the (original, current) timings in seconds.
+
+    Usage:
+
+    >>> original, current = benchmark(rows=10, columns=2)
+    """
+    import time
+    import bs4
+
+    def sibling_scan(element):
+        components = []
+        child = element if element.name else element.parent
+        for parent in child.parents:
+            siblings = parent.find_all(child.name, recursive=False)
+            components.append(
+                child.name
+                if siblings == [child] else
+                '%s[%d]' % (child.name, 1 + siblings.index(child))
+                )
+            child = parent
+        components.reverse()
+        return '/%s' % '/'.join(components)
+
+    body = ''.join(
+        '<tr id="%d">%s</tr>' % (row, ''.join('<td><div>%d-%d</div></td>' % (row, column) for column in range(columns)))
+        for row in range(rows)
+        )
+    html = '<html><body><div class="tmodaldialog"><div class="tgrid"><table><tbody>%s</tbody></table></div></div></body></html>' % body
+
+    soup = bs4.BeautifulSoup(html, parser)
+    elements = soup.select('td div')
+
+    start = time.perf_counter()
+    expected = [sibling_scan(x) for x in elements]
+    original = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = [xpath_soup(x) for x in elements]
+    current = time.perf_counter() - start
+
+    assert expected == result
+    return original, current
 
 
 if __name__ == '__main__':
-    import doctest
-    doctest.testmod(verbose=True)
\ No newline at end of file
+    import sys
+    if '--benchmark' in sys.argv:
+        original, current = benchmark()
+        print('original: %.3fs current: %.3fs (%.1fx)' % (original, current, original / current))
+    else:
+        import doctest
+        doctest.testmod(verbose=True)
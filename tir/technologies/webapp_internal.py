@@ -1,13 +1,13 @@
 import re
 import time
 import pandas as pd
-import inspect
 import os
 import random
 import uuid
 from functools import reduce
+from collections import deque
+from itertools import compress
 from selenium.webdriver.common.keys import Keys
-from bs4 import BeautifulSoup
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
@@ -17,10 +17,14 @@ from tir.technologies.core.log import Log
 from tir.technologies.core.config import ConfigLoader
 from tir.technologies.core.language import LanguagePack
 from tir.technologies.core.third_party.xpath_soup import xpath_soup
+from tir.technologies.core import browser_scripts
+from tir.technologies.core import test_context
 from tir.technologies.core.psutil_info import system_info
 from tir.technologies.core.base import Base
 from tir.technologies.core.numexec import NumExec
-from math import sqrt, pow
+from tir.technologies.core.spatial_index import SpatialIndex
+from tir.technologies.core.sx3_store import Sx3Store
+from tir.technologies.core.header_index import HeaderIndex
 from selenium.common.exceptions import *
 from datetime import datetime
 from tir.technologies.core.logging_config import logger
@@ -58,6 +62,10 @@ class WebappInternal(Base):
         grid_input: List with fields from a grid that must be filled in the next LoadGrid call.
 
         used_ids: Dictionary of element ids and container already captured by a label search.
+
+        layout_cache: Fields already resolved by a label search in the current container, while its structure doesn't change.
+
+        header_indexes: HeaderIndex of the grids by grid id and header labels.
         """
         webdriver_exception = None
 
@@ -81,8 +89,12 @@ class WebappInternal(Base):
         self.grid_input = []
         self.down_loop_grid = False
         self.num_exec = NumExec()
+        self.num_exec_futures = []
         self.restart_counter = 0
         self.used_ids = {}
+        self.layout_cache = {}
+        self.field_indexes = {}
+        self.header_indexes = {}
         self.tss = False
         self.restart_coverage = True
 
@@ -141,9 +153,7 @@ class WebappInternal(Base):
             self.set_log_info_tss()
 
             if self.config.num_exec:
-                if not self.num_exec.post_exec(self.config.url_set_start_exec):
-                    self.restart_counter = 3
-                    self.log_error(f"WARNING: Couldn't possible send num_exec to server please check log.")
+                self.num_exec_futures.append(self.num_exec.post_exec(self.config.url_set_start_exec))
 
         except ValueError as e:
             self.log_error(str(e))
@@ -253,9 +263,7 @@ class WebappInternal(Base):
             self.log_error(str(e))
 
         if self.config.num_exec:
-            if not self.num_exec.post_exec(self.config.url_set_start_exec):
-                self.restart_counter = 3
-                self.log_error(f"WARNING: Couldn't possible send num_exec to server please check log.")
+            self.num_exec_futures.append(self.num_exec.post_exec(self.config.url_set_start_exec))
 
         if self.config.smart_test and self.config.coverage and self.search_stack("setUpClass") and self.restart_coverage:
             self.restart()
@@ -473,7 +481,7 @@ class WebappInternal(Base):
             self.log_error(message)
             raise ValueError(message)
 
-        button = lambda: self.driver.find_element_by_xpath(xpath_soup(button_element))
+        button = lambda: self.driver.find_element(*self.soup_locator(button_element))
         self.click(button())
 
     def reload_user_screen(self):
@@ -534,7 +542,7 @@ class WebappInternal(Base):
             self.log_error(message)
             raise ValueError(message)
 
-        date = lambda: self.driver.find_element_by_xpath(xpath_soup(base_date))
+        date = lambda: self.driver.find_element(*self.soup_locator(base_date))
         self.double_click(date())
         self.send_keys(date(), Keys.HOME)
         self.send_keys(date(), self.config.date)
@@ -552,7 +560,7 @@ class WebappInternal(Base):
             self.log_error(message)
             raise ValueError(message)
         
-        group = lambda: self.driver.find_element_by_xpath(xpath_soup(group_element))
+        group = lambda: self.driver.find_element(*self.soup_locator(group_element))
         self.double_click(group())
         self.send_keys(group(), Keys.HOME)
         self.send_keys(group(), self.config.group)
@@ -569,7 +577,7 @@ class WebappInternal(Base):
             self.log_error(message)
             raise ValueError(message)
 
-        branch = lambda: self.driver.find_element_by_xpath(xpath_soup(branch_element))
+        branch = lambda: self.driver.find_element(*self.soup_locator(branch_element))
         self.double_click(branch())
         self.send_keys(branch(), Keys.HOME)
         self.send_keys(branch(), self.config.branch)
@@ -587,7 +595,7 @@ class WebappInternal(Base):
             raise ValueError(message)
 
 
-        env = lambda: self.driver.find_element_by_xpath(xpath_soup(environment_element))
+        env = lambda: self.driver.find_element(*self.soup_locator(environment_element))
         if ("disabled" not in environment_element.parent.attrs["class"] and env().is_enabled()):
             env_value = self.get_web_value(env())
             endtime = time.time() + self.config.time_out
@@ -602,7 +610,7 @@ class WebappInternal(Base):
         button_element = next(iter(buttons), None) if buttons else None
 
         if button_element  and hasattr(button_element, "name") and hasattr(button_element, "parent"):
-            button = lambda: self.driver.find_element_by_xpath(xpath_soup(button_element))
+            button = lambda: self.driver.find_element(*self.soup_locator(button_element))
             self.click(button())
         elif not change_env:
             self.restart_counter += 1
@@ -642,7 +650,7 @@ class WebappInternal(Base):
 
         element = self.change_environment_element_home_screen()
         if element:
-            self.click(self.driver.find_element_by_xpath(xpath_soup(element)))
+            self.click(self.driver.find_element(*self.soup_locator(element)))
             self.environment_screen(True)
         else:
             self.log_error("Change Envirioment method did not find the element to perform the click or the element was not visible on the screen.")
@@ -730,7 +738,7 @@ class WebappInternal(Base):
             if buttons:
                 close_button = next(iter(list(filter(lambda x: x.text == self.language.close, buttons))), None)
                 time.sleep(0.5)
-                selenium_close_button = lambda: self.driver.find_element_by_xpath(xpath_soup(close_button))
+                selenium_close_button = lambda: self.driver.find_element(*self.soup_locator(close_button))
                 if close_button:
                     try:
                         self.wait_until_to( expected_condition = "element_to_be_clickable", element = close_button , locator = By.XPATH)
@@ -977,8 +985,8 @@ class WebappInternal(Base):
                 if tget_img is None:
                     self.log_error("Couldn't find Program field.")
 
-                s_tget = lambda : self.driver.find_element_by_xpath(xpath_soup(tget_input))
-                s_tget_img = lambda : self.driver.find_element_by_xpath(xpath_soup(tget_img))
+                s_tget = lambda : self.driver.find_element(*self.soup_locator(tget_input))
+                s_tget_img = lambda : self.driver.find_element(*self.soup_locator(tget_img))
 
                 self.wait_until_to( expected_condition = "element_to_be_clickable", element = tget_input, locator = By.XPATH )
                 self.double_click(s_tget())
@@ -1057,7 +1065,7 @@ class WebappInternal(Base):
 
             logger().debug("Field successfully found")
             if(send_key):
-                input_field = lambda: self.driver.find_element_by_xpath(xpath_soup(element))
+                input_field = lambda: self.driver.find_element(*self.soup_locator(element))
                 self.set_element_focus(input_field())
                 container = self.get_current_container()
                 self.send_keys(input_field(), Keys.F3)
@@ -1069,7 +1077,7 @@ class WebappInternal(Base):
 
             container_end = self.get_current_container()
             if (container['id']  == container_end['id']):
-                input_field = lambda: self.driver.find_element_by_xpath(xpath_soup(element))
+                input_field = lambda: self.driver.find_element(*self.soup_locator(element))
                 self.set_element_focus(input_field())
                 self.send_keys(input_field(), Keys.F3)
             
@@ -1216,7 +1224,7 @@ class WebappInternal(Base):
         if index and not isinstance(search_key, int):
             self.log_error("If index parameter is True, key must be a number!")
 
-        sel_browse_key = lambda: self.driver.find_element_by_xpath(xpath_soup(search_elements[0]))
+        sel_browse_key = lambda: self.driver.find_element(*self.soup_locator(search_elements[0]))
         self.wait_element(term="[style*='fwskin_seekbar_ico']", scrap_type=enum.ScrapType.CSS_SELECTOR)
         self.wait_until_to( expected_condition = "element_to_be_clickable", element = search_elements[0], locator = By.XPATH)
         self.set_element_focus(sel_browse_key())
@@ -1225,7 +1233,7 @@ class WebappInternal(Base):
         if self.driver.execute_script("return app.VERSION").split('-')[0] >= "4.6.4":
             self.driver.switch_to.default_content()
             content = self.driver.page_source
-            soup = BeautifulSoup(content,"html.parser")
+            soup = self.parse_html(content)
         else:
             soup = self.get_current_DOM()
 
@@ -1263,7 +1271,7 @@ class WebappInternal(Base):
                     elif self.driver.execute_script("return app.VERSION").split('-')[0] >= "4.6.4":
                         self.driver.switch_to.default_content()
                         content = self.driver.page_source
-                        soup = BeautifulSoup(content,"html.parser")
+                        soup = self.parse_html(content)
                     else:
                         pass
             if tradiobuttonitens_ends_dots and not success and self.config.initial_program.lower() == "sigaadv":
@@ -1307,7 +1315,7 @@ class WebappInternal(Base):
                 self.log_error("Key index out of range.")
             trb_input = tradiobuttonitens[search_key]
 
-            sel_input = lambda: self.driver.find_element_by_xpath(xpath_soup(trb_input))
+            sel_input = lambda: self.driver.find_element(*self.soup_locator(trb_input))
             self.wait_until_to( expected_condition = "element_to_be_clickable", element = trb_input, locator = By.XPATH )
             self.click(sel_input())
 
@@ -1335,7 +1343,7 @@ class WebappInternal(Base):
 
         if index and not isinstance(search_column, int):
             self.log_error("If index parameter is True, column must be a number!")
-        sel_browse_column = lambda: self.driver.find_element_by_xpath(xpath_soup(search_elements[0]))
+        sel_browse_column = lambda: self.driver.find_element(*self.soup_locator(search_elements[0]))
         self.wait_element(term="[style*='fwskin_seekbar_ico']", scrap_type=enum.ScrapType.CSS_SELECTOR)
         self.wait_until_to( expected_condition = "element_to_be_clickable", element = search_elements[0], locator = By.XPATH)
         self.set_element_focus(sel_browse_column())
@@ -1393,8 +1401,8 @@ class WebappInternal(Base):
         """
         self.wait_blocker()
         endtime = time.time() + self.config.time_out
-        sel_browse_input = lambda: self.driver.find_element_by_xpath(xpath_soup(search_elements[1]))
-        sel_browse_icon = lambda: self.driver.find_element_by_xpath(xpath_soup(search_elements[2]))
+        sel_browse_input = lambda: self.driver.find_element(*self.soup_locator(search_elements[1]))
+        sel_browse_icon = lambda: self.driver.find_element(*self.soup_locator(search_elements[2]))
 
         current_value = self.get_element_value(sel_browse_input())
 
@@ -1447,6 +1455,11 @@ class WebappInternal(Base):
         result = True
         endtime = time.time() + 300
 
+        if self.config.event_wait:
+            blocked = self.wait_unblocked(endtime)
+            if blocked is not None:
+                return blocked
+
         while(time.time() < endtime and result):
             blocker_container = None
             blocker = None
@@ -1462,6 +1475,52 @@ class WebappInternal(Base):
                 return False
         return result
 
+    def wait_unblocked(self, endtime):
+        """
+        [Internal]
+
+        Waits the blocker disappear with WAIT_UNBLOCKED, which observes the page mutations
+        during the wait and resolves as soon as the screen is unblocked.
+
+        :param endtime: The time limit of the wait.
+        :type endtime: float
+
+        :return: True if the screen is still blocked at the end of the wait, False if it is not blocked and None if the script couldn't run.
+        :rtype: bool
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> blocked = self.wait_unblocked(time.time() + 300)
+        """
+        selector = self.containers_selectors["BlockerContainers"]
+        result = None
+
+        try:
+            while time.time() < endtime:
+                arguments = (selector, int(min(endtime - time.time(), 10) * 1000))
+
+                if self.tmenu_out_iframe:
+                    self.driver.switch_to.default_content()
+
+                result = self.driver.execute_async_script(browser_scripts.WAIT_UNBLOCKED, *arguments)
+
+                if result and result.get("session"):
+                    self.driver.switch_to.frame(self.driver.find_element_by_css_selector("iframe[class=session]"))
+                    result = self.driver.execute_async_script(browser_scripts.WAIT_UNBLOCKED, *arguments)
+
+                if not result or result.get("session"):
+                    return None
+
+                if not result["blocked"]:
+                    return False
+
+        except WebDriverException as e:
+            logger().debug(f"Warning wait_unblocked exception: {str(e)}")
+            return None
+
+        return True if result else None
+
     def blocker_containers(self, soup):
         """
         Return The container index by z-index and filter if it is displayed
@@ -1474,7 +1533,7 @@ class WebappInternal(Base):
             containers = self.zindex_sort(soup.select(self.containers_selectors["BlockerContainers"]), True)
 
             if containers:
-                containers_filtered = list(filter(lambda x: self.element_is_displayed(x), containers))
+                containers_filtered = self.filter_is_displayed(containers)
                 if containers_filtered:
                     return next(iter(containers_filtered), None)
                 else:
@@ -1518,6 +1577,11 @@ class WebappInternal(Base):
         >>> # Calling the method
         >>> self.search_element_position(field)
         """
+        layout_key = (field.strip(), position, input_field, direction.lower() if direction else None)
+        elem = self.get_layout_cache(layout_key)
+        if elem:
+            return elem
+
         endtime = (time.time() + self.config.time_out)
         label = None
         elem = []
@@ -1530,8 +1594,14 @@ class WebappInternal(Base):
         try:
             while( time.time() < endtime and not label ):
                 container = self.get_current_container()
+                state = self.get_screen_state(sections=["labels", "fields"], fields_selector=term)
+                if state and (not state.get("container") or state["container"]["id"] != container.attrs.get("id")):
+                    state = None
                 labels = container.select("label")
-                labels_displayed = list(filter(lambda x: self.element_is_displayed(x) ,labels))
+                if state:
+                    labels_displayed = list(compress(labels, map(lambda x: bool(x and x["displayed"]), self.screen_state_of(state, labels))))
+                else:
+                    labels_displayed = self.filter_is_displayed(labels)
                 labels_list  = list(filter(lambda x: re.search(r"^{}([^a-zA-Z0-9]+)?$".format(re.escape(field)),x.text) ,labels_displayed))
                 labels_list_filtered = list(filter(lambda x: 'th' not in self.element_name(x.parent.parent) , labels_list))
                 if labels_list_filtered and len(labels_list_filtered) -1 >= position:
@@ -1542,27 +1612,40 @@ class WebappInternal(Base):
 
             self.wait_until_to( expected_condition = "element_to_be_clickable", element = label, locator = By.XPATH )
             
-            container_size = self.get_element_size(container['id'])
+            container_size = state["container"]["size"] if state else self.get_element_size(container['id'])
             # The safe values add to postion of element
             width_safe  = (container_size['width']  * 0.015)
             height_safe = (container_size['height'] * 0.01)
 
-            label_s  = lambda:self.soup_to_selenium(label)
-            xy_label =  self.driver.execute_script('return arguments[0].getPosition()', label_s())
-            list_in_range = self.web_scrap(term=term, scrap_type=enum.ScrapType.CSS_SELECTOR) 
-            list_in_range = list(filter(lambda x: self.element_is_displayed(x) and 'readonly' not in self.soup_to_selenium(x).get_attribute("class") or 'readonly focus' in self.soup_to_selenium(x).get_attribute("class"), list_in_range))
+            index_key = (term, None if input_field else field.strip().lower())
+            cached_index = self.get_field_index(container, index_key)
+
+            if cached_index:
+                list_in_range, index = cached_index
+                states = self.screen_state_of(state, [label]) if state else self.elements_state([label], positions=True)
+            else:
+                list_in_range = self.web_scrap(term=term, scrap_type=enum.ScrapType.CSS_SELECTOR) 
+                if state:
+                    states = self.screen_state_of(state, [label] + list_in_range)
+                else:
+                    states = self.elements_state([label] + list_in_range, positions=True)
+                candidates = [(x, element_state["position"]) for x, element_state in zip(list_in_range, states[1:]) if element_state and (element_state["displayed"] and 'readonly' not in element_state["className"] or 'readonly focus' in element_state["className"])]
 
-            if not input_field:
-                list_in_range = list(filter(lambda x: field.strip().lower() != x.text.strip().lower(), list_in_range))
+                if not input_field:
+                    candidates = list(filter(lambda x: field.strip().lower() != x[0].text.strip().lower(), candidates))
 
-            position_list = list(map(lambda x:(x[0], self.get_position_from_bs_element(x[1])), enumerate(list_in_range)))
-            position_list = self.filter_by_direction(xy_label, width_safe, height_safe, position_list, direction)
-            distance      = self.get_distance_by_direction(xy_label, position_list, direction)
-            elem          = min(distance, key = lambda x: x[1])
-            elem          = list_in_range[elem[0]]
+                list_in_range = list(map(lambda x: x[0], candidates))
+                index = SpatialIndex(list(map(lambda x: (x[0], x[1][1]), enumerate(candidates))))
+                self.set_field_index(container, index_key, (list_in_range, index))
+
+            xy_label = states[0]["position"] if states[0] else None
+            elem          = index.nearest(xy_label, direction, width_safe, height_safe)
+            elem          = list_in_range[elem] if elem is not None else None
 
             if not elem:
                 self.log_error(f"Label '{field}' wasn't found")
+
+            self.set_layout_cache(layout_key, elem)
             return elem
             
         except AssertionError as error:
@@ -1572,84 +1655,244 @@ class WebappInternal(Base):
             self.log_error(str(error))
 
 
-    def get_position_from_bs_element(self,element):
+    def layout_cache_state(self):
         """
         [Internal]
 
+        Returns the current container and the layout cache of this container, which is reset
+        when the container changes or elements are added to or removed from the page.
+
+        :return: The current container and the dictionary of resolved fields (None if the cache can't be used).
+        :rtype: tuple
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> container, fields = self.layout_cache_state()
         """
-        selenium_element = self.soup_to_selenium(element)
-        position = self.driver.execute_script('return arguments[0].getPosition()', selenium_element)
-        return position
+        if not (self.config.layout_cache and self.config.dom_cache):
+            return None, None
+
+        container = self.get_current_container()
+
+        stamp = self.dom_structure_stamp(self.container_generation())
 
-    def get_distance(self,label_pos,element_pos):
+        if not container or not stamp or "id" not in container.attrs:
+            return container, None
+
+        if self.layout_cache.get("container") != container.attrs["id"] or self.layout_cache.get("stamp") != stamp:
+            self.layout_cache = {"container": container.attrs["id"], "stamp": stamp, "fields": {}}
+
+        return container, self.layout_cache["fields"]
+
+    def get_layout_cache(self, key):
         """
-        [internal]
+        [Internal]
+
+        Returns the field already resolved for the key in the current container, if it is still displayed and editable.
+
+        :param key: The normalized label search (label, position, input_field, direction).
+        :type key: tuple
+
+        :return: The field element or None if it isn't cached.
+        :rtype: BeautifulSoup object
+
+        Usage:
 
+        >>> # Calling the method:
+        >>> element = self.get_layout_cache(("Product", 1, True, None))
         """
-        return sqrt((pow(element_pos['x'] - label_pos['x'], 2)) + pow(element_pos['y'] - label_pos['y'],2))
+        container, fields = self.layout_cache_state()
 
-    def get_element_size(self, id):
+        if not fields or key not in fields:
+            return None
+
+        element = container.find(id=fields[key])
+        state = next(iter(self.elements_state([element])), None) if element else None
+
+        if state and (state["displayed"] and 'readonly' not in state["className"] or 'readonly focus' in state["className"]):
+            return element
+
+        del fields[key]
+        return None
+
+    def set_layout_cache(self, key, element):
         """
-        Internal
-        Return Height/Width
+        [Internal]
+
+        Stores the field resolved for the key in the layout cache of the current container.
+
+        :param key: The normalized label search (label, position, input_field, direction).
+        :type key: tuple
+        :param element: The field element.
+        :type element: BeautifulSoup object
 
+        Usage:
+
+        >>> # Calling the method:
+        >>> self.set_layout_cache(("Product", 1, True, None), element)
         """
-        script = f'return document.getElementById("{id}").offsetHeight;'
-        height = self.driver.execute_script(script)
-        script = f'return document.getElementById("{id}").offsetWidth;'
-        width  = self.driver.execute_script(script)
-        return {'height': height, 'width':width}
+        if not hasattr(element, "attrs") or "id" not in element.attrs:
+            return
 
-    def get_distance_x(self, x_label, x_element):
+        container, fields = self.layout_cache_state()
+
+        if fields is not None:
+            fields[key] = element.attrs["id"]
+
+    def container_generation(self):
         """
         [Internal]
 
+        Returns the DOM generation key of the last snapshot of the current container (see get_dom_generation).
+
+        :rtype: str
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> generation = self.container_generation()
         """
+        selector = self.containers_selectors["GetCurrentContainer"]
 
-        return (x_element['x'] - x_label['x'])
+        if self.container_DOM_enabled(selector):
+            return next(iter(self.container_dom.get(selector, ())), None)
 
-    def get_distance_y(self, y_label, y_element):
+        return self.current_dom_generation
+
+    def get_field_index(self, container, key):
         """
         [Internal]
 
+        Returns the fields and the SpatialIndex of their positions built by search_element_position
+        for the container, while the DOM generation of the container doesn't change.
+
+        :param container: The current container.
+        :type container: BeautifulSoup object
+        :param key: The selector of the fields and the label excluded from them.
+        :type key: tuple
+
+        :return: The fields and the index or None if they aren't cached.
+        :rtype: tuple
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> fields, index = self.get_field_index(container, (".tget", None))
         """
+        if not (self.config.layout_cache and self.config.dom_cache) or not container or "id" not in container.attrs:
+            return None
+
+        generation = self.container_generation()
 
-        return (y_element['y'] - y_label['y'])
+        if not generation or self.field_indexes.get("container") != container.attrs["id"] or self.field_indexes.get("generation") != generation:
+            self.field_indexes = {"container": container.attrs["id"], "generation": generation, "indexes": {}}
 
-    def filter_by_direction(self, xy_label, width_safe, height_safe, position_list, direction):
+        return self.field_indexes["indexes"].get(key)
+
+    def set_field_index(self, container, key, fields_index):
         """
         [Internal]
-        
+
+        Stores the fields and the SpatialIndex of their positions for the container (see get_field_index).
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> self.set_field_index(container, (".tget", None), (fields, index))
         """
+        if self.field_indexes.get("generation") and container and self.field_indexes.get("container") == container.attrs.get("id"):
+            self.field_indexes["indexes"][key] = fields_index
 
-        if not direction:
+    def get_element_size(self, id):
+        """
+        Internal
+        Return Height/Width
 
-            return list(filter(lambda xy_elem: (
-                        xy_elem[1]['y'] + width_safe >= xy_label['y'] and xy_elem[1]['x'] + height_safe >= xy_label['x']),
-                        position_list))
+        """
+        return self.driver.execute_script(browser_scripts.ELEMENT_SIZE, id)
 
-        elif direction.lower() == 'right':
-            return list(filter(
-                lambda xy_elem: (xy_elem[1]['x'] > xy_label['x']) and (xy_elem[1]['y'] >= xy_label['y'] - height_safe and xy_elem[1]['y'] <= xy_label[
-                    'y'] + height_safe), position_list))
-        
-        elif direction.lower() == 'down':
-            return list(filter(
-                lambda xy_elem: (xy_elem[1]['y'] > xy_label['y']) and (xy_elem[1]['x'] + width_safe >= xy_label['x'] and
-                               xy_elem[1]['x'] - width_safe <= xy_label['x']), position_list))
+    def get_screen_state(self, container_selector=None, sections=None, fields_selector=None):
+        """
+        [Internal]
 
-    def get_distance_by_direction(self, xy_label, position_list, direction):
-        
-        if not direction:
-            get_distance = self.get_distance
-        
-        elif direction.lower() == 'right':
-            get_distance = self.get_distance_x
+        Returns the state of the screen collected with a single script call.
 
-        elif direction.lower() == 'down':
-            get_distance = self.get_distance_y
-        
-        return list(map(lambda x: (x[0], get_distance(xy_label, x[1])), position_list))
+        The state has the containers (with z-index) and, for the current container, its size and
+        the labels, inputs, comboboxes, grids (with headers), buttons and the elements of fields_selector.
+        Every element has its id, handle (or xpath), class, text, displayed and readonly flags, position and rect.
+
+        :param container_selector: The selector of the current container. - **Default:** GetCurrentContainer selector
+        :type container_selector: str
+        :param sections: The sections to collect ("containers", "labels", "inputs", "comboboxes", "grids", "buttons", "fields"). - **Default:** None (all)
+        :type sections: List of str
+        :param fields_selector: The selector of the elements of the "fields" section. - **Default:** None
+        :type fields_selector: str
+
+        :return: The screen state or None if it couldn't be collected.
+        :rtype: dict
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> state = self.get_screen_state()
+        >>> labels = list(filter(lambda x: x["displayed"], state["labels"]))
+        """
+        if container_selector is None:
+            container_selector = self.containers_selectors["GetCurrentContainer"]
+
+        arguments = (self.containers_selectors["Containers"], container_selector, sections, fields_selector)
+
+        try:
+            if self.tmenu_out_iframe:
+                self.driver.switch_to.default_content()
+
+            state = self.driver.execute_script(browser_scripts.SCREEN_STATE, *arguments)
+
+            if state and state.get("session"):
+                self.driver.switch_to.frame(self.driver.find_element_by_css_selector("iframe[class=session]"))
+                state = self.driver.execute_script(browser_scripts.SCREEN_STATE, *arguments)
+        except WebDriverException as e:
+            logger().debug(f"Warning get_screen_state exception: {str(e)}")
+            return None
+
+        return state if state and not state.get("session") else None
+
+    def screen_state_of(self, state, elements):
+        """
+        [Internal]
+
+        Returns the state of each BeautifulSoup element in the format of elements_state (with the positions),
+        read from a screen state returned by get_screen_state.
+
+        The elements that aren't in the screen state are read with a single elements_state call.
+
+        :param state: The screen state.
+        :type state: dict
+        :param elements: BeautifulSoup element list
+        :type elements: List of BeautifulSoup objects
+
+        :return: One dict with the keys displayed, className and position per element. None for elements that don't exist on the screen.
+        :rtype: List of dict
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> states = self.screen_state_of(self.get_screen_state(), labels)
+        """
+        index = {}
+        for section in ("labels", "inputs", "comboboxes", "grids", "buttons", "fields"):
+            for entry in state.get(section) or []:
+                index[entry["handle"] or entry["xpath"]] = entry
+
+        states = list(map(lambda x: index.get(next(filter(None, self.soup_handle(x)), None)) if x is not None else None, elements))
+
+        missing = [i for i, (element, element_state) in enumerate(zip(elements, states)) if element is not None and element_state is None]
+        if missing:
+            for i, element_state in zip(missing, self.elements_state([elements[i] for i in missing], positions=True)):
+                states[i] = element_state
+
+        return states
 
     def SetValue(self, field, value, grid=False, grid_number=1, ignore_case=True, row=None, name_attr=False, position = 1, check_value=None):
         """
@@ -1953,6 +2196,7 @@ class WebappInternal(Base):
 
         return web_value
 
+    @test_context.tracked
     def CheckResult(self, field, user_value, grid=False, line=1, grid_number=1, name_attr=False, input_field=True, direction=None):
         """
         Checks if a field has the value the user expects.
@@ -2009,7 +2253,7 @@ class WebappInternal(Base):
             if not element:
                 self.log_error(f"Couldn't find element: {field}")
 
-            field_element = lambda: self.driver.find_element_by_xpath(xpath_soup(element))
+            field_element = lambda: self.driver.find_element(*self.soup_locator(element))
             self.set_element_focus(field_element())
             self.scroll_to_element(field_element())
             endtime = time.time() + self.config.time_out
@@ -2080,7 +2324,7 @@ class WebappInternal(Base):
             while ( (time.time() < endtime) and (not element) and (not hasattr(element, "name")) and (not hasattr(element, "parent"))):           
                 element = self.get_field(field)
                 if ( hasattr(element, "name") and hasattr(element, "parent") ):
-                    selenium_element = lambda: self.driver.find_element_by_xpath(xpath_soup(element))
+                    selenium_element = lambda: self.driver.find_element(*self.soup_locator(element))
                     value = self.get_web_value(selenium_element())
         else:
             field_array = [line-1, field, "", grid_number-1]
@@ -2366,7 +2610,16 @@ class WebappInternal(Base):
             endtime = time.time() + self.config.time_out
             container =  None
             while(time.time() < endtime and container is None):
-                soup = self.get_current_DOM()
+                container_selector = self.base_container
+                if (main_container is not None):
+                    container_selector = main_container
+
+                if self.container_DOM_enabled(container_selector):
+                    soup = self.get_container_DOM(container_selector)
+                    containers = [soup] if soup else []
+                else:
+                    soup = self.get_current_DOM()
+                    containers = None
 
                 if check_error:
                     self.search_for_errors(check_help)
@@ -2375,11 +2628,8 @@ class WebappInternal(Base):
                     with open(f"{term + str(scrap_type) + str(optional_term) + str(label) + str(main_container) + str(random.randint(1, 101)) }.txt", "w") as text_file:
                         text_file.write(f" HTML CONTENT: {str(soup)}")
 
-                container_selector = self.base_container
-                if (main_container is not None):
-                    container_selector = main_container
-
-                containers = self.zindex_sort(soup.select(container_selector), reverse=True) 
+                if containers is None:
+                    containers = self.zindex_sort(soup.select(container_selector), reverse=True) 
 
                 if self.base_container in container_selector:
                     container = self.containers_filter(containers)
@@ -2422,6 +2672,10 @@ class WebappInternal(Base):
         soup = None
         top_layer = None
 
+        if self.container_DOM_enabled(".tmodaldialog, .ui-dialog"):
+            top_layer = self.get_container_DOM(".tmodaldialog, .ui-dialog")
+            soup = top_layer
+
         while(time.time() < endtime and not soup):
             soup = self.get_current_DOM()
 
@@ -2429,7 +2683,8 @@ class WebappInternal(Base):
             if not soup:
                 self.log_error("Search for erros couldn't find DOM")
             message = ""
-            top_layer = next(iter(self.zindex_sort(soup.select(".tmodaldialog, .ui-dialog"), True)), None)
+            if not top_layer:
+                top_layer = next(iter(self.zindex_sort(soup.select(".tmodaldialog, .ui-dialog"), True)), None)
 
         except AttributeError as e:
             self.log_error(f"Search for erros couldn't find DOM\n Exception: {str(e)}")
@@ -2454,14 +2709,14 @@ class WebappInternal(Base):
         elif icon_error_log:
             label = reduce(lambda x,y: f"{x} {y}", map(lambda x: x.text.strip(), top_layer.select(".tsay label")))
             textarea = next(iter(top_layer.select("textarea")), None)
-            textarea_value = self.driver.execute_script(f"return arguments[0].value", self.driver.find_element_by_xpath(xpath_soup(textarea)))
+            textarea_value = self.driver.execute_script(f"return arguments[0].value", self.driver.find_element(*self.soup_locator(textarea)))
 
             error_paragraphs = textarea_value.split("\n\n")
             error_message = f"Error Log: {error_paragraphs[0]} - {error_paragraphs[1]}" if len(error_paragraphs) > 2 else label
             message = error_message.replace("\n", " ")
 
             button = next(iter(filter(lambda x: self.language.details.lower() in x.text.lower(),top_layer.select("button"))), None)
-            self.click(self.driver.find_element_by_xpath(xpath_soup(button)))
+            self.click(self.driver.find_element(*self.soup_locator(button)))
             time.sleep(1)
         self.restart_counter += 1
         self.log_error(message)
@@ -2477,8 +2732,8 @@ class WebappInternal(Base):
         >>> # Calling the method:
         >>> self.get_function_from_stack()
         """
-        stack_item = next(iter(filter(lambda x: x.filename == self.config.routine, inspect.stack())), None)
-        return stack_item.function if stack_item and stack_item.function else "function_name"
+        stack_item = next(iter(filter(lambda x: x.f_code.co_filename == self.config.routine, test_context.frames())), None)
+        return stack_item.f_code.co_name if stack_item and stack_item.f_code.co_name else "function_name"
 
     def create_message(self, args, message_type=enum.MessageType.CORRECT):
         """
@@ -2548,6 +2803,17 @@ class WebappInternal(Base):
         element_list = []
         containers = None
 
+        if self.config.browser_query and scrap_type in (enum.ScrapType.TEXT, enum.ScrapType.MIXED, enum.ScrapType.CSS_SELECTOR):
+            if check_error:
+                self.search_for_errors()
+
+            count = self.query_elements(term, scrap_type, optional_term, main_container, labels=True)
+            if count is not None:
+                if position == 0:
+                    return count > 0
+                else:
+                    return count >= position
+
         if scrap_type == enum.ScrapType.SCRIPT:
             return bool(self.driver.execute_script(term))
         elif (scrap_type != enum.ScrapType.MIXED and not (scrap_type == enum.ScrapType.TEXT and not re.match(r"\w+(_)", term))):
@@ -2561,7 +2827,16 @@ class WebappInternal(Base):
                 selector = f"[name*='{term}']"
 
             if scrap_type != enum.ScrapType.XPATH:
-                soup = self.get_current_DOM()
+                container_selector = self.base_container
+                if (main_container is not None):
+                    container_selector = main_container
+
+                if self.container_DOM_enabled(container_selector):
+                    top_container = self.get_container_DOM(container_selector)
+                    soup = top_container
+                else:
+                    top_container = None
+                    soup = self.get_current_DOM()
 
                 if not soup:
                     return False
@@ -2569,12 +2844,8 @@ class WebappInternal(Base):
                 if check_error:
                     self.search_for_errors()
 
-                container_selector = self.base_container
-                if (main_container is not None):
-                    container_selector = main_container
-
                 try:
-                    containers_soup = soup.select(container_selector)
+                    containers_soup = [top_container] if top_container else soup.select(container_selector)
 
                     if not containers_soup:
                         return False
@@ -2594,7 +2865,7 @@ class WebappInternal(Base):
                     return False
 
                 try:
-                    container_element = self.driver.find_element_by_xpath(xpath_soup(container))
+                    container_element = self.driver.find_element(*self.soup_locator(container))
                 except:
                     return False
             else:
@@ -2662,7 +2933,7 @@ class WebappInternal(Base):
                 if not menuitem_presence and submenu:
                     submenu().click()
                 subMenuElements = menu.select(".tmenuitem")
-                subMenuElements = list(filter(lambda x: self.element_is_displayed(x), subMenuElements))
+                subMenuElements = self.filter_is_displayed(subMenuElements)
                 while not subMenuElements or len(subMenuElements) < self.children_element_count(f"#{child.attrs['id']}", ".tmenuitem"):
                     menu = self.get_current_DOM().select(f"#{child.attrs['id']}")[0]
                     subMenuElements = menu.select(".tmenuitem")
@@ -2670,7 +2941,7 @@ class WebappInternal(Base):
                         self.restart_counter += 1
                         self.log_error(f"Couldn't find menu item: {menuitem}")
                 child = list(filter(lambda x: x.text.startswith(menuitem) and EC.element_to_be_clickable((By.XPATH, xpath_soup(x))), subMenuElements))[0]
-                submenu = lambda: self.driver.find_element_by_xpath(xpath_soup(child))
+                submenu = lambda: self.driver.find_element(*self.soup_locator(child))
                 if subMenuElements and submenu():
                     self.scroll_to_element(submenu())
                     self.wait_until_to( expected_condition = "element_to_be_clickable", element = child, locator = By.XPATH )
@@ -2714,7 +2985,7 @@ class WebappInternal(Base):
     
     def tmenuitem_element(self, menu):
         subMenuElements = menu.select(".tmenuitem")
-        subMenuElements = list(filter(lambda x: self.element_is_displayed(x), subMenuElements))
+        subMenuElements = self.filter_is_displayed(subMenuElements)
 
 
     def children_element_count(self, element_selector, children_selector):
@@ -2810,7 +3081,7 @@ class WebappInternal(Base):
 
             while(time.time() < endtime and not soup_element):
                 soup_objects = self.web_scrap(term=button, scrap_type=enum.ScrapType.MIXED, optional_term="button, .thbutton", main_container = self.containers_selectors["SetButton"], check_error=check_error)
-                soup_objects = list(filter(lambda x: self.element_is_displayed(x), soup_objects ))
+                soup_objects = self.filter_is_displayed(soup_objects)
 
 
                 if soup_objects and len(soup_objects) - 1 >= position:
@@ -2868,7 +3139,7 @@ class WebappInternal(Base):
                     self.tmenu_out_iframe = False
 
                     soup_objects = self.web_scrap(term=button, scrap_type=enum.ScrapType.MIXED, optional_term="button, .thbutton", main_container = self.containers_selectors["SetButton"], check_error=check_error)
-                    soup_objects = list(filter(lambda x: self.element_is_displayed(x), soup_objects ))
+                    soup_objects = self.filter_is_displayed(soup_objects)
                     if soup_objects and len(soup_objects) - 1 >= position:
                         soup_element = lambda : self.soup_to_selenium(soup_objects[position])
                     else:
@@ -2965,7 +3236,7 @@ class WebappInternal(Base):
             self.driver.switch_to.default_content()
             
         content = self.driver.page_source
-        soup = BeautifulSoup(content,"html.parser")
+        soup = self.parse_html(content)
 
         menu_id = self.zindex_sort(soup.select(".tmenupopup.active"), True)[0].attrs["id"]
         menu = self.driver.find_element_by_id(menu_id)
@@ -3105,6 +3376,10 @@ class WebappInternal(Base):
         while(time.time() < endtime):
 
             element = None
+
+            if self.config.event_wait:
+                self.wait_element_event(term=string, scrap_type=enum.ScrapType.MIXED, presence=False, optional_term=".tsay, .tgroupbox",
+                    main_container=self.containers_selectors["AllContainers"], timeout=endtime - time.time(), between_chunks=lambda: self.search_for_errors(check_help=False))
             
             element = self.web_scrap(term=string, scrap_type=enum.ScrapType.MIXED, optional_term=".tsay, .tgroupbox", main_container = self.containers_selectors["AllContainers"], check_help=False)
 
@@ -3140,6 +3415,10 @@ class WebappInternal(Base):
 
             element = None
 
+            if self.config.event_wait:
+                self.wait_element_event(term=string, scrap_type=enum.ScrapType.MIXED, optional_term=".tsay, .tgroupbox",
+                    main_container=self.containers_selectors["AllContainers"], timeout=endtime - time.time(), between_chunks=lambda: self.search_for_errors(check_help=False))
+
             element = self.web_scrap(term=string, scrap_type=enum.ScrapType.MIXED, optional_term=".tsay, .tgroupbox", main_container = self.containers_selectors["AllContainers"], check_help=False)
 
             if element:
@@ -3187,7 +3466,7 @@ class WebappInternal(Base):
         """
         try:
             field = self.get_field("cPesq", name_attr=True)
-            element = lambda: self.driver.find_element_by_xpath(xpath_soup(field))
+            element = lambda: self.driver.find_element(*self.soup_locator(field))
             self.click(element())
             self.send_keys(element(), table)
             time.sleep(0.5)
@@ -3281,11 +3560,8 @@ class WebappInternal(Base):
             self.wait_element_timeout(term=self.language.invert_selection, scrap_type=enum.ScrapType.MIXED, optional_term="label span")
 
         grid = self.get_grid(grid_number)
-        column_enumeration = list(enumerate(grid.select("thead label")))
-        chosen_column = next(iter(list(filter(lambda x: field in x[1].text, column_enumeration))), None)
-        if chosen_column:
-            column_index = chosen_column[0]
-        else:
+        column_index = self.get_header_index(grid).contains(field)
+        if column_index is None:
             self.log_error("Couldn't find chosen column.")
 
         content_list = content_list.split(",")
@@ -3296,7 +3572,7 @@ class WebappInternal(Base):
             self.wait_element(term=self.language.invert_selection, scrap_type=enum.ScrapType.MIXED, optional_term="label span")
             element = next(iter(self.web_scrap(term="label.tcheckbox input", scrap_type=enum.ScrapType.CSS_SELECTOR)), None)
             if element:
-                box = lambda: self.driver.find_element_by_xpath(xpath_soup(element))
+                box = lambda: self.driver.find_element(*self.soup_locator(element))
                 self.click(box())
 
         elif select_all and not is_select_all_button:
@@ -3312,9 +3588,9 @@ class WebappInternal(Base):
                 grid = self.get_grid(grid_number)
                 self.ScrollGrid(column=field, match_value=item, grid_number=grid_number+1)
                 get_current = lambda: self.selected_row(grid_number)
-                column_enumeration = list(enumerate(grid.select("thead label")))
-                chosen_column = next(iter(list(filter(lambda x: field in x[1].text, column_enumeration))), None)
-                column_index = chosen_column[0] if chosen_column else self.log_error("Couldn't find chosen column.")
+                column_index = self.get_header_index(grid).contains(field)
+                if column_index is None:
+                    self.log_error("Couldn't find chosen column.")
                 self.wait_selected_row( grid_number, column_index, field)
                 current = get_current()
 
@@ -3369,7 +3645,7 @@ class WebappInternal(Base):
 
             if tpanels:
 
-                tpanels_filtered = list(filter(lambda x: self.element_is_displayed(x), tpanels))
+                tpanels_filtered = self.filter_is_displayed(tpanels)
 
                 element = next(iter(list(filter(lambda x: x.attrs["id"] == parent_id, tpanels_filtered))), None)
 
@@ -3398,18 +3674,16 @@ class WebappInternal(Base):
         >>> oHelper.ScrollGrid(column="Branch", match_value="D MG 01 ", grid_number=2)
         """
         grid_number -= 1
-        td_element = None
-        actions = ActionChains(self.driver)
-        
+
         self.wait_element_timeout(term = column, scrap_type = enum.ScrapType.TEXT, timeout = self.config.time_out , optional_term = 'label')
         endtime = time.time() + self.config.time_out
         
         grid = self.get_grid(grid_number)
         get_current = lambda: self.selected_row(grid_number)
 
-        column_enumeration = list(enumerate(grid.select("thead label")))
-        chosen_column = next(iter(list(filter(lambda x: column in x[1].text, column_enumeration))), None)
-        column_index = chosen_column[0] if chosen_column else self.log_error("Couldn't find chosen column.")
+        column_index = self.get_header_index(grid).contains(column)
+        if column_index is None:
+            self.log_error("Couldn't find chosen column.")
             
         current = get_current()
         td = lambda: next(iter(current.select(f"td[id='{column_index}']")), None)
@@ -3418,27 +3692,142 @@ class WebappInternal(Base):
         if (not self.click_grid_td(td()) and not frozen_table):
             self.log_error(" Couldn't click on column, td class or tr is not selected ")
 
-        while( time.time() < endtime and  not td_element ):
-            
-            grid = self.get_grid(grid_number)
-            current = get_current()
+        seek = self.grid_seek(grid, column_index, match_value, endtime)
 
-            td_list = grid.select(f"td[id='{column_index}']")
-            td_element_not_filtered = next(iter(td_list), None)
-            td_list_filtered  = list(filter(lambda x: x.text.strip() == match_value and self.element_is_displayed(x) ,td_list))
-            td_element = next(iter(td_list_filtered), None)
+        if not seek or not seek["cell"]:
+            self.log_error("Scroll Grid couldn't find the element")
 
-            if not td_element and next(self.scroll_grid_check_elements_change(xpath_soup(td_element_not_filtered))):
-                actions.key_down(Keys.PAGE_DOWN).perform()
-                self.wait_element_is_not_displayed(td().parent)
+        if frozen_table and seek["sibling"]:
+            seek["sibling"].click()
 
-        if not td_element:
-            self.log_error("Scroll Grid couldn't find the element")
+        self.click(seek["cell"])
 
-        if frozen_table:
-            self.soup_to_selenium(td_element.next_sibling).click()
-            
-        self.click(self.soup_to_selenium(td_element))
+    def grid_seek(self, grid, column_index, match_value, endtime):
+        """
+        [Internal]
+
+        Scrolls a grid until a displayed cell of the column has the value and returns the GRID_SEEK result with the cell.
+
+        The rendered rows are searched in the browser with a single script call per page, and after each
+        key press the script waits for the grid content to change instead of reading the page again.
+        While the pages read show the column strictly increasing, the PAGE_DOWN strides grow geometrically
+        and are halved (backing up with PAGE_UP) when the value is passed, so only the pages near the value
+        are visited one by one. Columns that aren't sorted are visited page by page and, if the strides
+        skipped pages without finding the value (repeated values or a composite index can make a column
+        look sorted), the grid is scrolled back and walked page by page.
+
+        :param grid: The grid.
+        :type grid: BeautifulSoup object
+        :param column_index: The id of the cells of the column.
+        :type column_index: int
+        :param match_value: The value to be matched.
+        :type match_value: str
+        :param endtime: The time limit of the search.
+        :type endtime: float
+
+        :return: The GRID_SEEK result (grid, cell, sibling, values and hash) or None if the grid doesn't exist anymore.
+        :rtype: dict
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> seek = self.grid_seek(grid, 2, "D MG 01 ", time.time() + self.config.time_out)
+        """
+        handle = self.soup_handle(grid)
+        increasing = lambda values: all(map(lambda x: x[0] < x[1], zip(values, values[1:])))
+
+        stride = 1
+        key = Keys.PAGE_DOWN
+        bracketed = False
+        skipped = False
+        moved = 0
+        ordered_pages = 0
+        last_values = None
+        seek = None
+
+        while(time.time() < endtime):
+            seek = self.grid_seek_page(handle, column_index, match_value)
+
+            if not seek or seek["cell"]:
+                return seek
+
+            values = seek["values"]
+            ordered = len(values) > 1 and increasing(values)
+
+            if ordered and last_values and key == Keys.PAGE_DOWN and stride == 1:
+                ordered = last_values[-1] < values[0]
+
+            ordered_pages = ordered_pages + 1 if ordered else 0
+            last_values = values
+
+            if ordered_pages >= 2:
+                if values[0] <= match_value <= values[-1]:
+                    break
+
+                next_key = Keys.PAGE_UP if match_value < values[0] else Keys.PAGE_DOWN
+                if next_key != key:
+                    bracketed = True
+                    stride = max(stride // 2, 1)
+                elif not bracketed and ordered_pages > 2:
+                    stride *= 2
+                key = next_key
+            else:
+                key, stride, bracketed = Keys.PAGE_DOWN, 1, False
+
+            changed = self.grid_seek_scroll(seek, key, stride, endtime)
+
+            if changed is not False:
+                skipped = skipped or stride > 1 or key == Keys.PAGE_UP
+                moved += stride if key == Keys.PAGE_DOWN else -stride
+            elif stride == 1:
+                break
+            else:
+                stride = 1
+                bracketed = True
+
+        if not skipped or time.time() >= endtime:
+            return seek
+
+        logger().debug("Scroll grid: the value wasn't found by the strides, walking the grid page by page")
+
+        if moved > 0:
+            self.grid_seek_scroll(seek, Keys.PAGE_UP, moved, endtime)
+
+        while(time.time() < endtime):
+            seek = self.grid_seek_page(handle, column_index, match_value)
+
+            if not seek or seek["cell"] or self.grid_seek_scroll(seek, Keys.PAGE_DOWN, 1, endtime) is False:
+                return seek
+
+        return seek
+
+    def grid_seek_page(self, handle, column_index, match_value):
+        """
+        [Internal]
+
+        Searches the displayed cells of the column for the value with GRID_SEEK. Returns None if the script fails.
+        """
+        try:
+            return self.driver.execute_script(browser_scripts.GRID_SEEK, handle, str(column_index), match_value)
+        except WebDriverException as e:
+            logger().debug(f"Warning grid_seek exception: {str(e)}")
+            return None
+
+    def grid_seek_scroll(self, seek, key, stride, endtime):
+        """
+        [Internal]
+
+        Presses the key stride times on the grid and waits for its content to change. Returns the result of wait_content_change.
+        """
+        if self.config.debug_log:
+            logger().debug(f"Scroll grid: {stride} x {'PAGE_UP' if key == Keys.PAGE_UP else 'PAGE_DOWN'}")
+
+        actions = ActionChains(self.driver)
+        for _ in range(stride):
+            actions.key_down(key)
+        actions.perform()
+
+        return self.wait_content_change(seek["hash"], lambda: seek["grid"], ".tgetdados,.tgrid,.tcbrowse,.tmsselbr", timeout=min(max(endtime - time.time(), 0), 10))
 
     def click_grid_td(self, td_soup):
         """
@@ -3471,21 +3860,6 @@ class WebappInternal(Base):
                 pass
         return success
 
-    def scroll_grid_check_elements_change(self, xpath):
-        """
-        [Internal]
-        Used to check PG_DOWN correct execute. 
-
-        """
-        elements_set = set()
-        elements_set.add(xpath)
-        yield True if xpath else False
-        while(True):
-            old_lenght = len(elements_set)
-            elements_set.add(xpath)
-            yield True if len(elements_set) > old_lenght and xpath  else False
-
-
     def selected_row(self, grid_number = 0):
         """
         [Internal]
@@ -3562,7 +3936,7 @@ class WebappInternal(Base):
                 grids = self.web_scrap(term= grid_element, scrap_type=enum.ScrapType.CSS_SELECTOR)
 
             if grids:
-                grids = list(filter(lambda x: self.element_is_displayed(x), grids))
+                grids = self.filter_is_displayed(grids)
 
                 if grids:
                     if len(grids) - 1 >= grid_number:
@@ -3916,7 +4290,7 @@ class WebappInternal(Base):
         if not input_element:
             self.log_error("Couldn't find input element")
 
-        xpath_input = lambda: self.driver.find_element_by_xpath(xpath_soup(input_element))
+        xpath_input = lambda: self.driver.find_element(*self.soup_locator(input_element))
 
         if input_element.attrs['type'] == "checkbox" and "checked" in input_element.parent.attrs['class']:
             return None
@@ -4019,13 +4393,16 @@ class WebappInternal(Base):
         """
         self.grid_check.append([line, column, value, grid_number])
 
-    def LoadGrid(self):
+    def LoadGrid(self, batch=False):
         """
         This method is responsible for running all actions of the input and check queues
         of a grid. After running, the queues would be empty.
 
         Must be called after SetValue and CheckResult calls that has the grid parameter set to True.
 
+        :param batch: Fills the consecutive text cells of the same row together (see fill_grid_batch). - **Default:** False
+        :type batch: bool
+
         Usage:
 
         >>> # After SetValue:
@@ -4048,17 +4425,33 @@ class WebappInternal(Base):
             soup = self.get_current_DOM()
             initial_layer = len(soup.select(".tmodaldialog"))
 
-        for field in self.grid_input:
-            if field[3] and field[0] == "":
+        segment = []
+        for field in self.grid_input + [None]:
+            batchable = batch and field is not None and not (field[3] and field[0] == "") and isinstance(field[1], str) and field[1] != ""
+
+            if segment and (not batchable or (field[2], field[4]) != (segment[0][2], segment[0][4])):
+                self.wait_blocker()
+                self.fill_grid_batch(segment, x3_dictionaries, initial_layer)
+                segment = []
+
+            if batchable:
+                segment.append(field)
+            elif field is None:
+                break
+            elif field[3] and field[0] == "":
                 self.new_grid_line(field)
             else:
                 self.wait_blocker()
                 logger().info(f"Filling grid field: {field[0]}")
                 self.fill_grid(field, x3_dictionaries, initial_layer)
 
-        for field in self.grid_check:
-            logger().info(f"Checking grid field value: {field[1]}")
-            self.check_grid(field, x3_dictionaries)
+        if self.config.bulk_grid_check and self.grid_check:
+            logger().info(f"Checking grid field values: {', '.join(map(lambda x: x[1], self.grid_check))}")
+            self.check_grid_queue(self.grid_check, x3_dictionaries)
+        else:
+            for field in self.grid_check:
+                logger().info(f"Checking grid field value: {field[1]}")
+                self.check_grid(field, x3_dictionaries)
 
         self.clear_grid()
 
@@ -4255,7 +4648,7 @@ class WebappInternal(Base):
                         if child_type == "input":
 
                             time.sleep(2)
-                            selenium_input = lambda: self.driver.find_element_by_xpath(xpath_soup(child[0]))
+                            selenium_input = lambda: self.driver.find_element(*self.soup_locator(child[0]))
                             self.wait_element(term=xpath_soup(child[0]), scrap_type=enum.ScrapType.XPATH)
                             valtype = selenium_input().get_attribute("valuetype")
                             lenfield = len(self.get_element_value(selenium_input()))
@@ -4318,7 +4711,7 @@ class WebappInternal(Base):
                         else:
                             option_text_list = list(filter(lambda x: field[1] == x[0:len(field[1])], map(lambda x: x.text ,child[0].select('option'))))
                             option_value_dict = dict(map(lambda x: (x.attrs["value"], x.text), child[0].select('option')))
-                            option_value = self.get_element_value(self.driver.find_element_by_xpath(xpath_soup(child[0])))
+                            option_value = self.get_element_value(self.driver.find_element(*self.soup_locator(child[0])))
                             option_text = next(iter(option_text_list), None)
                             if not option_text:
                                 self.log_error("Couldn't find option")
@@ -4327,7 +4720,7 @@ class WebappInternal(Base):
                                 if field[1] in option_text[0:len(field[1])]:
                                     current_value = field[1]
                             else:
-                                self.send_keys(self.driver.find_element_by_xpath(xpath_soup(child[0])), Keys.ENTER)
+                                self.send_keys(self.driver.find_element(*self.soup_locator(child[0])), Keys.ENTER)
                                 current_value = field[1]
             
             if not check_value:
@@ -4338,6 +4731,165 @@ class WebappInternal(Base):
             self.check_grid_error(grids, headers, column_name, rows, columns, field)
             self.log_error(f"Current value: {current_value} | Couldn't fill input: {field_one} value in Column: '{column_name}' of Grid: '{headers[field[2]].keys()}'.")
 
+    def fill_grid_batch(self, fields, x3_dictionaries, initial_layer):
+        """
+        [Internal]
+
+        Fills a sequence of cells of the same grid row, resolving the grid, the headers and the row only once.
+
+        For each cell the editor is opened, the value is typed and committed in a single key sequence
+        and the editor is awaited in the browser (see wait_grid_editor). The row is read once at the end
+        (see grid_rows_text) and only the cells with a different value are filled again by fill_grid,
+        which recovers lost lines. Cells that can't be resolved (or were re-rendered by an earlier commit), or whose
+        editor isn't an input, are filled by fill_grid.
+
+        :param fields: Items from the grid's input queue with the same grid and row.
+        :type fields: List of List of values
+        :param x3_dictionaries: Tuple of dictionaries containing information extracted from x3.
+        :type x3_dictionaries: Tuple of dictionaries
+        :param initial_layer: The initial layer of elements of Protheus Webapp
+        :type initial_layer: int
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> self.fill_grid_batch([["A1_COD", "000001", 0, False, None, True], ["A1_NOME", "TEST", 0, False, None, True]], x3_dictionaries, 0)
+        """
+        field_to_valtype, field_to_len, field_to_label = x3_dictionaries if x3_dictionaries else ({}, {}, {})
+        grid_number, line = fields[0][2], fields[0][4]
+        fill_each = lambda items: list(map(lambda x: self.fill_grid(x, x3_dictionaries, initial_layer), items))
+
+        endtime = time.time() + self.config.time_out
+        while(self.element_exists(term=".tmodaldialog", scrap_type=enum.ScrapType.CSS_SELECTOR, position=initial_layer+1, main_container="body") and time.time() < endtime):
+            logger().debug("Waiting for container to be active")
+            time.sleep(1)
+
+        container = self.get_current_container()
+        grids = self.filter_displayed_elements(container.select(".tgetdados, .tgrid, .tcbrowse")) if container else None
+
+        if not grids:
+            return fill_each(fields)
+
+        headers = self.get_headers_from_grids(grids)
+
+        if grid_number >= len(grids) or grid_number >= len(headers):
+            return fill_each(fields)
+
+        grid = grids[grid_number]
+        grid_id = grid.attrs.get("id")
+        if grid_id not in self.grid_counters:
+            self.grid_counters[grid_id] = 0
+
+        rows = grid.select("tbody tr")
+        if line is not None and not 0 <= line < len(rows):
+            return fill_each(fields)
+
+        row = rows[line] if line else self.get_selected_row(rows) or next(iter(rows), None)
+        if not row or (line is None and self.down_loop_grid and int(row.attrs.get("id", 0)) < self.grid_counters[grid_id]):
+            return fill_each(fields)
+
+        columns = row.select("td")
+        filled = []
+
+        for field in fields:
+            logger().info(f"Filling grid field: {field[0]}")
+            column_name = (field_to_label.get(field[0]) if "_" in field[0] else field[0]) or ""
+            column_number = headers[grid_number].get(column_name.lower().strip())
+
+            if column_number is None or column_number >= len(columns):
+                fill_each([field])
+                continue
+
+            try:
+                cell = self.driver.find_element(*self.soup_locator(columns[column_number]))
+                self.scroll_to_element(cell)
+                self.click(cell)
+                ActionChains(self.driver).move_to_element(cell).send_keys_to_element(cell, Keys.ENTER).perform()
+            except WebDriverException as e:
+                logger().debug(f"Warning fill_grid_batch couldn't open the cell of {field[0]}: {str(e)}")
+                fill_each([field])
+                continue
+
+            editor = self.wait_grid_editor(timeout=self.config.time_out / 4)
+            if not editor or editor["tag"] != "input":
+                if editor:
+                    self.send_keys(editor["editor"], Keys.ESCAPE)
+                    self.wait_grid_editor(editor["editor"], timeout=self.config.time_out / 4)
+                fill_each([field])
+                continue
+
+            user_value = field[1]
+            check_mask = self.check_mask(editor["editor"])
+            if check_mask:
+                if (check_mask[0].startswith('@D') and user_value == ''):
+                    user_value = '00000000'
+                user_value = self.remove_mask(user_value)
+
+            numeric = editor["valuetype"] == "N" and not ("_" in field[0] and field_to_valtype and field_to_valtype.get(field[0]) != "N")
+            shorter = ("_" in field[0] and str(field_to_len.get(field[0], "")).isdigit() and int(field_to_len[field[0]]) > len(field[1])) or editor["length"] > len(field[1])
+
+            actions = ActionChains(self.driver).send_keys_to_element(editor["editor"], Keys.HOME)
+            actions.key_down(Keys.SHIFT).send_keys(Keys.END).key_up(Keys.SHIFT).send_keys(user_value)
+            if shorter and not (numeric and re.match(r"[0-9]+,[0-9]+", user_value)):
+                actions.send_keys(Keys.ENTER)
+            actions.perform()
+
+            if not self.wait_grid_editor(editor["editor"], timeout=self.config.time_out / 4):
+                try:
+                    self.send_keys(editor["editor"], Keys.ENTER)
+                except WebDriverException:
+                    pass
+                self.wait_grid_editor(editor["editor"], timeout=self.config.time_out / 4)
+
+            filled.append((field, column_number))
+
+        self.clear_dom_cache()
+
+        if filled:
+            rows_text = self.grid_rows_text(grid, [rows.index(row)])
+            cells = next(iter(rows_text), None) if rows_text else None
+            expected = lambda x: self.remove_mask(x[0][1]).strip().replace(',', '')
+            current = lambda x: self.remove_mask(cells[x[1]]).strip().replace(',', '') if cells and x[1] < len(cells) else None
+            fill_each(map(lambda x: x[0], filter(lambda x: x[0][5] and current(x) != expected(x), filled)))
+
+    def wait_grid_editor(self, editor=None, timeout=5):
+        """
+        [Internal]
+
+        Waits in the browser for the cell editor of a grid to be opened or, if *editor* is informed, closed.
+
+        :param editor: The input of an opened editor. - **Default:** None
+        :type editor: Selenium object
+        :param timeout: The maximum amount of time of wait. - **Default:** 5
+        :type timeout: float
+
+        :return: Without an editor, a dict with the editor, tag, valuetype and length of the value, or None.
+        Otherwise True if the editor was closed.
+        :rtype: dict or bool
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> editor = self.wait_grid_editor()
+        >>> closed = self.wait_grid_editor(editor["editor"])
+        """
+        endtime = time.time() + timeout
+        result = None
+
+        while not result and time.time() < endtime:
+            chunk = min(max(endtime - time.time(), 0), 2)
+            try:
+                result = self.driver.execute_async_script(browser_scripts.WAIT_GRID_EDITOR, editor, int(chunk * 1000))
+            except WebDriverException as e:
+                logger().debug(f"Warning wait_grid_editor exception: {str(e)}")
+                result = None
+                time.sleep(0.1)
+
+            if editor and result:
+                result = result["closed"]
+
+        return result
+
     def get_selenium_column_element(self, xpath):
         """
         [Internal]
@@ -4499,6 +5051,126 @@ class WebappInternal(Base):
         if not success:
             self.check_grid_error( grids, headers, column_name, rows, columns, field )
 
+    def check_grid_queue(self, checks, x3_dictionaries):
+        """
+        [Internal]
+
+        Checks all the items of the grid's check queue against a single snapshot of the grids.
+
+        The header map of each grid is built once and every cell is read from the snapshot.
+        Only the rows of the checks that couldn't be read are read again (see grid_rows_text),
+        and a new snapshot is taken only if a grid or a column is missing.
+        All values are compared with log_result before the error of the first check that couldn't be read.
+
+        :param checks: Items from the grid's check queue
+        :type checks: List of List of values
+        :param x3_dictionaries: Tuple of dictionaries containing information extracted from x3.
+        :type x3_dictionaries: Tuple of dictionaries
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> self.check_grid_queue([[0, "A1_COD", "000001", 0], [0, "A1_NOME", "TEST", 0]], x3_dictionaries)
+        """
+        field_to_label = x3_dictionaries[2] if x3_dictionaries else {}
+        column_names = list(map(lambda x: field_to_label.get(x[1], x[1]).lower() if "_" in x[1] else x[1].lower(), checks))
+
+        grids = []
+        headers = []
+        rows = {}
+        cells = {}
+        texts = {}
+
+        column_number = lambda index: headers[checks[index][3]].get(column_names[index]) if checks[index][3] < len(headers) else None
+
+        endtime = time.time() + self.config.time_out
+
+        while(self.element_exists(term=".tmodaldialog .ui-dialog", scrap_type=enum.ScrapType.CSS_SELECTOR, position=3, main_container="body") and time.time() < endtime):
+            if self.config.debug_log:
+                logger().debug("Waiting for container to be active")
+            time.sleep(1)
+
+        while(time.time() < endtime and len(texts) < len(checks)):
+            pending = list(filter(lambda x: x not in texts, range(len(checks))))
+
+            if grids and all(map(lambda x: column_number(x) is not None and checks[x][3] in rows, pending)):
+                for grid_number in set(map(lambda x: checks[x][3], pending)):
+                    lines = sorted(set(map(lambda x: checks[x][0], filter(lambda x: checks[x][3] == grid_number, pending))))
+                    rows_text = self.grid_rows_text(grids[grid_number], lines)
+                    if rows_text is None:
+                        grids = []
+                        break
+                    cells.update(zip(map(lambda x: (grid_number, x), lines), rows_text))
+            else:
+                containers = self.web_scrap(term=".tmodaldialog", scrap_type=enum.ScrapType.CSS_SELECTOR, main_container="body")
+                container = next(iter(self.zindex_sort(containers, True)), None)
+                grids = (self.filter_displayed_elements(container.select(".tgetdados, .tgrid, .tcbrowse")) if container else None) or []
+                headers = self.get_headers_from_grids(grids) if grids else []
+                rows = {}
+
+                if grids:
+                    for index in pending:
+                        line, grid_number = checks[index][0], checks[index][3]
+
+                        if grid_number > len(grids):
+                            self.log_error(self.language.messages.grid_number_error)
+                        if grid_number == len(grids):
+                            continue
+
+                        if grid_number not in rows:
+                            rows[grid_number] = grids[grid_number].select("tbody tr")
+
+                        if rows[grid_number] and line > len(rows[grid_number]):
+                            self.log_error(self.language.messages.grid_line_error)
+
+                        if line < len(rows[grid_number]):
+                            cells[(grid_number, line)] = list(map(lambda x: x.text.strip(), rows[grid_number][line].select("td")))
+                        else:
+                            cells[(grid_number, line)] = None
+
+            for index in pending:
+                columns = cells.get((checks[index][3], checks[index][0]))
+                number = column_number(index) if grids else None
+                if columns and number is not None and number < len(columns):
+                    texts[index] = columns[number]
+
+            if len(texts) < len(checks):
+                time.sleep(0.1)
+
+        for index, field in enumerate(checks):
+            text = texts.get(index, "")
+            self.log_result(f"({field[0]}, {column_names[index]})", field[2], text)
+            logger().info(f"Collected value: {text}")
+
+        for index in filter(lambda x: x not in texts, range(len(checks))):
+            field = checks[index]
+            self.check_grid_error(grids, headers, column_names[index], rows.get(field[3]), cells.get((field[3], field[0])), field)
+
+    def grid_rows_text(self, grid, lines):
+        """
+        [Internal]
+
+        Reads again the text of the cells of some rows of a grid with a single script call.
+
+        :param grid: The grid of the rows.
+        :type grid: BeautifulSoup object
+        :param lines: The indexes of the rows.
+        :type lines: List of int
+
+        :return: One list of cell texts per row (None for the rows that don't exist) or None if the grid doesn't exist anymore.
+        :rtype: List of List of str
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> rows_text = self.grid_rows_text(grid, [0, 3])
+        """
+        try:
+            return self.driver.execute_script(browser_scripts.GRID_ROWS_TEXT, self.soup_handle(grid), lines)
+        except WebDriverException as e:
+            logger().debug(f"Warning grid_rows_text exception: {str(e)}")
+            return None
+
     def check_grid_error(self, grid, headers, column_name, rows, columns, field):
         """
         [Internal]
@@ -4561,7 +5233,7 @@ class WebappInternal(Base):
             if row:
                 columns = row.select("td")
                 if columns:
-                    second_column = lambda: self.driver.find_element_by_xpath(xpath_soup(columns[1]))
+                    second_column = lambda: self.driver.find_element(*self.soup_locator(columns[1]))
                     # self.scroll_to_element(second_column())
                     self.driver.execute_script("$('.horizontal-scroll').scrollLeft(-400000);")
                     self.set_element_focus(second_column())
@@ -4644,7 +5316,7 @@ class WebappInternal(Base):
                     if columns:
                         if column_name in headers[grid_number]:
                             column_number = headers[grid_number][column_name]
-                            column_element = lambda : self.driver.find_element_by_xpath(xpath_soup(columns[column_number]))
+                            column_element = lambda : self.driver.find_element(*self.soup_locator(columns[column_number]))
                             if column_element_old_class == None:
                                 column_element_old_class = column_element().get_attribute("class")
 
@@ -4707,7 +5379,6 @@ class WebappInternal(Base):
 
         self.wait_element(term=".tgetdados tbody tr, .tgrid tbody tr, .tcbrowse", scrap_type=enum.ScrapType.CSS_SELECTOR)
         grid  = self.get_grid(grid_number)
-        header = self.get_headers_from_grids(grid)
         if not column_name:
             column_element = grid.select('thead label')[column].parent.parent
             column_element_selenium = self.soup_to_selenium(column_element)
@@ -4715,11 +5386,9 @@ class WebappInternal(Base):
             self.wait_until_to(expected_condition="element_to_be_clickable", element = column_element, locator = By.XPATH )
             column_element_selenium.click()
         else:
-            column_name =column_name.lower()
-            header = self.get_headers_from_grids(grid)
-
-            if column_name in header[grid_number]:
-                column_number = header[grid_number][column_name]
+            column_number = self.get_header_index(grid).index(column_name)
+            if column_number is None:
+                self.log_error(f"{self.language.messages.grid_column_error} Coluna: '{column_name}'")
 
             column_element = grid.select('thead label')[column_number].parent.parent
             column_element_selenium = self.soup_to_selenium(column_element)
@@ -4728,11 +5397,8 @@ class WebappInternal(Base):
             column_element_selenium.click()
 
     def search_column_index(self, grid, column):
-        column_enumeration = list(enumerate(grid.select("thead label")))
-        chosen_column = next(iter(list(filter(lambda x: column in x[1].text, column_enumeration))), None)
-        if chosen_column:
-            column_index = chosen_column[0]
-        else: 
+        column_index = self.get_header_index(grid).contains(column)
+        if column_index is None:
             self.log_error("Couldn't find chosen column.")
 
         return column_index
@@ -4745,6 +5411,8 @@ class WebappInternal(Base):
 
         Dictionaries:Field to Type, Field to Size, Field to Title.
 
+        The x3 file is compiled once into an indexed cache (see Sx3Store), so each call only reads the requested prefixes.
+
         :param fields: List of fields that must be located in x3.
         :type fields: List of str
 
@@ -4756,54 +5424,10 @@ class WebappInternal(Base):
         >>> # Calling the method:
         >>> x3_dictionaries = self.get_x3_dictionaries(field_list)
         """
-        prefixes = list(set(map(lambda x:x.split("_")[0] + "_" if "_" in x else "", fields)))
-        regex = self.generate_regex_by_prefixes(prefixes)
-
         #caminho do arquivo csv(SX3)
-        path = os.path.join(os.path.dirname(__file__), r'core\\data\\sx3.csv')
-
-        #DataFrame para filtrar somente os dados da tabela informada pelo usuário oriundo do csv.
-        data = pd.read_csv(path, sep=';', encoding='latin-1', header=None, error_bad_lines=False,
-                        index_col='Campo', names=['Campo', 'Tipo', 'Tamanho', 'Titulo', 'Titulo_Spa', 'Titulo_Eng', None], low_memory=False)
-        df = pd.DataFrame(data, columns=['Campo', 'Tipo', 'Tamanho', 'Titulo', 'Titulo_Spa', 'Titulo_Eng', None])
-        if not regex:
-            df_filtered = df.query("Tipo=='C' or Tipo=='N' or Tipo=='D' ")
-        else:
-            df_filtered = df.filter(regex=regex, axis=0)
-
-        if self.config.language == "es-es":
-            df_filtered.Titulo = df_filtered.loc[:,('Titulo_Spa')].str.strip()
-        elif self.config.language == "en-us":
-            df_filtered.Titulo = df_filtered.loc[:,('Titulo_Eng')].str.strip()
-        else:
-            df_filtered.Titulo = df_filtered.loc[:,('Titulo')].str.strip()
-
-        df_filtered.index = df_filtered.index.map(lambda x: x.strip())
-
-        dict_ = df_filtered.to_dict()
-
-        return (dict_['Tipo'], dict_['Tamanho'], dict_['Titulo'])
-
-    def generate_regex_by_prefixes(self, prefixes):
-        """
-        [Internal]
-
-        Returns a regex string created by combining all field prefixes.
-
-        :param prefixes: Prefixes of fields to be combined in a regex.
-        :type prefixes: List of str
-
-        Usage:
-
-        >>> # Calling the method:
-        >>> regex = self.generate_regex_by_prefixes(field_prefixes)
-        """
-        filtered_prefixes = list(filter(lambda x: x != "", prefixes))
-        regex = ""
-        for prefix in filtered_prefixes:
-            regex += "^" + prefix + "|"
+        path = os.path.join(os.path.dirname(__file__), "core", "data", "sx3.csv")
 
-        return regex[:-1]
+        return Sx3Store.get(path).lookup(fields, self.config.language)
 
     def get_headers_from_grids(self, grids):
         """
@@ -4824,13 +5448,49 @@ class WebappInternal(Base):
         """
         headers = []
         for item in grids:
-            labels = item.select("thead tr label")
-            if labels:
-                keys = list(map(lambda x: x.text.strip().lower(), labels))
-                values = list(map(lambda x: x[0], enumerate(labels)))
-                headers.append(dict(zip(keys, values)))
+            index = self.get_header_index(item)
+            if index:
+                headers.append(index.columns)
         return headers
 
+    def get_header_index(self, grid):
+        """
+        [Internal]
+
+        Returns the HeaderIndex of a grid.
+
+        The index is kept in the grid object, so the same DOM is read only once, and shared by the grids
+        with the same id and the same header labels, so its lookup tables are built again only when
+        the header changes.
+
+        :param grid: The grid.
+        :type grid: BeautifulSoup object
+
+        :return: The header index of the grid.
+        :rtype: HeaderIndex
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> column_index = self.get_header_index(grid).contains("Branch")
+        """
+        index = grid.__dict__.get("_tir_header_index")
+
+        if index is None:
+            labels = tuple(map(lambda x: x.text, grid.select("thead tr label")))
+            key = (grid.attrs.get("id"), labels)
+            index = self.header_indexes.get(key)
+
+            if index is None:
+                if len(self.header_indexes) >= 256:
+                    self.header_indexes.clear()
+                index = HeaderIndex(labels)
+                self.header_indexes[key] = index
+
+            grid.__dict__["_tir_header_index"] = index
+
+        return index
+
     def add_grid_row_counter(self, grid):
         """
         [Internal]
@@ -4936,14 +5596,20 @@ class WebappInternal(Base):
         if self.config.debug_log:
             logger().debug("Waiting for element")
 
-        if presence:
-            while (not self.element_exists(term, scrap_type, position, optional_term, main_container, check_error) and time.time() < endtime):
-                time.sleep(0.1)
-        else:
-            while (self.element_exists(term, scrap_type, position, optional_term, main_container, check_error) and time.time() < endtime):
-                time.sleep(0.1)
+        success = None
+        if self.config.event_wait:
+            success = self.wait_element_event(term, scrap_type, presence, position, optional_term, main_container, labels=True,
+                between_chunks=self.search_for_errors if check_error else None)
+
+        if success is None:
+            if presence:
+                while (not self.element_exists(term, scrap_type, position, optional_term, main_container, check_error) and time.time() < endtime):
+                    time.sleep(0.1)
+            else:
+                while (self.element_exists(term, scrap_type, position, optional_term, main_container, check_error) and time.time() < endtime):
+                    time.sleep(0.1)
 
-        if time.time() > endtime:
+        if success is False or time.time() > endtime:
             if term == "[name='cGetUser']":
                 self.close_resolution_screen()
             else:
@@ -4958,11 +5624,16 @@ class WebappInternal(Base):
             if self.config.debug_log:
                 logger().debug("Element found! Waiting for element to be displayed.")
 
-            element = next(iter(self.web_scrap(term=term, scrap_type=scrap_type, optional_term=optional_term, main_container=main_container, check_error=check_error)), None)
+            selenium_elements = self.query_elements(term, scrap_type, optional_term, main_container, labels=True, elements=True) if self.config.browser_query else None
+
+            if selenium_elements is not None:
+                element = next(iter(selenium_elements), None)
+            else:
+                element = next(iter(self.web_scrap(term=term, scrap_type=scrap_type, optional_term=optional_term, main_container=main_container, check_error=check_error)), None)
             
             if element is not None:
 
-                sel_element = lambda:self.soup_to_selenium(element)
+                sel_element = lambda:self.soup_to_selenium(element) if selenium_elements is None else element
                 sel_element_isdisplayed = False
 
                 while(not sel_element_isdisplayed and time.time() < presence_endtime):
@@ -5007,7 +5678,14 @@ class WebappInternal(Base):
         >>> self.wait_element_timeout(term=button, scrap_type=enum.ScrapType.MIXED, optional_term="button", timeout=10, step=0.1)
         """
         success = False
-        if presence:
+        event_success = None
+        if self.config.event_wait:
+            event_success = self.wait_element_event(term, scrap_type, presence, position, optional_term, main_container, timeout, labels=True,
+                between_chunks=self.search_for_errors if check_error else None)
+
+        if event_success is not None:
+            success = event_success
+        elif presence:
             endtime = time.time() + timeout
             while time.time() < endtime:
                 time.sleep(step)
@@ -5027,7 +5705,7 @@ class WebappInternal(Base):
                 logger().debug("Element found! Waiting for element to be displayed.")
             element = next(iter(self.web_scrap(term=term, scrap_type=scrap_type, optional_term=optional_term, main_container=main_container, check_error=check_error)), None)
             if element is not None:
-                sel_element = lambda: self.driver.find_element_by_xpath(xpath_soup(element))
+                sel_element = lambda: self.driver.find_element(*self.soup_locator(element))
                 endtime = time.time() + timeout
                 while(time.time() < endtime and not self.element_is_displayed(element)):
                     try:
@@ -5060,9 +5738,10 @@ class WebappInternal(Base):
         if filtered_rows:
             return next(iter(filtered_rows))
         else:
-            filtered_rows = list(filter(lambda x: "selected-row" == self.soup_to_selenium(x).get_attribute('class'), rows))
+            states = self.elements_state(rows)
+            filtered_rows = [row for row, state in zip(rows, states) if state and state["className"] == "selected-row"]
             if filtered_rows:
-                return next(iter(list(filter(lambda x: "selected-row" == self.soup_to_selenium(x).get_attribute('class'), rows))), None)
+                return next(iter(filtered_rows), None)
 
     def SetFilePath(self, value, button = ""):
         """
@@ -5118,13 +5797,13 @@ class WebappInternal(Base):
         self.wait_element(".messagebox-container", enum.ScrapType.CSS_SELECTOR)
 
         content = self.driver.page_source
-        soup = BeautifulSoup(content,"html.parser")
+        soup = self.parse_html(content)
         container = soup.select(".messagebox-container")
         if container:
             buttons = container[0].select(".ui-button")
             button = list(filter(lambda x: x.text.lower() == button_text.lower(), buttons))
             if button:
-                selenium_button = self.driver.find_element_by_xpath(xpath_soup(button[0]))
+                selenium_button = self.driver.find_element(*self.soup_locator(button[0]))
                 self.click(selenium_button)
 
     def get_enchoice_button_ids(self, layer):
@@ -5209,6 +5888,8 @@ class WebappInternal(Base):
             ActionChains(self.driver).key_down(Keys.SHIFT).send_keys(Keys.END).key_up(Keys.SHIFT).perform()
             ActionChains(self.driver).move_to_element(element_function()).send_keys(key).perform()
 
+        self.clear_dom_cache()
+
     def find_label_element(self, label_text, container= None, position = 1, input_field=True, direction=None):
         """
         [Internal]
@@ -5304,6 +5985,7 @@ class WebappInternal(Base):
         except AttributeError:
             return self.search_element_position(label_text)
             
+    @test_context.tracked
     def log_error(self, message, new_log_line=True, skip_restart=False):
         """
         [Internal]
@@ -5362,9 +6044,10 @@ class WebappInternal(Base):
         if self.restart_counter > 2:
 
             if self.config.num_exec and stack_item == "setUpClass" and self.log.checks_empty_line():
-                if not self.num_exec.post_exec(self.config.url_set_end_exec):
-                    self.restart_counter = 3
-                    self.log_error(f"WARNING: Couldn't possible send num_exec to server please check log.")
+                self.num_exec_futures.append(self.num_exec.post_exec(self.config.url_set_end_exec, end=True))
+                num_exec_futures, self.num_exec_futures = self.num_exec_futures, []
+                if not NumExec.wait(num_exec_futures, self.config.num_exec_timeout):
+                    logger().warning("WARNING: Couldn't possible send num_exec to server please check log.")
                 
             if (stack_item == "setUpClass") :
                 try:
@@ -5641,7 +6324,7 @@ class WebappInternal(Base):
                 else:
                     self.Program(self.config.routine)
         else:
-            stack = next(iter(list(map(lambda x: x.function, filter(lambda x: re.search('tearDownClass', x.function), inspect.stack())))), None)
+            stack = next(iter(filter(lambda x: re.search('tearDownClass', x), map(lambda x: x.f_code.co_name, test_context.frames()))), None)
             if(stack and not stack.lower()  == "teardownclass"):
                 self.restart_counter += 1
                 self.log_error(f"Wasn't possible execute parameter_screen() method Exception: {exception}")
@@ -5770,7 +6453,7 @@ class WebappInternal(Base):
         """
         has_text = False
 
-        element_function = lambda: self.driver.find_element_by_xpath(xpath_soup(element))
+        element_function = lambda: self.driver.find_element(*self.soup_locator(element))
         self.driver.execute_script(f"$(arguments[0]).mouseover()", element_function())
         time.sleep(1)
         tooltips = self.driver.find_elements(By.CSS_SELECTOR, ".ttooltip")
@@ -5805,7 +6488,7 @@ class WebappInternal(Base):
         if not field_soup:
             self.log_error(f"Couldn't find field {field}")
 
-        field_element = lambda: self.driver.find_element_by_xpath(xpath_soup(field_soup))
+        field_element = lambda: self.driver.find_element(*self.soup_locator(field_soup))
 
         success = False
         endtime = time.time() + 60
@@ -5962,6 +6645,9 @@ class WebappInternal(Base):
         >>> # Calling the method:
         >>> container = self.get_current_container()
         """
+        if self.container_DOM_enabled(self.containers_selectors["GetCurrentContainer"]):
+            return self.get_container_DOM(self.containers_selectors["GetCurrentContainer"])
+
         soup = self.get_current_DOM()
         containers = self.zindex_sort(soup.select(self.containers_selectors["GetCurrentContainer"]), True)
         return next(iter(containers), None)
@@ -6043,7 +6729,7 @@ class WebappInternal(Base):
 
                 tree_node_filtered = list(filter(lambda x: "hidden" not in x.parent.parent.parent.parent.attrs['class'], tree_node))
 
-                elements = list(filter(lambda x: label_filtered in x.text.lower().strip() and self.element_is_displayed(x), tree_node_filtered))
+                elements = self.filter_is_displayed(list(filter(lambda x: label_filtered in x.text.lower().strip(), tree_node_filtered)))
 
                 if elements:
 
@@ -6052,7 +6738,7 @@ class WebappInternal(Base):
                         if hierarchy:
                              elements = elements if elements.attrs['hierarchy'].startswith(hierarchy) and elements.attrs['hierarchy'] != hierarchy else None
                     else:
-                        elements = list(filter(lambda x: self.element_is_displayed(x), elements))
+                        elements = self.filter_is_displayed(elements)
 
                         if hierarchy:
                             elements = list(filter(lambda x: x.attrs['hierarchy'].startswith(hierarchy) and x.attrs['hierarchy'] != hierarchy, elements))
@@ -6230,7 +6916,7 @@ class WebappInternal(Base):
 
             treenode_parent_id = self.treenode_selected(label).attrs['id']
 
-            treenode = list(filter(lambda x: self.element_is_displayed(x), self.treenode()))
+            treenode = self.filter_is_displayed(self.treenode())
 
             node_check = next(iter(list(filter(lambda x: treenode_parent_id == x.attrs['parentid'], treenode))), None)
 
@@ -6352,6 +7038,7 @@ class WebappInternal(Base):
         grid_lines = grid.select("tbody tr")
         return len(grid_lines)
                 
+    @test_context.tracked
     def TearDown(self):
         """
         Closes the webdriver and ends the test case.
@@ -6364,6 +7051,7 @@ class WebappInternal(Base):
 
         if self.config.new_log:
             self.execution_flow()
+            self.log.flush_json()
 
         webdriver_exception = None
         timeout = 1500
@@ -6394,7 +7082,9 @@ class WebappInternal(Base):
                 self.WaitProcessing(string, timeout)
 
         if self.config.num_exec:
-            if not self.num_exec.post_exec(self.config.url_set_end_exec):
+            self.num_exec_futures.append(self.num_exec.post_exec(self.config.url_set_end_exec, end=True))
+            num_exec_futures, self.num_exec_futures = self.num_exec_futures, []
+            if not NumExec.wait(num_exec_futures, self.config.num_exec_timeout):
                 self.restart_counter = 3
                 self.log_error(f"WARNING: Couldn't possible send num_exec to server please check log.")
 
@@ -6438,7 +7128,7 @@ class WebappInternal(Base):
         """
         
         elements = list(map(lambda x: self.find_first_div_parent(x), container.find_all(text=re.compile(f"^{re.escape(label_text)}" + r"([\s\?:\*\.]+)?"))))
-        return list(filter(lambda x: self.element_is_displayed(x), elements)) if len(elements) > 1 else elements
+        return self.filter_is_displayed(elements) if len(elements) > 1 else elements
 
     def filter_is_displayed(self, elements):
         """
@@ -6450,19 +7140,18 @@ class WebappInternal(Base):
         >>> #Calling the method
         >>> elements = self.filter_is_displayed(elements)
         """
-        return list(filter(lambda x: self.element_is_displayed(x), elements))
+        return list(compress(elements, self.elements_displayed(elements)))
 
     def element_is_displayed(self, element):
         """
         [Internal]
 
         """
-        element_selenium = self.soup_to_selenium(element)
-        if element_selenium:
-            return element_selenium.is_displayed()
-        else:
+        if element is None:
             return False
 
+        return next(iter(self.elements_displayed([element])))
+
     def search_text(self, selector, text):
         """
         [Internal]
@@ -6499,7 +7188,7 @@ class WebappInternal(Base):
         """
         [Internal]
         """
-        stack_item_splited = next(iter(map(lambda x: x.filename.split("\\"), filter(lambda x: "TESTSUITE.PY" in x.filename.upper() or "TESTCASE.PY" in x.filename.upper(), inspect.stack()))), None)
+        stack_item_splited = next(iter(map(lambda x: x.split("\\"), filter(lambda x: "TESTSUITE.PY" in x.upper() or "TESTCASE.PY" in x.upper(), map(lambda x: x.f_code.co_filename, test_context.frames())))), None)
 
         if stack_item_splited:
             get_file_name = next(iter(list(map(lambda x: "TESTSUITE.PY" if "TESTSUITE.PY" in x.upper() else "TESTCASE.PY", stack_item_splited))))
@@ -6611,7 +7300,8 @@ class WebappInternal(Base):
 
         if not element and expected_condition != "alert_is_present" : self.log_error("Error method wait_until_to() - element is None")
 
-        element = xpath_soup(element) if locator == By.XPATH else element
+        if locator == By.XPATH:
+            locator, element = self.soup_locator(element)
 
         if timeout:
             setattr(self.wait, '_timeout', self.config.time_out / 10)
@@ -6772,7 +7462,7 @@ class WebappInternal(Base):
 
             if tmenupopupitem:
 
-                tmenupopupitem_displayed = list(filter(lambda x: self.element_is_displayed(x), tmenupopupitem))
+                tmenupopupitem_displayed = self.filter_is_displayed(tmenupopupitem)
 
                 tmenupopupitem_filtered = list(filter(lambda x: x.text.lower().strip() == label, tmenupopupitem_displayed))
 
@@ -6836,9 +7526,9 @@ class WebappInternal(Base):
         Returns a list if selenium displayed and enabled methods is True.
         """
         if elements:
-            is_displayed = list(filter(lambda x: self.element_is_displayed(x), elements))
+            is_displayed = self.filter_is_displayed(elements)
             
-            return list(filter(lambda x: self.soup_to_selenium(x).is_enabled(), is_displayed))
+            return [x for x, element in zip(is_displayed, self.soups_to_selenium(is_displayed)) if element and element.is_enabled()]
 
     def update_password(self):
         """
@@ -6872,7 +7562,7 @@ class WebappInternal(Base):
         container = self.get_current_container()
         tlist = container.select(".tlistbox")
         list_option = next(iter(list(filter(lambda x: x.select('option'), tlist))))
-        list_option_filtered = list(filter(lambda x: self.element_is_displayed(x), list_option))
+        list_option_filtered = self.filter_is_displayed(list_option)
         element = next(iter(filter(lambda x: x.text.strip() == text.strip(), list_option_filtered)), None)
         element_selenium = self.soup_to_selenium(element)
         self.wait_until_to(expected_condition="element_to_be_clickable", element = element, locator = By.XPATH )
@@ -7053,27 +7743,37 @@ class WebappInternal(Base):
         else:
             self.log_error("Doesn't contain that key in json object")
 
-    def send_action(self, action = None, element = None, value = None, right_click=False):
+    def send_action(self, action = None, element = None, value = None, right_click=False, scope=None):
         """
 
         Sends an action to element and compare it object state change.
+
+        The state is compared by a hash of the page content computed in the browser, which is
+        checked again as soon as the page mutates. If the hash can't be computed, the whole
+        BeautifulSoup trees are compared. If it can't be computed after the action (e.g. the page
+        navigated), the action is considered done instead of being sent again.
     
         :param action: selenium function as a reference like click, actionchains or send_keys.
         :param element: selenium element as a reference
         :param value: send keys value
         :param right_click: True if you want a right click
+        :param scope: Css selector of the closest ancestor of the element whose content is compared. Default is the whole page.
         :return: True if there was a change in the object
         """
 
-        soup_before_event = self.get_current_DOM()
+        content_before_event = self.get_content_hash(element, scope)
+
+        soup_before_event = self.get_current_DOM() if content_before_event is None else None
 
         soup_after_event = soup_before_event
 
         soup_select = None
 
+        changed = False
+
         endtime = time.time() + self.config.time_out
         try:
-            while ((time.time() < endtime) and (soup_before_event == soup_after_event)):
+            while ((time.time() < endtime) and not changed):
 
                 if right_click:
                     soup_select = self.get_soup_select(".tmenupopupitem")
@@ -7088,14 +7788,22 @@ class WebappInternal(Base):
                 elif action:
                     action()
 
+                self.clear_dom_cache()
+
                 if soup_select:
-                    soup_after_event = soup_select
-                elif soup_select == []:
-                    soup_after_event = soup_before_event
+                    changed = True
+                elif content_before_event is not None:
+                    content_changed = self.wait_content_change(content_before_event, element, scope, timeout=1)
+                    if content_changed is None and soup_select != []:
+                        changed = True
+                    elif soup_select != []:
+                        changed = content_changed
                 else:
-                    soup_after_event = self.get_current_DOM()
+                    if soup_select != []:
+                        soup_after_event = self.get_current_DOM()
+                        changed = soup_before_event != soup_after_event
 
-                time.sleep(1)
+                    time.sleep(1)
 
         except Exception as e:
             if self.config.smart_test or self.config.debug_log:
@@ -7103,8 +7811,55 @@ class WebappInternal(Base):
             return False
 
         if self.config.smart_test or self.config.debug_log:
-            logger().debug(f"send_action method result = {soup_before_event != soup_after_event}")
-        return soup_before_event != soup_after_event
+            logger().debug(f"send_action method result = {changed}")
+        return changed
+
+    def get_content_hash(self, element=None, scope=None):
+        """
+        [Internal]
+
+        Returns a hash of the page content computed in the browser.
+
+        :param element: selenium element as a reference
+        :param scope: Css selector of the closest ancestor of the element to be hashed. Default is the whole page.
+        :return: The hash or None if it couldn't be computed.
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> content = self.get_content_hash()
+        """
+        try:
+            return self.driver.execute_script(browser_scripts.CONTENT_HASH, element() if element and scope else None, scope)
+        except WebDriverException as e:
+            logger().debug(f"Warning get_content_hash exception: {str(e)}")
+            return None
+
+    def wait_content_change(self, content, element=None, scope=None, timeout=1):
+        """
+        [Internal]
+
+        Waits until the page content differs from the hash returned by get_content_hash or the timeout is met.
+
+        The content is checked again only when the page mutates, so a change is noticed in milliseconds.
+
+        :param content: The hash returned by get_content_hash.
+        :param element: selenium element as a reference
+        :param scope: Css selector of the closest ancestor of the element to be hashed. Default is the whole page.
+        :param timeout: The maximum amount of time of wait.
+        :return: True if the content changed, False if it didn't and None if it couldn't be checked.
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> changed = self.wait_content_change(content, timeout=1)
+        """
+        try:
+            result = self.driver.execute_async_script(browser_scripts.WAIT_CONTENT_CHANGE, content, element() if element and scope else None, scope, int(timeout * 1000))
+            return result["changed"] if result else None
+        except WebDriverException as e:
+            logger().debug(f"Warning wait_content_change exception: {str(e)}")
+            return None
 
     def get_soup_select(self, selector):
         """
@@ -7322,6 +8077,168 @@ class WebappInternal(Base):
 
         return grid.select('tbody tr')
 
+    def get_grid_data(self, grid_number=1, grid_element=None, fields=None, records=False):
+        """
+        [Internal]
+
+        Returns the headers and all rendered rows of a grid, read with a single script call.
+
+        If *fields* is informed, the columns whose header is the SX3 title of one of the fields
+        are cast by the SX3 type: N to float, D to date and C to str. Values that can't be cast are kept as text.
+
+        :param grid_number: The number of the grid on the screen. - **Default:** 1
+        :type grid_number: int
+        :param grid_element: Grid class name in HTML ex: ".tgrid". - **Default:** None
+        :type grid_element: str
+        :param fields: SX3 fields of the columns that must be cast. - **Default:** None
+        :type fields: List of str
+        :param records: Returns a list of dicts (header: value) instead of a DataFrame. - **Default:** False
+        :type records: bool
+
+        :return: The grid data.
+        :rtype: pandas.DataFrame or List of Dict
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> data = self.get_grid_data(1, fields=["C6_PRODUTO", "C6_QTDVEN"])
+        """
+        self.wait_element(term=".tgetdados tbody tr, .tgrid tbody tr, .tcbrowse",
+                          scrap_type=enum.ScrapType.CSS_SELECTOR)
+
+        endtime = time.time() + self.config.time_out
+        data = None
+        while(time.time() < endtime and not data):
+            grid = self.get_grid(grid_number - 1, grid_element)
+            data = self.driver.execute_script(browser_scripts.GRID_DATA, self.soup_handle(grid))
+            if not data:
+                time.sleep(0.1)
+
+        if not data:
+            self.log_error("Couldn't find grid.")
+
+        headers = data["headers"]
+        rows = list(map(lambda x: (x + [""] * len(headers))[:len(headers)], data["rows"]))
+
+        if fields:
+            field_to_type, _, field_to_label = self.get_x3_dictionaries(fields)
+            title_to_type = {str(field_to_label.get(field)).lower(): field_to_type.get(field) for field in fields if field in field_to_type}
+            types = list(map(lambda x: title_to_type.get(x.lower()), headers))
+            rows = list(map(lambda row: list(map(lambda x: self.cast_grid_value(*x), zip(row, types))), rows))
+
+        if records:
+            return list(map(lambda x: dict(zip(headers, x)), rows))
+
+        return pd.DataFrame(rows, columns=headers)
+
+    def cast_grid_value(self, value, value_type):
+        """
+        [Internal]
+
+        Casts the text of a grid cell by its SX3 type. Returns the text itself if it can't be cast.
+
+        :param value: The text of the cell.
+        :type value: str
+        :param value_type: The SX3 type: "N", "D", "C" or None.
+        :type value_type: str
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> self.cast_grid_value("1.234,50", "N")
+        1234.5
+        """
+        if value_type in ("N", "D") and not value:
+            return None
+
+        try:
+            if value_type == "N":
+                if self.config.language == "en-us":
+                    return float(value.replace(",", ""))
+                return float(value.replace(".", "").replace(",", "."))
+            elif value_type == "D":
+                date_format = "%m/%d/%Y" if self.config.language == "en-us" else "%d/%m/%Y"
+                return datetime.strptime(value, date_format).date()
+        except ValueError:
+            return value
+
+        return value
+
+    def iter_grid(self, grid_number=1, columns=None, grid_element=None, window=1000):
+        """
+        [Internal]
+
+        Yields every row of a grid, scrolling it page by page with PAGE_DOWN until its content stops changing.
+
+        Each page is read with a single script call and only the rows not yielded yet are yielded, as dicts
+        (header: value). The rows already yielded are remembered by their id (or their texts) in a window of
+        the last *window* rows, so the memory used doesn't grow with the grid.
+
+        :param grid_number: The number of the grid on the screen. - **Default:** 1
+        :type grid_number: int
+        :param columns: Headers (or SX3 fields) of the columns to be yielded. - **Default:** None (all columns)
+        :type columns: List of str
+        :param grid_element: Grid class name in HTML ex: ".tgrid". - **Default:** None
+        :type grid_element: str
+        :param window: Amount of rows remembered to skip the repeated ones. - **Default:** 1000
+        :type window: int
+
+        :return: Generator of the rows.
+        :rtype: Generator of Dict
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> for row in self.iter_grid(1, columns=["Filial", "A1_COD"]):
+        >>>     print(row)
+        """
+        grid = self.get_grid(grid_number - 1, grid_element)
+        handle = self.soup_handle(grid)
+        scope = ".tgetdados,.tgrid,.tcbrowse,.tmsselbr"
+
+        if columns:
+            fields = list(filter(lambda x: "_" in x, columns))
+            field_to_label = self.get_x3_dictionaries(fields)[2] if fields else {}
+            columns = list(map(lambda x: str(field_to_label.get(x, x)).lower(), columns))
+
+        row = next(iter(grid.select("tbody tr.selected-row")), None) or next(iter(grid.select("tbody tr")), None)
+        td = next(iter(row.select("td")), None) if row else None
+        if td:
+            self.click_grid_td(td)
+
+        seen = deque()
+        seen_keys = set()
+        pages_without_rows = 0
+
+        while(pages_without_rows < 2):
+            page = self.driver.execute_script(browser_scripts.GRID_PAGE, handle)
+            if not page:
+                self.log_error("Couldn't find grid.")
+
+            headers = page["headers"]
+            indexes = list(map(lambda x: x[0], filter(lambda x: not columns or x[1].lower() in columns, enumerate(headers))))
+
+            new_rows = 0
+            for page_row in page["rows"]:
+                key = page_row["id"] or tuple(page_row["cells"])
+                if key in seen_keys:
+                    continue
+
+                seen.append(key)
+                seen_keys.add(key)
+                if len(seen) > window:
+                    seen_keys.discard(seen.popleft())
+
+                new_rows += 1
+                cells = page_row["cells"]
+                yield {headers[index]: cells[index] if index < len(cells) else "" for index in indexes}
+
+            pages_without_rows = 0 if new_rows else pages_without_rows + 1
+
+            ActionChains(self.driver).key_down(Keys.PAGE_DOWN).perform()
+            if self.wait_content_change(page["hash"], lambda: page["grid"], scope, timeout=self.config.time_out) is False:
+                break
+
     def LengthGridLines(self, grid):
         """
         Returns the length of the grid.